@@ -10,7 +10,7 @@ import json
 import asyncio
 import traceback
 import logging
-from collections.abc import Sequence
+from collections.abc import Coroutine, Sequence
 from datetime import datetime
 from pathlib import Path
 from typing import Any, Optional
@@ -32,6 +32,28 @@ from sendDetections.errors import (
 # Set up logger
 logger = logging.getLogger("sendDetections")
 
+def _run(main: Coroutine[Any, Any, int]) -> int:
+    """
+    Run a coroutine on uvloop's event loop when it is installed.
+    
+    uvloop is optional and not available on Windows; asyncio's default loop
+    is used when it can't be imported.
+    
+    Args:
+        main: Coroutine to run to completion
+        
+    Returns:
+        The coroutine's result
+    """
+    if sys.platform != "win32":
+        try:
+            import uvloop
+        except ImportError:
+            pass
+        else:
+            return uvloop.run(main)
+    return asyncio.run(main)
+
 def setup_argparse():
     """
     Set up command-line argument parsing.
@@ -266,63 +288,65 @@ async def handle_submit_command(args) -> int:
             export_dir = args.export_dir
             results_exporter = ResultExporter(export_dir=export_dir)
         
-        # Process JSON files
-        if json_files:
-            logger.info("Processing %d JSON files", len(json_files))
-            json_result = await processor.process_files(
-                json_files, 
-                debug=args.debug,
-                export_metrics=args.export_metrics,
-                metrics_file=metrics_file and metrics_file.with_suffix('.json_metrics.json')
-            )
+        # One connection pool serves both the JSON and CSV submissions
+        async with processor:
+            # Process JSON files
+            if json_files:
+                logger.info("Processing %d JSON files", len(json_files))
+                json_result = await processor.process_files(
+                    json_files, 
+                    debug=args.debug,
+                    export_metrics=args.export_metrics,
+                    metrics_file=metrics_file and metrics_file.with_suffix('.json_metrics.json')
+                )
             
-            if "summary" in json_result:
-                summary = json_result["summary"]
-                total_submitted += summary.get("submitted", 0)
-                total_processed += summary.get("processed", 0)
-                total_dropped += summary.get("dropped", 0)
+                if "summary" in json_result:
+                    summary = json_result["summary"]
+                    total_submitted += summary.get("submitted", 0)
+                    total_processed += summary.get("processed", 0)
+                    total_dropped += summary.get("dropped", 0)
                 
-                logger.info("JSON files: %d submitted, %d processed, %d dropped",
-                           summary.get("submitted", 0),
-                           summary.get("processed", 0),
-                           summary.get("dropped", 0))
+                    logger.info("JSON files: %d submitted, %d processed, %d dropped",
+                               summary.get("submitted", 0),
+                               summary.get("processed", 0),
+                               summary.get("dropped", 0))
                            
-                # Add to results collection
-                all_results.append(json_result)
+                    # Add to results collection
+                    all_results.append(json_result)
                 
-                # Record any errors for analysis
-                if args.analyze_errors and "errors" in json_result:
-                    for error in json_result.get("errors", []):
-                        error_collection.add_error(error, {"source": "json_processing"})
+                    # Record any errors for analysis
+                    if args.analyze_errors and "errors" in json_result:
+                        for error in json_result.get("errors", []):
+                            error_collection.add_error(error, {"source": "json_processing"})
         
-        # Process CSV files
-        if csv_files:
-            logger.info("Processing %d CSV files", len(csv_files))
-            csv_result = await processor.process_csv_files(
-                csv_files, 
-                debug=args.debug,
-                export_metrics=args.export_metrics,
-                metrics_file=metrics_file and metrics_file.with_suffix('.csv_metrics.json')
-            )
+            # Process CSV files
+            if csv_files:
+                logger.info("Processing %d CSV files", len(csv_files))
+                csv_result = await processor.process_csv_files(
+                    csv_files, 
+                    debug=args.debug,
+                    export_metrics=args.export_metrics,
+                    metrics_file=metrics_file and metrics_file.with_suffix('.csv_metrics.json')
+                )
             
-            if "summary" in csv_result:
-                summary = csv_result["summary"]
-                total_submitted += summary.get("submitted", 0)
-                total_processed += summary.get("processed", 0)
-                total_dropped += summary.get("dropped", 0)
+                if "summary" in csv_result:
+                    summary = csv_result["summary"]
+                    total_submitted += summary.get("submitted", 0)
+                    total_processed += summary.get("processed", 0)
+                    total_dropped += summary.get("dropped", 0)
                 
-                logger.info("CSV files: %d submitted, %d processed, %d dropped",
-                           summary.get("submitted", 0),
-                           summary.get("processed", 0),
-                           summary.get("dropped", 0))
+                    logger.info("CSV files: %d submitted, %d processed, %d dropped",
+                               summary.get("submitted", 0),
+                               summary.get("processed", 0),
+                               summary.get("dropped", 0))
                            
-                # Add to results collection
-                all_results.append(csv_result)
+                    # Add to results collection
+                    all_results.append(csv_result)
                 
-                # Record any errors for analysis
-                if args.analyze_errors and "errors" in csv_result:
-                    for error in csv_result.get("errors", []):
-                        error_collection.add_error(error, {"source": "csv_processing"})
+                    # Record any errors for analysis
+                    if args.analyze_errors and "errors" in csv_result:
+                        for error in csv_result.get("errors", []):
+                            error_collection.add_error(error, {"source": "csv_processing"})
         
         # Total summary
         logger.info("Total: %d submitted, %d processed, %d dropped",
@@ -452,7 +476,7 @@ def main() -> int:
     
     try:
         # Default behavior is to process files
-        return asyncio.run(handle_submit_command(args))
+        return _run(handle_submit_command(args))
             
     except KeyboardInterrupt:
         logger.info("Operation cancelled by user")
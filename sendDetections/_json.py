@@ -0,0 +1,56 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Internal JSON helpers shared by the package.
+Uses orjson for faster serialization when it is installed and falls back to
+the standard json module otherwise.
+"""
+
+import json
+from typing import Any, Union
+
+# Try to import orjson for faster serialization, but make it optional
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+def dumps(data: Any, indent: bool = False) -> bytes:
+    """
+    Serialize data to UTF-8 encoded JSON bytes.
+    
+    Args:
+        data: Data to serialize
+        indent: Whether to indent the output by two spaces
+    
+    Returns:
+        Encoded JSON document
+    """
+    if ORJSON_AVAILABLE:
+        option = orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(data, option=option)
+    return json.dumps(data, indent=2 if indent else None, ensure_ascii=False).encode("utf-8")
+
+
+def loads(data: Union[bytes, str]) -> Any:
+    """
+    Parse a JSON document.
+    
+    Args:
+        data: JSON text or UTF-8 encoded bytes
+    
+    Returns:
+        Decoded JSON value
+    
+    Raises:
+        json.JSONDecodeError: If data is not valid JSON; orjson's decode
+            error is a subclass, so callers handle both the same way
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
@@ -15,18 +15,12 @@ import requests
 from pydantic import ValidationError
 
 from sendDetections.config import API_URL, DEFAULT_HEADERS, DEFAULT_API_OPTIONS
+from sendDetections.errors import ApiError
 from sendDetections.validators import validate_payload, ApiPayload
 
 # Configure logger
 logger = logging.getLogger(__name__)
 
-class ApiError(Exception):
-    """API-related error with status code and message."""
-    def __init__(self, message: str, status_code: Optional[int] = None):
-        self.message = message
-        self.status_code = status_code
-        super().__init__(self.message)
-
 
 class DetectionApiClient:
     """
@@ -135,9 +129,9 @@ class DetectionApiClient:
         except requests.exceptions.ConnectionError as e:
             message = f"Cannot connect to API server: {e}"
             logger.error(message)
-            raise ApiError(message)
+            raise ApiError(message, status_code=None)
             
         except Exception as e:
             message = f"Unexpected error: {e}"
             logger.error(message)
-            raise ApiError(message)
\ No newline at end of file
+            raise ApiError(message, status_code=None)
\ No newline at end of file
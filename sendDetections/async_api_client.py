@@ -8,14 +8,18 @@ Uses Python 3.10+ type annotations.
 """
 
 import asyncio
+import json
 import logging
+import random
 import time
+import uuid
 from typing import Any, Optional, cast
 from collections.abc import Mapping, Sequence
 
 import aiohttp
 from pydantic import ValidationError
 
+from sendDetections import _json
 from sendDetections.config import API_URL, DEFAULT_HEADERS, DEFAULT_API_OPTIONS
 from sendDetections.validators import validate_payload, ApiPayload
 from sendDetections.errors import (
@@ -27,6 +31,277 @@ from sendDetections.errors import (
 # Configure logger
 logger = logging.getLogger(__name__)
 
+# Default cap on the exponential retry delay and on server-sent Retry-After
+_MAX_RETRY_DELAY = 30.0
+
+# Default jitter: retry delays vary randomly by up to +/-50%
+_RETRY_JITTER = 0.5
+
+# Largest request the auto-batcher builds, matching the default batch size
+_AUTO_BATCH_MAX_ENTRIES = 100
+
+# A queued payload and the future its caller awaits
+_Waiter = tuple[Mapping[str, Any], "asyncio.Future[dict[str, Any]]"]
+
+
+def _encode_payload(payload: Mapping[str, Any]) -> bytes:
+    """
+    Serialize a request payload to a UTF-8 JSON body.
+    
+    Args:
+        payload: The payload to serialize
+        
+    Returns:
+        JSON-encoded bytes
+    """
+    return _json.dumps(payload)
+
+
+def _decode_response(body: bytes) -> Any:
+    """
+    Parse a JSON response body.
+    
+    Args:
+        body: Raw response bytes
+        
+    Returns:
+        Decoded JSON value
+        
+    Raises:
+        ValueError: If the body is not valid JSON
+    """
+    return _json.loads(body)
+
+
+def _merge_summaries(results: Sequence[Mapping[str, Any]]) -> dict[str, Any]:
+    """
+    Merge batch responses into one result, summing every count in their summaries.
+    
+    Args:
+        results: API responses, one per batch
+        
+    Returns:
+        Result dict with the combined summary
+    """
+    submitted = processed = dropped = 0
+    # Any other counts the API reports, summed the same way
+    extra: dict[str, int] = {}
+    
+    # Responses to one merged request share a summary; count it once
+    seen: set[str] = set()
+    for result in results:
+        summary = _summary_once(result, seen)
+        if not summary:
+            continue
+        submitted += summary.get("submitted", 0)
+        processed += summary.get("processed", 0)
+        dropped += summary.get("dropped", 0)
+        for key, value in summary.items():
+            if (key not in ("submitted", "processed", "dropped")
+                    and isinstance(value, int) and not isinstance(value, bool)):
+                extra[key] = extra.get(key, 0) + value
+    
+    merged_result: dict[str, Any] = {
+        "summary": {"submitted": submitted, "processed": processed, "dropped": dropped, **extra}
+    }
+    
+    logger.info("Completed batch processing: %d submitted, %d processed, %d dropped",
+               merged_result["summary"]["submitted"],
+               merged_result["summary"]["processed"],
+               merged_result["summary"]["dropped"])
+    
+    return merged_result
+
+
+class _AdmissionController:
+    """
+    Limit on concurrent requests that can be resized while requests are in flight.
+    
+    Unlike asyncio.Semaphore, raising the limit admits waiting requests at
+    once, and lowering it holds new requests back until enough in-flight
+    ones finish.
+    """
+    
+    def __init__(self, limit: int):
+        self.limit = limit
+        self.active = 0
+        self._cond = asyncio.Condition()
+    
+    async def acquire(self) -> None:
+        """Wait until fewer than limit requests are active, then admit one."""
+        async with self._cond:
+            try:
+                await self._cond.wait_for(lambda: self.active < self.limit)
+            except asyncio.CancelledError:
+                # Pass on a wakeup this waiter may have consumed
+                self._cond.notify(1)
+                raise
+            self.active += 1
+    
+    async def release(self) -> None:
+        """Release an admitted request and wake the next waiter."""
+        self.active -= 1
+        # Shielded so a cancelled caller cannot lose the wakeup
+        await asyncio.shield(self._notify(1))
+    
+    async def set_limit(self, limit: int) -> None:
+        """
+        Change the concurrency limit.
+        
+        Args:
+            limit: New maximum number of active requests
+        """
+        self.limit = limit
+        await self._notify()
+    
+    async def _notify(self, n: Optional[int] = None) -> None:
+        async with self._cond:
+            if n is None:
+                self._cond.notify_all()
+            else:
+                self._cond.notify(n)
+    
+    async def __aenter__(self) -> None:
+        await self.acquire()
+    
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.release()
+
+
+def _shared_response(result: Mapping[str, Any], callers: int, request_id: str) -> dict[str, Any]:
+    """
+    Build one caller's copy of the response to a merged request.
+    
+    The API only reports counts for the request as a whole, so a response
+    shared by several callers is marked with "shared": request_id; the
+    summary then covers every caller's entries, not just this caller's.
+    
+    Args:
+        result: API response to the merged request
+        callers: Number of payloads merged into the request
+        request_id: Identifier of the merged request
+        
+    Returns:
+        Response dict owned by a single caller
+    """
+    response = dict(result)
+    summary = response.get("summary")
+    if isinstance(summary, Mapping):
+        response["summary"] = dict(summary)
+    if callers > 1:
+        response["shared"] = request_id
+    return response
+
+
+def _summary_once(result: Mapping[str, Any], seen: set[str]) -> Mapping[str, Any]:
+    """
+    Get a response's summary for aggregation, counting shared summaries once.
+    
+    Args:
+        result: API response, possibly a copy of a shared merged response
+        seen: Ids of merged requests already counted; updated in place
+        
+    Returns:
+        The summary, or an empty mapping if its merged request was already counted
+    """
+    shared = result.get("shared")
+    if shared is not None:
+        if shared in seen:
+            return {}
+        seen.add(shared)
+    return result.get("summary") or {}
+
+
+class _AutoBatcher:
+    """
+    Coalesces concurrent sends into fewer, larger requests.
+    
+    Payloads submitted within max_wait of each other that share the same
+    options and organization_ids are merged into one request, up to
+    max_entries entries. Each caller gets a copy of the merged response,
+    marked as shared when it covers more than one payload.
+    """
+    
+    def __init__(self, client: "AsyncApiClient", max_wait: float, max_entries: int = _AUTO_BATCH_MAX_ENTRIES):
+        self._client = client
+        self.max_wait = max_wait
+        self.max_entries = max_entries
+        # Open group per (options, organization_ids, retry): queued payloads,
+        # their entry count and the timer that flushes them
+        self._groups: dict[tuple[str, str, bool], tuple[list[_Waiter], int, asyncio.TimerHandle]] = {}
+        self._tasks: set[asyncio.Task[None]] = set()
+    
+    async def submit(self, payload: Mapping[str, Any], retry: bool = True) -> dict[str, Any]:
+        """
+        Queue a validated payload, with options applied, for the next merged request.
+        
+        Args:
+            payload: The payload to send
+            retry: Whether to retry on retryable errors
+            
+        Returns:
+            The API response to the request this payload was sent in
+        """
+        size = len(payload["data"])
+        if size >= self.max_entries:
+            # Already a full request on its own
+            return await self._client._post(payload, retry)
+        
+        key = (
+            json.dumps(payload.get("options"), sort_keys=True),
+            json.dumps(payload.get("organization_ids")),
+            retry
+        )
+        if key in self._groups and self._groups[key][1] + size > self.max_entries:
+            self._flush(key)
+        
+        loop = asyncio.get_running_loop()
+        future: asyncio.Future[dict[str, Any]] = loop.create_future()
+        if key in self._groups:
+            items, count, timer = self._groups[key]
+            items.append((payload, future))
+            self._groups[key] = (items, count + size, timer)
+        else:
+            timer = loop.call_later(self.max_wait, self._flush, key)
+            self._groups[key] = ([(payload, future)], size, timer)
+        
+        if self._groups[key][1] >= self.max_entries:
+            self._flush(key)
+        return await future
+    
+    def _flush(self, key: tuple[str, str, bool]) -> None:
+        """Send the open group for key, if any, in the background."""
+        group = self._groups.pop(key, None)
+        if group is None:
+            return
+        items, _, timer = group
+        timer.cancel()
+        task = asyncio.ensure_future(self._send(items, key[2]))
+        # Hold a reference until the request completes
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+    
+    async def _send(self, items: list[_Waiter], retry: bool) -> None:
+        """Send one merged request and resolve each caller's future."""
+        payloads = [payload for payload, _ in items]
+        merged = {**payloads[0], "data": [entry for payload in payloads for entry in payload["data"]]}
+        logger.debug("Auto-batching %d payload(s) into one request of %d entries",
+                     len(payloads), len(merged["data"]))
+        
+        try:
+            result = await self._client._post(merged, retry)
+        except Exception as e:
+            for _, future in items:
+                if not future.done():
+                    future.set_exception(e)
+            return
+        
+        request_id = uuid.uuid4().hex
+        for _, future in items:
+            if not future.done():
+                future.set_result(_shared_response(result, len(items), request_id))
+
+
 class AsyncApiClient:
     """
     Asynchronous client for sending data to Recorded Future Collective Insights Detection API.
@@ -41,7 +316,11 @@ class AsyncApiClient:
         retry_delay: float = 1.0,
         timeout: float = 30.0,
         retry_status_codes: Optional[list[int]] = None,
-        max_concurrent: int = 5
+        max_concurrent: int = 5,
+        auto_batch: bool = False,
+        max_wait_ms: float = 10.0,
+        max_backoff: float = _MAX_RETRY_DELAY,
+        jitter: float = _RETRY_JITTER
     ):
         """
         Initialize the async API client.
@@ -54,29 +333,92 @@ class AsyncApiClient:
             timeout: Request timeout in seconds
             retry_status_codes: HTTP status codes to retry (defaults to [429, 500, 502, 503, 504])
             max_concurrent: Maximum number of concurrent requests
+            auto_batch: Whether to merge concurrent send_data calls into shared requests;
+                responses to merged requests carry "shared" with the request's id
+            max_wait_ms: How long, in milliseconds, auto-batching waits for more payloads
+            max_backoff: Cap in seconds on the exponential retry delay and on Retry-After
+            jitter: Fraction by which each retry delay varies randomly, up or down
         """
         self.api_token = api_token
         self.api_url = api_url or API_URL
         self.headers = {**DEFAULT_HEADERS, "X-RFToken": api_token}
         self.max_retries = max_retries
         self.retry_delay = retry_delay
+        self.max_backoff = max_backoff
+        self.jitter = jitter
         self.timeout = timeout
         self.max_concurrent = max_concurrent
         
         # Default to common retryable status codes if none specified
         self.retry_status_codes = retry_status_codes or [429, 500, 502, 503, 504]
         
-        # Semaphore to limit concurrent requests
-        self._semaphore: Optional[asyncio.Semaphore] = None
+        # Admission controller to limit concurrent requests
+        self._admission: Optional[_AdmissionController] = None
+        
+        # Shared HTTP session, created on first request and reused for keep-alive
+        self._session: Optional[aiohttp.ClientSession] = None
+        
+        # Opt-in coalescing of concurrent sends, created on first use
+        self.auto_batch = auto_batch
+        self.max_wait_ms = max_wait_ms
+        self._batcher: Optional[_AutoBatcher] = None
         
         logger.debug("AsyncApiClient initialized with URL: %s", self.api_url)
     
-    @staticmethod
-    def validate_payload(payload: Mapping[str, Any]) -> Optional[str]:
+    async def __aenter__(self) -> "AsyncApiClient":
+        return self
+    
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.close()
+    
+    async def _get_session(self) -> aiohttp.ClientSession:
         """
-        Validate a payload dict. Returns an error message if invalid, else None.
+        Get the shared HTTP session, creating it if needed.
+        
+        Returns:
+            Open ClientSession with a connection pool sized for max_concurrent
         """
-        return validate_payload(payload)
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    limit=self.max_concurrent * 2,
+                    limit_per_host=self.max_concurrent,
+                    ttl_dns_cache=300,
+                    keepalive_timeout=75
+                ),
+                timeout=aiohttp.ClientTimeout(total=self.timeout)
+            )
+        return self._session
+    
+    async def close(self) -> None:
+        """
+        Close the shared HTTP session. A later request opens a new one.
+        """
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+    
+    # Alias for contextlib.aclosing() and other aclose()-based helpers
+    aclose = close
+    
+    async def set_max_concurrent(self, max_concurrent: int) -> None:
+        """
+        Change the concurrency limit, including for requests already waiting.
+        
+        The connection pool keeps the size it was opened with until the
+        session is closed.
+        
+        Args:
+            max_concurrent: New maximum number of concurrent requests
+        """
+        self.max_concurrent = max_concurrent
+        if self._admission is not None:
+            await self._admission.set_limit(max_concurrent)
+    
+    # Validate a payload dict. Returns an error message if invalid, else None.
+    # Bound directly to the module-level function, whose schema validator is
+    # built once at import, so calls skip an extra wrapper frame.
+    validate_payload = staticmethod(validate_payload)
 
     def add_default_options(self, payload: Mapping[str, Any], debug: bool = False) -> dict[str, Any]:
         """
@@ -89,20 +431,32 @@ class AsyncApiClient:
         Returns:
             Updated payload with options
         """
-        # Make a copy to avoid modifying the original
-        result = dict(payload)
-        
         # Apply DEFAULT_API_OPTIONS if options not present
-        if "options" not in result:
-            result["options"] = DEFAULT_API_OPTIONS.copy()
-            
+        options = payload.get("options")
+        if options is None:
+            options = DEFAULT_API_OPTIONS
+        
         # Override debug flag if specified
         if debug:
-            if "options" not in result:
-                result["options"] = {}
-            result["options"]["debug"] = True
+            options = {**options, "debug": True}
             
-        return result
+        # Shallow copy: only options change, so the data list is shared
+        # and the caller's options dict is never modified
+        return {**payload, "options": dict(options)}
+    
+    def _backoff_delay(self, attempt: int) -> float:
+        """
+        Get the delay before a retry attempt.
+        
+        Args:
+            attempt: Number of attempts made so far (0 for the first retry)
+            
+        Returns:
+            Exponential backoff capped at max_backoff, then varied by +/-jitter
+            so that clients retrying together spread out
+        """
+        delay = min(self.max_backoff, self.retry_delay * (2 ** attempt))
+        return delay * (1 + random.uniform(-self.jitter, self.jitter))
     
     async def _handle_http_error(self, status_code: int, response_text: str, response_headers: Mapping[str, str]) -> None:
         """
@@ -123,7 +477,6 @@ class AsyncApiClient:
         # Try to parse error JSON
         error_data = {}
         try:
-            import json
             error_data = json.loads(response_text)
             error_msg = error_data.get("message", response_text)
         except (ValueError, KeyError):
@@ -164,7 +517,8 @@ class AsyncApiClient:
         self, 
         payload: Mapping[str, Any], 
         debug: bool = False, 
-        retry: bool = True
+        retry: bool = True,
+        validate: bool = True
     ) -> dict[str, Any]:
         """
         Send data to the API with automatic retries for certain errors.
@@ -173,6 +527,8 @@ class AsyncApiClient:
             payload: The data payload to send
             debug: Whether to enable debug mode
             retry: Whether to retry on retryable errors
+            validate: Whether to validate the payload; callers that already
+                validated it may pass False to skip a second pass
             
         Returns:
             API response as a dictionary
@@ -188,72 +544,120 @@ class AsyncApiClient:
             ApiTimeoutError: On request timeout
         """
         # Pre-send validation
-        if (error := validate_payload(payload)):
+        if validate and (error := validate_payload(payload)):
             raise PayloadValidationError(f"Payload validation failed: {error}")
 
         # Apply default options and debug flag
         payload_dict = self.add_default_options(payload, debug)
         
+        if self.auto_batch:
+            if self._batcher is None:
+                self._batcher = _AutoBatcher(self, self.max_wait_ms / 1000)
+            return await self._batcher.submit(payload_dict, retry)
+        
+        return await self._post(payload_dict, retry)
+    
+    async def _post(self, payload_dict: Mapping[str, Any], retry: bool = True) -> dict[str, Any]:
+        """
+        Send an already validated payload, with options applied, to the API.
+        
+        Args:
+            payload_dict: The payload to send as-is
+            retry: Whether to retry on retryable errors
+            
+        Returns:
+            API response as a dictionary
+        """
         # For readable logging, show count of IOCs
         ioc_count = len(payload_dict.get("data", []))
         logger.info("Sending %d detection(s) to %s (debug=%s)", 
                    ioc_count, self.api_url, payload_dict.get("options", {}).get("debug", False))
         
+        # Serialize once; retries resend the same body under the same
+        # idempotency key so the API can drop duplicate deliveries. The key
+        # is random, so separate submissions of identical content stay distinct
+        body = _encode_payload(payload_dict)
+        headers = {**self.headers, "Idempotency-Key": uuid.uuid4().hex}
+        
         # Initialize retry counter and track attempts
         attempts = 0
         last_error = None
         
-        # Create the semaphore if it doesn't exist
-        if self._semaphore is None:
-            self._semaphore = asyncio.Semaphore(self.max_concurrent)
+        # Create the admission controller if it doesn't exist
+        if self._admission is None:
+            self._admission = _AdmissionController(self.max_concurrent)
         
-        # Acquire semaphore to limit concurrent requests
-        async with self._semaphore:
-            # Set timeout for the request
-            timeout = aiohttp.ClientTimeout(total=self.timeout)
-            
+        # Wait for a free slot to limit concurrent requests
+        async with self._admission:
             while attempts <= self.max_retries:
-                # Create a new ClientSession for each attempt
-                # This ensures we don't reuse connections that might be problematic
                 try:
                     # Only log retry attempts after the first attempt
                     if attempts > 0:
                         logger.info("Retry attempt %d of %d", attempts, self.max_retries)
                     
-                    async with aiohttp.ClientSession(timeout=timeout) as session:
-                        async with session.post(
-                            self.api_url,
-                            headers=self.headers,
-                            json=payload_dict
-                        ) as response:
-                            # Check for HTTP errors
-                            if response.status >= 400:
-                                text = await response.text()
-                                await self._handle_http_error(
-                                    response.status, 
-                                    text, 
-                                    response.headers
-                                )
+                    # Pooled keep-alive connections are reused across requests
+                    session = await self._get_session()
+                    async with session.post(
+                        self.api_url,
+                        headers=headers,
+                        data=body
+                    ) as response:
+                        # Check for HTTP errors
+                        if response.status >= 400:
+                            text = await response.text()
+                            await self._handle_http_error(
+                                response.status, 
+                                text, 
+                                response.headers
+                            )
                             
-                            # Attempt to parse response as JSON
-                            try:
-                                result = await response.json()
+                        # Attempt to parse response as JSON
+                        try:
+                            result = _decode_response(await response.read())
                                 
-                                # Log success with summary if available
-                                if "summary" in result:
-                                    summary = result["summary"]
-                                    logger.info("API call successful: %d submitted, %d processed, %d dropped",
-                                              summary.get("submitted", 0), 
-                                              summary.get("processed", 0),
-                                              summary.get("dropped", 0))
-                                else:
-                                    logger.info("API call successful")
+                            # Log success with summary if available
+                            if "summary" in result:
+                                summary = result["summary"]
+                                logger.info("API call successful: %d submitted, %d processed, %d dropped",
+                                          summary.get("submitted", 0), 
+                                          summary.get("processed", 0),
+                                          summary.get("dropped", 0))
+                            else:
+                                logger.info("API call successful")
                                     
-                                return cast(dict[str, Any], result)
-                            except ValueError as e:
-                                logger.warning("Could not parse API response as JSON: %s", str(e))
-                                # Return empty dict if we can't parse the response
-                                return {}
+                            return cast(dict[str, Any], result)
+                        except ValueError as e:
+                            logger.warning("Could not parse API response as JSON: %s", str(e))
+                            # Return empty dict if we can't parse the response
+                            return {}
+                
+                except ApiRateLimitError as e:
+                    last_error = e
+                    if retry and e.status_code in self.retry_status_codes and attempts < self.max_retries:
+                        # Never retry sooner than the server's Retry-After,
+                        # itself capped at max_backoff
+                        delay = self._backoff_delay(attempts)
+                        if e.retry_after:
+                            delay = max(delay, min(float(e.retry_after), self.max_backoff))
+                        logger.info("Rate limited. Waiting %.1f seconds before retry.", delay)
+                        await asyncio.sleep(delay)
+                        attempts += 1
+                        continue
+                    raise
+                
+                except ApiServerError as e:
+                    last_error = e
+                    if retry and e.status_code in self.retry_status_codes and attempts < self.max_retries:
+                        delay = self._backoff_delay(attempts)
+                        logger.info("Retryable error (status=%d). Waiting %.1f seconds", e.status_code, delay)
+                        await asyncio.sleep(delay)
+                        attempts += 1
+                        continue
+                    raise
+                
+                except ApiError:
+                    # Authentication, access and other client errors won't succeed on retry
+                    raise
                 
                 except aiohttp.ClientResponseError as e:
                     last_error = e
@@ -264,17 +668,20 @@ class AsyncApiClient:
                         # For rate limit errors, use the Retry-After header if available
                         if status_code == 429 and "Retry-After" in e.headers:
                             try:
-                                delay = int(e.headers["Retry-After"])
-                                logger.info("Rate limited. Waiting %d seconds before retry.", delay)
+                                delay = max(
+                                    self._backoff_delay(attempts),
+                                    min(int(e.headers["Retry-After"]), self.max_backoff)
+                                )
+                                logger.info("Rate limited. Waiting %.1f seconds before retry.", delay)
                                 await asyncio.sleep(delay)
                             except (ValueError, TypeError):
                                 # If Retry-After header is invalid, use exponential backoff
-                                delay = self.retry_delay * (2 ** attempts)
+                                delay = self._backoff_delay(attempts)
                                 logger.info("Rate limited. Using exponential backoff: waiting %.1f seconds", delay)
                                 await asyncio.sleep(delay)
                         else:
                             # Use exponential backoff for other retryable errors
-                            delay = self.retry_delay * (2 ** attempts)
+                            delay = self._backoff_delay(attempts)
                             logger.info("Retryable error (status=%d). Waiting %.1f seconds", status_code, delay)
                             await asyncio.sleep(delay)
                         
@@ -298,7 +705,7 @@ class AsyncApiClient:
                     logger.warning("Request timed out after %.1f seconds", self.timeout)
                     
                     if retry and attempts < self.max_retries:
-                        delay = self.retry_delay * (2 ** attempts)
+                        delay = self._backoff_delay(attempts)
                         logger.info("Retrying after timeout. Waiting %.1f seconds", delay)
                         await asyncio.sleep(delay)
                         attempts += 1
@@ -311,7 +718,7 @@ class AsyncApiClient:
                     logger.warning("Connection error: %s", str(e))
                     
                     if retry and attempts < self.max_retries:
-                        delay = self.retry_delay * (2 ** attempts)
+                        delay = self._backoff_delay(attempts)
                         logger.info("Retrying after connection error. Waiting %.1f seconds", delay)
                         await asyncio.sleep(delay)
                         attempts += 1
@@ -349,7 +756,8 @@ class AsyncApiClient:
         payloads: Sequence[Mapping[str, Any]], 
         debug: bool = False,
         retry: bool = True,
-        return_exceptions: bool = False
+        return_exceptions: bool = False,
+        validate: bool = True
     ) -> list[dict[str, Any] | Exception]:
         """
         Send multiple payloads concurrently.
@@ -359,6 +767,7 @@ class AsyncApiClient:
             debug: Whether to enable debug mode for all payloads
             retry: Whether to retry failed requests
             return_exceptions: If True, include exceptions in results instead of raising
+            validate: Whether send_data validates each payload
             
         Returns:
             List of API responses or exceptions if return_exceptions is True
@@ -369,20 +778,16 @@ class AsyncApiClient:
         if not payloads:
             return []
             
-        # Create tasks for each payload
+        # Create tasks for each payload; send_data holds an admission slot
+        # around each request, so at most max_concurrent are in flight
         tasks = [
-            self.send_data(payload, debug=debug, retry=retry)
+            self.send_data(payload, debug=debug, retry=retry, validate=validate)
             for payload in payloads
         ]
         
-        # Gather results, optionally capturing exceptions
-        if return_exceptions:
-            results = await asyncio.gather(*tasks, return_exceptions=True)
-            return results
-        else:
-            # This will raise the first exception encountered
-            results = await asyncio.gather(*tasks)
-            return results
+        # Gather results, optionally capturing exceptions; otherwise the
+        # first exception encountered is raised
+        return await asyncio.gather(*tasks, return_exceptions=return_exceptions)
 
     async def split_and_send(
         self, 
@@ -407,49 +812,28 @@ class AsyncApiClient:
             PayloadValidationError: On invalid payload structure
             ApiError or subclasses: On API errors
         """
-        # Validate the original payload
+        # Validate the original payload once; batches are slices of it and
+        # are not validated again. Like send_data, an empty data list is rejected
         if (error := validate_payload(payload)):
             raise PayloadValidationError(f"Payload validation failed: {error}")
+        data = payload["data"]
             
-        # Extract data entries
-        data = payload.get("data", [])
-        if not data:
-            # Nothing to send
-            return {"summary": {"submitted": 0, "processed": 0, "dropped": 0}}
-            
-        # Get a clean copy of the payload without data
-        base_payload = dict(payload)
-        base_payload.pop("data", None)
+        # Options are built once; they and organization_ids are shared by reference
+        base_payload = self.add_default_options(
+            {key: value for key, value in payload.items() if key != "data"}, debug
+        )
         
-        # Split data into batches
+        # Split data into batches, one slice per batch
         total_entries = len(data)
-        batches = []
-        
-        for i in range(0, total_entries, batch_size):
-            # Create a new payload with a subset of data
-            batch_payload = dict(base_payload)
-            batch_payload["data"] = data[i:i+batch_size]
-            batches.append(batch_payload)
+        batches = [
+            {**base_payload, "data": data[start:start + batch_size]}
+            for start in range(0, total_entries, batch_size)
+        ]
             
         # Send batches concurrently
         logger.info("Splitting payload with %d entries into %d batches of max %d entries",
                    total_entries, len(batches), batch_size)
                    
-        results = await self.batch_send(batches, debug=debug, retry=retry)
-        
-        # Merge results
-        merged_result: dict[str, Any] = {"summary": {"submitted": 0, "processed": 0, "dropped": 0}}
+        results = await self.batch_send(batches, debug=debug, retry=retry, validate=False)
         
-        for result in results:
-            if "summary" in result:
-                summary = result["summary"]
-                merged_result["summary"]["submitted"] += summary.get("submitted", 0)
-                merged_result["summary"]["processed"] += summary.get("processed", 0)
-                merged_result["summary"]["dropped"] += summary.get("dropped", 0)
-                
-        logger.info("Completed batch processing: %d submitted, %d processed, %d dropped",
-                   merged_result["summary"]["submitted"],
-                   merged_result["summary"]["processed"],
-                   merged_result["summary"]["dropped"])
-                   
-        return merged_result
\ No newline at end of file
+        return _merge_summaries(results)
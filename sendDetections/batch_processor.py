@@ -7,23 +7,31 @@ Provides efficient, concurrent processing of large detection datasets.
 """
 
 import asyncio
+import contextlib
 import json
 import logging
 import os
 import time
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Optional, Sequence, cast
+from typing import Any, AsyncIterator, Iterator, Optional, Sequence, cast
 from collections.abc import Mapping
 
-from tqdm import tqdm
-from tqdm.asyncio import tqdm_asyncio
+# Optional ijson support for streaming very large payload files
+try:
+    import ijson
+    IJSON_AVAILABLE = True
+except ImportError:
+    IJSON_AVAILABLE = False
 
-from sendDetections.async_api_client import AsyncApiClient
+from sendDetections import _json
+from sendDetections.async_api_client import AsyncApiClient, _summary_once
 from sendDetections.csv_converter import CSVConverter
 from sendDetections.errors import (
     ApiError, PayloadValidationError, CSVConversionError
 )
+from sendDetections.validators import validate_entries, validate_payload
+from sendDetections.validators_fast import validate_parsed_fast
 from sendDetections.performance import (
     PerformanceMetrics, process_with_progress, process_in_batches,
     async_measure_time
@@ -32,6 +40,82 @@ from sendDetections.performance import (
 # Configure logger
 logger = logging.getLogger(__name__)
 
+# Files larger than this are streamed by process_large_file when ijson is available
+_STREAM_THRESHOLD_BYTES = 64 * 1024 * 1024
+
+# Weight of the newest sample in the adaptive batch latency average
+_LATENCY_EMA_ALPHA = 0.3
+
+
+def _read_json(path: Path) -> Any:
+    """
+    Read and parse a JSON file.
+    
+    Args:
+        path: Path to the JSON file
+        
+    Returns:
+        Parsed JSON value
+        
+    Raises:
+        FileNotFoundError: If the file doesn't exist
+        json.JSONDecodeError: If the file contains invalid JSON
+    """
+    with open(path, "rb") as f:
+        return _json.loads(f.read())
+
+
+def _iter_values(f: Any, prefixes: Sequence[str]) -> Iterator[tuple[str, Any]]:
+    """
+    Yield every JSON value found at one of prefixes, in one pass over f.
+    
+    Args:
+        f: Binary file object positioned at the start of a JSON document
+        prefixes: ijson prefixes to collect, e.g. "options" or "data.item"
+        
+    Yields:
+        (prefix, value) pairs in document order
+    """
+    builder = None
+    current = ""
+    for prefix, event, value in ijson.parse(f, use_float=True):
+        if builder is not None:
+            builder.event(event, value)
+            if prefix == current and event in ("end_map", "end_array"):
+                yield current, builder.value
+                builder = None
+        elif prefix in prefixes:
+            if event in ("start_map", "start_array"):
+                builder = ijson.ObjectBuilder()
+                builder.event(event, value)
+                current = prefix
+            else:
+                yield prefix, value
+
+
+def _read_and_validate(path: Path) -> tuple[Any, Optional[str]]:
+    """
+    Read, parse and validate a JSON payload file.
+    
+    The file is parsed once; with msgspec installed the parsed payload is
+    checked with msgspec first, otherwise it is validated with Pydantic.
+    
+    Args:
+        path: Path to the JSON file
+        
+    Returns:
+        Tuple of (parsed payload, validation error message or None)
+        
+    Raises:
+        FileNotFoundError: If the file doesn't exist
+        json.JSONDecodeError: If the file contains invalid JSON
+    """
+    with open(path, "rb") as f:
+        raw = f.read()
+    payload = _json.loads(raw)
+    return payload, validate_parsed_fast(payload)
+
+
 class BatchProcessor:
     """
     Batch processor for efficiently handling large volumes of detections.
@@ -46,7 +130,11 @@ class BatchProcessor:
         batch_size: int = 100,
         max_retries: int = 3,
         show_progress: bool = True,
-        organization_id: Optional[str] = None
+        organization_id: Optional[str] = None,
+        adaptive: bool = False,
+        target_latency_ms: float = 1000.0,
+        min_batch_size: int = 10,
+        max_batch_size: int = 1000
     ):
         """
         Initialize the batch processor.
@@ -59,6 +147,10 @@ class BatchProcessor:
             max_retries: Maximum number of retry attempts for API errors
             show_progress: Whether to display progress bars
             organization_id: Optional organization ID to associate with detections
+            adaptive: Whether to tune batch_size for large payloads from measured latency
+            target_latency_ms: Per-batch latency the adaptive batch size aims for
+            min_batch_size: Smallest batch size adaptive tuning may choose
+            max_batch_size: Largest batch size adaptive tuning may choose
         """
         self.api_token = api_token
         self.api_url = api_url
@@ -67,6 +159,13 @@ class BatchProcessor:
         self.max_retries = max_retries
         self.show_progress = show_progress
         self.organization_id = organization_id
+        self.adaptive = adaptive
+        self.target_latency_ms = target_latency_ms
+        self.min_batch_size = min_batch_size
+        self.max_batch_size = max_batch_size
+        
+        # Moving average of per-batch latency in seconds, for adaptive batching
+        self._latency_ema = 0.0
         
         # Initialize the async API client
         self.client = AsyncApiClient(
@@ -79,11 +178,43 @@ class BatchProcessor:
         # Performance metrics
         self.metrics = PerformanceMetrics()
         
+        # Set while used as an async context manager: the client's connection
+        # pool then stays open across calls instead of closing after each one
+        self._keep_session = False
+        
         logger.debug(
             "BatchProcessor initialized with max_concurrent=%d, batch_size=%d",
             max_concurrent, batch_size
         )
     
+    async def __aenter__(self) -> "BatchProcessor":
+        self._keep_session = True
+        return self
+    
+    async def __aexit__(self, *exc_info: Any) -> None:
+        self._keep_session = False
+        await self.client.close()
+    
+    async def aclose(self) -> None:
+        """
+        Close the API client's connection pool.
+        """
+        await self.client.close()
+    
+    @contextlib.asynccontextmanager
+    async def _client_scope(self) -> AsyncIterator[None]:
+        """
+        Keep the client's session open for one processing call.
+        
+        The session is closed afterwards unless the processor itself is
+        being used as an async context manager.
+        """
+        if self._keep_session:
+            yield
+        else:
+            async with self.client:
+                yield
+    
     async def process_files(
         self, 
         file_paths: Sequence[Path], 
@@ -111,82 +242,95 @@ class BatchProcessor:
         if not file_paths:
             return {"summary": {"submitted": 0, "processed": 0, "dropped": 0}}
         
+        # tqdm is only needed once there is work to show progress for
+        from tqdm import tqdm
+        
         # Start measuring performance
         self.metrics = PerformanceMetrics()
         self.metrics.start()
         
-        # Load all payloads first to validate JSON
+        # Load all payloads first to validate JSON; files are read, parsed and
+        # validated concurrently in worker threads so the event loop is never blocked
+        load_bar = tqdm(total=len(file_paths), desc="Loading files", disable=not self.show_progress)
+        
+        async def load(path: Path) -> tuple[Any, Optional[str]]:
+            try:
+                return await asyncio.to_thread(_read_and_validate, path)
+            finally:
+                load_bar.update(1)
+        
+        try:
+            loaded = await asyncio.gather(*(load(path) for path in file_paths), return_exceptions=True)
+        finally:
+            load_bar.close()
+        
+        # Report the first failing file in input order
         payloads = []
+        validation_errors: list[Optional[str]] = []
         total_entities = 0
         
-        # Load files with progress bar if enabled
-        paths_iter = tqdm(file_paths, desc="Loading files", disable=not self.show_progress)
-        for path in paths_iter:
-            try:
-                with open(path, "r", encoding="utf-8") as f:
-                    payload = json.load(f)
-                    payloads.append(payload)
-                    entities_count = len(payload.get("data", []))
-                    total_entities += entities_count
-                    logger.debug("Loaded payload from %s with %d detections", 
-                               path, entities_count)
-            except FileNotFoundError:
+        for path, outcome in zip(file_paths, loaded):
+            if isinstance(outcome, FileNotFoundError):
                 logger.error("File not found: %s", path)
                 self.metrics.record_error("FileNotFoundError")
-                raise
-            except json.JSONDecodeError as e:
-                logger.error("Invalid JSON in file %s: %s", path, str(e))
+                raise outcome
+            if isinstance(outcome, json.JSONDecodeError):
+                logger.error("Invalid JSON in file %s: %s", path, str(outcome))
                 self.metrics.record_error("JSONDecodeError")
-                raise
+                raise outcome
+            if isinstance(outcome, BaseException):
+                raise outcome
+            
+            payload, validation_error = outcome
+            payloads.append(payload)
+            validation_errors.append(validation_error)
+            entities_count = len(payload.get("data", []))
+            total_entities += entities_count
+            logger.debug("Loaded payload from %s with %d detections", 
+                       path, entities_count)
         
         # Process all payloads concurrently
         logger.info("Processing %d payload files with %d total detections", 
                   len(payloads), total_entities)
         
         # Set up async processing with progress bar
-        async def process_payload(payload: dict[str, Any]) -> tuple[dict[str, Any], bool, float]:
-            try:
+        # Payloads are sent concurrently; admitting them here, at the client's
+        # limit, keeps time spent queued behind other files out of the latencies
+        admission = asyncio.Semaphore(self.client.max_concurrent)
+        
+        async def process_payload(
+            payload: dict[str, Any], validation_error: Optional[str]
+        ) -> tuple[dict[str, Any], bool, float]:
+            async with admission:
                 start_time = time.time()
-                
-                # Add organization_id to the payload if specified
-                if self.organization_id:
-                    payload_copy = dict(payload)
+                try:
+                    # Validated while loading, so send_data need not validate again
+                    if validation_error:
+                        raise PayloadValidationError(f"Payload validation failed: {validation_error}")
                     
-                    # Add organization_ids array if not present
-                    if "organization_ids" not in payload_copy:
-                        payload_copy["organization_ids"] = [self.organization_id]
-                    elif isinstance(payload_copy["organization_ids"], list):
-                        # Make sure the ID is not already in the list
-                        if self.organization_id not in payload_copy["organization_ids"]:
-                            payload_copy["organization_ids"].append(self.organization_id)
-                    else:
-                        # If organization_ids is not a list, convert it
-                        payload_copy["organization_ids"] = [self.organization_id]
+                    result = await self.client.send_data(
+                        self._with_organization_id(payload), debug=debug, validate=False
+                    )
                     
-                    result = await self.client.send_data(payload_copy, debug=debug)
-                else:
-                    result = await self.client.send_data(payload, debug=debug)
-                
-                duration = time.time() - start_time
-                
-                # Record successful API call
-                entity_count = len(payload.get("data", []))
-                self.metrics.record_api_call(duration, True, batch_size=entity_count)
-                self.metrics.record_entities(entity_count)
-                
-                return result, True, duration
-            except Exception as e:
-                end_time = time.time()
-                duration = end_time - start_time
-                
-                # Record failed API call
-                self.metrics.record_api_call(duration, False)
-                self.metrics.record_error(type(e).__name__)
-                
-                return {"error": str(e)}, False, duration
+                    duration = time.time() - start_time
+                    
+                    # Record successful API call
+                    entity_count = len(payload.get("data", []))
+                    self.metrics.record_api_call(duration, True, batch_size=entity_count)
+                    self.metrics.record_entities(entity_count)
+                    
+                    return result, True, duration
+                except Exception as e:
+                    end_time = time.time()
+                    duration = end_time - start_time
+                    
+                    # Record failed API call
+                    self.metrics.record_api_call(duration, False)
+                    self.metrics.record_error(type(e).__name__)
+                    
+                    return {"error": str(e)}, False, duration
         
         # Process payloads with progress tracking
-        results = []
         pbar = tqdm(
             total=len(payloads), 
             desc="Processing files", 
@@ -194,9 +338,8 @@ class BatchProcessor:
             disable=not self.show_progress
         )
         
-        for payload in payloads:
-            result, success, duration = await process_payload(payload)
-            results.append(result if success else result)
+        async def send_with_progress(payload: dict[str, Any], validation_error: Optional[str]) -> dict[str, Any]:
+            result, _, _ = await process_payload(payload, validation_error)
             
             # Update progress bar with stats
             if self.show_progress:
@@ -205,27 +348,42 @@ class BatchProcessor:
                     success=f"{self.metrics.success_calls}/{self.metrics.api_calls}",
                     entities=self.metrics.entities_processed
                 )
+            return result
+        
+        # One pooled session serves every payload, closed once all are sent;
+        # payloads are sent concurrently, bounded by the client's max_concurrent
+        async with self._client_scope():
+            results = await asyncio.gather(*(
+                send_with_progress(payload, validation_error)
+                for payload, validation_error in zip(payloads, validation_errors)
+            ))
         
         pbar.close()
         
-        # Aggregate results and handle exceptions
-        aggregated: dict[str, Any] = {"summary": {"submitted": 0, "processed": 0, "dropped": 0}}
+        # Aggregate results and handle exceptions; counts are summed in locals
+        # and the summary dict is built once at the end
+        submitted = processed = dropped = 0
         successful = 0
         failed = 0
+        # Auto-batched files may share one merged request's summary
+        seen_shared: set[str] = set()
         
-        for i, result in enumerate(results):
+        for path, result in zip(file_paths, results):
             if isinstance(result, Exception) or "error" in result:
                 error_str = str(result) if isinstance(result, Exception) else result.get("error", "Unknown error")
                 logger.error("Error processing file %s: %s", 
-                           file_paths[i], error_str)
+                           path, error_str)
                 failed += 1
             else:
                 successful += 1
-                if "summary" in result:
-                    summary = result["summary"]
-                    aggregated["summary"]["submitted"] += summary.get("submitted", 0)
-                    aggregated["summary"]["processed"] += summary.get("processed", 0)
-                    aggregated["summary"]["dropped"] += summary.get("dropped", 0)
+                summary = _summary_once(result, seen_shared)
+                submitted += summary.get("submitted", 0)
+                processed += summary.get("processed", 0)
+                dropped += summary.get("dropped", 0)
+        
+        aggregated: dict[str, Any] = {
+            "summary": {"submitted": submitted, "processed": processed, "dropped": dropped}
+        }
         
         # Finalize performance metrics
         self.metrics.end()
@@ -286,6 +444,9 @@ class BatchProcessor:
         if not csv_paths:
             return {"summary": {"submitted": 0, "processed": 0, "dropped": 0}}
         
+        # tqdm is only needed once there is work to show progress for
+        from tqdm import tqdm
+        
         # Start measuring performance
         self.metrics = PerformanceMetrics()
         self.metrics.start()
@@ -320,27 +481,10 @@ class BatchProcessor:
         
         # Define processing function for each payload
         async def process_payload(payload: dict[str, Any]) -> tuple[dict[str, Any], bool, float]:
+            # Payloads are sent one at a time, so the client admits each at once
+            start_time = time.time()
             try:
-                start_time = time.time()
-                
-                # Add organization_id to the payload if specified
-                if self.organization_id:
-                    payload_copy = dict(payload)
-                    
-                    # Add organization_ids array if not present
-                    if "organization_ids" not in payload_copy:
-                        payload_copy["organization_ids"] = [self.organization_id]
-                    elif isinstance(payload_copy["organization_ids"], list):
-                        # Make sure the ID is not already in the list
-                        if self.organization_id not in payload_copy["organization_ids"]:
-                            payload_copy["organization_ids"].append(self.organization_id)
-                    else:
-                        # If organization_ids is not a list, convert it
-                        payload_copy["organization_ids"] = [self.organization_id]
-                    
-                    result = await self.client.send_data(payload_copy, debug=debug)
-                else:
-                    result = await self.client.send_data(payload, debug=debug)
+                result = await self.client.send_data(self._with_organization_id(payload), debug=debug)
                 
                 duration = time.time() - start_time
                 
@@ -369,40 +513,47 @@ class BatchProcessor:
             disable=not self.show_progress
         )
         
-        for payload in payloads:
-            result, success, duration = await process_payload(payload)
-            results.append(result if success else result)
+        # One pooled session serves every payload, closed once all are sent
+        async with self._client_scope():
+            for payload in payloads:
+                result, success, duration = await process_payload(payload)
+                results.append(result if success else result)
             
-            # Update progress bar with stats
-            if self.show_progress:
-                pbar.update(1)
-                pbar.set_postfix(
-                    success=f"{self.metrics.success_calls}/{self.metrics.api_calls}",
-                    entities=self.metrics.entities_processed,
-                    rate=f"{self.metrics.entities_processed / (time.time() - self.metrics.start_time.timestamp()):.1f}/s" 
-                    if self.metrics.start_time else "0/s"
-                )
+                # Update progress bar with stats
+                if self.show_progress:
+                    pbar.update(1)
+                    pbar.set_postfix(
+                        success=f"{self.metrics.success_calls}/{self.metrics.api_calls}",
+                        entities=self.metrics.entities_processed,
+                        rate=f"{self.metrics.entities_processed / (time.time() - self.metrics.start_time.timestamp()):.1f}/s" 
+                        if self.metrics.start_time else "0/s"
+                    )
         
         pbar.close()
         
-        # Aggregate results and handle exceptions
-        aggregated: dict[str, Any] = {"summary": {"submitted": 0, "processed": 0, "dropped": 0}}
+        # Aggregate results and handle exceptions; counts are summed in locals
+        # and the summary dict is built once at the end
+        submitted = processed = dropped = 0
         successful = 0
         failed = 0
         
-        for i, result in enumerate(results):
+        for path, result in zip(csv_paths, results):
             if isinstance(result, Exception) or "error" in result:
                 error_str = str(result) if isinstance(result, Exception) else result.get("error", "Unknown error")
                 logger.error("Error processing converted CSV file %s: %s", 
-                           csv_paths[i], error_str)
+                           path, error_str)
                 failed += 1
             else:
                 successful += 1
                 if "summary" in result:
                     summary = result["summary"]
-                    aggregated["summary"]["submitted"] += summary.get("submitted", 0)
-                    aggregated["summary"]["processed"] += summary.get("processed", 0)
-                    aggregated["summary"]["dropped"] += summary.get("dropped", 0)
+                    submitted += summary.get("submitted", 0)
+                    processed += summary.get("processed", 0)
+                    dropped += summary.get("dropped", 0)
+        
+        aggregated: dict[str, Any] = {
+            "summary": {"submitted": submitted, "processed": processed, "dropped": dropped}
+        }
         
         # Finalize performance metrics
         self.metrics.end()
@@ -480,6 +631,35 @@ class BatchProcessor:
         # Process all files
         return await self.process_files(file_paths, debug)
     
+    def _with_organization_id(self, payload: Mapping[str, Any]) -> Mapping[str, Any]:
+        """
+        Add the configured organization_id to a payload's organization_ids.
+        
+        Args:
+            payload: Payload (or payload fields) to update
+            
+        Returns:
+            The payload unchanged if no organization_id is set, else an updated copy
+        """
+        if not self.organization_id:
+            return payload
+        
+        payload_copy = dict(payload)
+        
+        # Add organization_ids array if not present
+        if "organization_ids" not in payload_copy:
+            payload_copy["organization_ids"] = [self.organization_id]
+        elif isinstance(payload_copy["organization_ids"], list):
+            # Check if organization_id is already in the list (exact string match)
+            if not any(org_id == self.organization_id for org_id in payload_copy["organization_ids"]):
+                # Copy the list rather than appending to the caller's
+                payload_copy["organization_ids"] = [*payload_copy["organization_ids"], self.organization_id]
+        else:
+            # If organization_ids is not a list, convert it
+            payload_copy["organization_ids"] = [self.organization_id]
+        
+        return payload_copy
+    
     async def process_large_payload(
         self, 
         payload: Mapping[str, Any],
@@ -499,33 +679,97 @@ class BatchProcessor:
             ApiError: On API-related errors
             PayloadValidationError: If payload is invalid
         """
-        # Add organization_id to the payload if specified
-        if self.organization_id:
-            payload_copy = dict(payload)
-            
-            # Add organization_ids array if not present
-            if "organization_ids" not in payload_copy:
-                payload_copy["organization_ids"] = [self.organization_id]
-            elif isinstance(payload_copy["organization_ids"], list):
-                # Check if organization_id is already in the list (exact string match)
-                if not any(org_id == self.organization_id for org_id in payload_copy["organization_ids"]):
-                    payload_copy["organization_ids"].append(self.organization_id)
-            else:
-                # If organization_ids is not a list, convert it
-                payload_copy["organization_ids"] = [self.organization_id]
-            
-            return await self.client.split_and_send(
-                payload_copy, 
-                batch_size=self.batch_size, 
-                debug=debug
-            )
-        else:
+        payload = self._with_organization_id(payload)
+        
+        # One pooled session serves every batch, closed once all are sent
+        async with self._client_scope():
+            data = payload.get("data")
+            if self.adaptive and isinstance(data, list) and data:
+                return await self._send_adaptive(payload, data, debug)
             return await self.client.split_and_send(
                 payload, 
                 batch_size=self.batch_size, 
                 debug=debug
             )
     
+    def _record_batch_latency(self, seconds: float) -> None:
+        """
+        Fold a batch latency into the moving average and adjust batch_size.
+        
+        The batch size halves while the average exceeds target_latency_ms
+        and doubles while it is under half the target, within
+        min_batch_size and max_batch_size.
+        
+        Args:
+            seconds: Time taken to send one batch
+        """
+        if self._latency_ema:
+            self._latency_ema = _LATENCY_EMA_ALPHA * seconds + (1 - _LATENCY_EMA_ALPHA) * self._latency_ema
+        else:
+            self._latency_ema = seconds
+        
+        latency_ms = self._latency_ema * 1000
+        if latency_ms > self.target_latency_ms and self.batch_size > self.min_batch_size:
+            self.batch_size = max(self.min_batch_size, self.batch_size // 2)
+        elif latency_ms < self.target_latency_ms * 0.5 and self.batch_size < self.max_batch_size:
+            self.batch_size = min(self.max_batch_size, self.batch_size * 2)
+        else:
+            return
+        logger.debug("Adaptive batch size set to %d (latency average %.0f ms)",
+                    self.batch_size, latency_ms)
+    
+    async def _send_adaptive(
+        self, 
+        payload: Mapping[str, Any], 
+        data: list[Any], 
+        debug: bool = False
+    ) -> dict[str, Any]:
+        """
+        Send a payload in rounds of max_concurrent batches, resizing batches between rounds.
+        
+        Args:
+            payload: Payload dict to split and send
+            data: The payload's data entries
+            debug: Whether to enable debug mode
+            
+        Returns:
+            Aggregated results
+            
+        Raises:
+            ApiError: On API-related errors
+            PayloadValidationError: If payload is invalid
+        """
+        if (error := validate_payload(payload)):
+            raise PayloadValidationError(f"Payload validation failed: {error}")
+        
+        base_payload = {key: value for key, value in payload.items() if key != "data"}
+        summary = {"submitted": 0, "processed": 0, "dropped": 0}
+        # Batches in a round may share one merged request's summary
+        seen_shared: set[str] = set()
+        
+        start = 0
+        while start < len(data):
+            batch_size = self.batch_size
+            batches = []
+            for _ in range(self.max_concurrent):
+                if start >= len(data):
+                    break
+                batches.append({**base_payload, "data": data[start:start + batch_size]})
+                start += batch_size
+            
+            # Batches in a round are sent concurrently, so the round's
+            # duration is the latency of its batches
+            t0 = time.perf_counter()
+            results = await self.client.batch_send(batches, debug=debug, validate=False)
+            self._record_batch_latency(time.perf_counter() - t0)
+            
+            for result in results:
+                batch_summary = _summary_once(result, seen_shared)
+                for key in summary:
+                    summary[key] += batch_summary.get(key, 0)
+        
+        return {"summary": summary}
+    
     async def process_large_file(
         self, 
         file_path: Path,
@@ -548,8 +792,10 @@ class BatchProcessor:
             PayloadValidationError: If payload is invalid
         """
         try:
-            with open(file_path, "r", encoding="utf-8") as f:
-                payload = json.load(f)
+            if IJSON_AVAILABLE and os.path.getsize(file_path) > _STREAM_THRESHOLD_BYTES:
+                return await self._stream_large_file(file_path, debug)
+            
+            payload = _read_json(file_path)
                 
             logger.info("Processing large file %s with %d detections", 
                        file_path, len(payload.get("data", [])))
@@ -561,4 +807,118 @@ class BatchProcessor:
             raise
         except json.JSONDecodeError as e:
             logger.error("Invalid JSON in file %s: %s", file_path, str(e))
-            raise
\ No newline at end of file
+            raise
+    
+    async def _stream_large_file(self, file_path: Path, debug: bool = False) -> dict[str, Any]:
+        """
+        Validate and send a large JSON file without loading it into memory.
+        
+        The file is read twice, each time in a worker thread so parsing never
+        blocks the event loop: one pass collects options and organization_ids
+        and validates every data entry, the next sends the entries in
+        batches. Nothing is sent unless the whole payload is valid, and at most
+        max_concurrent batches are held in memory at a time.
+        
+        Args:
+            file_path: Path to JSON file containing a large payload
+            debug: Whether to enable debug mode
+            
+        Returns:
+            Aggregated results
+            
+        Raises:
+            ApiError: On API-related errors
+            json.JSONDecodeError: If file contains invalid JSON
+            PayloadValidationError: If payload is invalid
+        """
+        def scan() -> tuple[dict[str, Any], int, Any]:
+            # Single pass: build top-level fields and validate entries as they stream by
+            fields: dict[str, Any] = {}
+            total_entries = 0
+            first_entry = None
+            chunk: list[Any] = []
+            with open(file_path, "rb") as f:
+                for prefix, value in _iter_values(f, ("options", "organization_ids", "data.item")):
+                    if prefix != "data.item":
+                        fields[prefix] = value
+                        continue
+                    if first_entry is None:
+                        first_entry = value
+                    chunk.append(value)
+                    if len(chunk) == self.batch_size:
+                        if (error := validate_entries(chunk, total_entries)):
+                            raise PayloadValidationError(f"Payload validation failed: {error}")
+                        total_entries += len(chunk)
+                        chunk = []
+            if chunk:
+                if (error := validate_entries(chunk, total_entries)):
+                    raise PayloadValidationError(f"Payload validation failed: {error}")
+                total_entries += len(chunk)
+            return fields, total_entries, first_entry
+        
+        def iter_chunks(size: int) -> Iterator[list[Any]]:
+            with open(file_path, "rb") as f:
+                chunk: list[Any] = []
+                for entry in ijson.items(f, "data.item", use_float=True):
+                    chunk.append(entry)
+                    if len(chunk) == size:
+                        yield chunk
+                        chunk = []
+                if chunk:
+                    yield chunk
+        
+        try:
+            fields, total_entries, first_entry = await asyncio.to_thread(scan)
+            fields = dict(self._with_organization_id(fields))
+            
+            if first_entry is None:
+                # No entries; let the regular path handle the empty payload
+                return await self.process_large_payload({**fields, "data": []}, debug)
+            if (error := validate_payload({**fields, "data": [first_entry]})):
+                raise PayloadValidationError(f"Payload validation failed: {error}")
+            
+            logger.info("Streaming large file %s with %d detections", 
+                       file_path, total_entries)
+            
+            summary = {"submitted": 0, "processed": 0, "dropped": 0}
+            seen_shared: set[str] = set()
+            
+            async def send(batches: list[dict[str, Any]]) -> None:
+                # Entries were validated in the first pass
+                for result in await self.client.batch_send(batches, debug=debug, validate=False):
+                    batch_summary = _summary_once(result, seen_shared)
+                    for key in summary:
+                        summary[key] += batch_summary.get(key, 0)
+            
+            # One pooled session serves every batch, closed once all are sent
+            chunks = iter_chunks(self.batch_size)
+            # The next() call running in a worker thread, if any
+            parsing: Optional[asyncio.Future[Optional[list[Any]]]] = None
+            try:
+                async with self._client_scope():
+                    window: list[dict[str, Any]] = []
+                    while True:
+                        # Each chunk is parsed in a worker thread; the shield
+                        # keeps the future tracking it if this task is cancelled
+                        parsing = asyncio.ensure_future(asyncio.to_thread(next, chunks, None))
+                        chunk = await asyncio.shield(parsing)
+                        parsing = None
+                        if chunk is None:
+                            break
+                        window.append({**fields, "data": chunk})
+                        if len(window) == self.max_concurrent:
+                            await send(window)
+                            window = []
+                    if window:
+                        await send(window)
+            finally:
+                # A generator can't be closed while next() runs in the worker,
+                # so let that call finish before closing it and its file
+                if parsing is not None:
+                    await asyncio.wait([parsing])
+                chunks.close()
+            
+            return {"summary": summary}
+        
+        except ijson.JSONError as e:
+            raise json.JSONDecodeError(str(e), str(file_path), 0) from e
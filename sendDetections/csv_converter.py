@@ -16,15 +16,12 @@ from pathlib import Path
 from typing import Any, Optional
 
 from sendDetections.config import SAMPLE_DIR, CSV_PATTERN, CSV_ENCODING
+from sendDetections.errors import CSVConversionError
 from sendDetections.validators import validate_payload
 
 # Configure logger
 logger = logging.getLogger(__name__)
 
-class CSVConversionError(Exception):
-    """Error occurred during CSV conversion."""
-    pass
-
 
 class CSVConverter:
     """
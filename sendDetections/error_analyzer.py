@@ -6,13 +6,14 @@ Error analysis utilities for diagnosing API and processing errors.
 Provides tools for grouping, categorizing, and suggesting fixes for common errors.
 """
 
-import json
 import logging
 import re
-from collections import Counter, defaultdict
-from datetime import datetime
+import time
+from collections import Counter
+from functools import lru_cache
 from typing import Any, Dict, List, Optional, Set, Tuple, cast
 
+from sendDetections import _json
 from sendDetections.errors import (
     SendDetectionsError, ApiError, ApiAuthenticationError,
     ApiRateLimitError, ApiServerError, ApiConnectionError,
@@ -22,6 +23,62 @@ from sendDetections.errors import (
 # Configure logger
 logger = logging.getLogger(__name__)
 
+# Fix suggestion templates keyed by analyzed error type, in report order
+_FIX_TEMPLATES: Tuple[Tuple[str, Dict[str, str]], ...] = (
+    ("RateLimit", {
+        "issue": "Rate limiting",
+        "suggestion": "Reduce request frequency or implement exponential backoff",
+        "implementation": "Use --max-concurrent=3 and --batch-size=50 to reduce API load"
+    }),
+    ("Authentication", {
+        "issue": "Authentication failure",
+        "suggestion": "Verify API token",
+        "implementation": "Check that your API token is valid and not expired"
+    }),
+    ("Validation", {
+        "issue": "Payload validation errors",
+        "suggestion": "Check payload structure against API requirements",
+        "implementation": "Verify your data matches the expected format"
+    }),
+    ("Connection", {
+        "issue": "Network connectivity issues",
+        "suggestion": "Check network connection and API endpoint",
+        "implementation": "Verify internet connection and DNS resolution"
+    }),
+    ("Timeout", {
+        "issue": "Request timeouts",
+        "suggestion": "Increase timeout or reduce payload size",
+        "implementation": "Use smaller batch sizes or increase timeout settings"
+    }),
+    ("CSVConversion", {
+        "issue": "CSV parsing problems",
+        "suggestion": "Check CSV format and required columns",
+        "implementation": "Verify CSV contains all required fields with proper data types"
+    }),
+)
+_FIX_TYPES = frozenset(fix_type for fix_type, _ in _FIX_TEMPLATES)
+
+# Last formatted second, reused while errors arrive within the same second
+_last_timestamp: List[Any] = [0, ""]
+
+
+def _now_iso() -> str:
+    """
+    Get the current local time as an ISO 8601 string with microseconds.
+    
+    The seconds part is formatted with strftime only when the second
+    changes, which is much cheaper than building a datetime per call.
+    
+    Returns:
+        ISO 8601 timestamp string
+    """
+    now = time.time()
+    second = int(now)
+    if second != _last_timestamp[0]:
+        _last_timestamp[0] = second
+        _last_timestamp[1] = time.strftime("%Y-%m-%dT%H:%M:%S", time.localtime(second))
+    return f"{_last_timestamp[1]}.{int((now - second) * 1e6):06d}"
+
 
 class ErrorAnalyzer:
     """
@@ -80,13 +137,16 @@ class ErrorAnalyzer:
         }
     ]
     
+    # Compile regex patterns once for faster matching; entries are
+    # (pattern, type, message, suggestion) tuples to avoid dict lookups
+    _COMPILED_PATTERNS: Tuple[Tuple[re.Pattern, str, str, str], ...] = tuple(
+        (re.compile(p["pattern"], re.IGNORECASE), p["type"], p["message"], p["suggestion"])
+        for p in ERROR_PATTERNS
+    )
+    
     def __init__(self):
         """Initialize the error analyzer."""
-        # Compile regex patterns for faster matching
-        self.compiled_patterns = [
-            (re.compile(p["pattern"], re.IGNORECASE), p)
-            for p in self.ERROR_PATTERNS
-        ]
+        self.compiled_patterns = self._COMPILED_PATTERNS
     
     def analyze_error(self, error: Any) -> Dict[str, Any]:
         """
@@ -120,22 +180,39 @@ class ErrorAnalyzer:
             error_details = {"message": error_message}
         
         # Match against known patterns for suggestions
-        suggestion = "No specific suggestion available"
-        for pattern, info in self.compiled_patterns:
-            if pattern.search(error_message.lower()):
-                error_type = info["type"]
-                suggestion = info["suggestion"]
-                break
+        error_type, suggestion = self._classify(error_type, error_message)
         
         # Build structured error analysis
         return {
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": _now_iso(),
             "type": error_type,
             "message": error_message,
             "details": error_details,
             "suggestion": suggestion
         }
     
+    @classmethod
+    @lru_cache(maxsize=1024)
+    def _classify(cls, error_type: str, error_message: str) -> Tuple[str, str]:
+        """
+        Classify an error message against the known error patterns.
+        
+        Results are cached because batches often repeat the same error
+        (e.g. bursts of rate-limit responses).
+        
+        Args:
+            error_type: Error type derived from the error object
+            error_message: Error message to match
+            
+        Returns:
+            Tuple of (final error type, suggestion)
+        """
+        # Patterns are compiled with re.IGNORECASE, so no need to lowercase
+        for pattern, pattern_type, _, pattern_suggestion in cls._COMPILED_PATTERNS:
+            if pattern.search(error_message):
+                return pattern_type, pattern_suggestion
+        return error_type, "No specific suggestion available"
+    
     def analyze_batch(self, errors: List[Any]) -> Dict[str, Any]:
         """
         Analyze a batch of errors to identify patterns and common issues.
@@ -160,25 +237,19 @@ class ErrorAnalyzer:
         # Count error types
         error_types = Counter(error["type"] for error in analyzed_errors)
         
-        # Group by suggestion
-        suggestions = defaultdict(list)
-        for error in analyzed_errors:
-            suggestions[error["suggestion"]].append(error["type"])
-            
-        suggestion_counts = {
-            suggestion: len(types)
-            for suggestion, types in suggestions.items()
-        }
+        # Count errors per suggestion
+        suggestion_counts = Counter(error["suggestion"] for error in analyzed_errors)
         
         # Determine if there are patterns in the errors
         has_patterns = len(error_types) < len(analyzed_errors)
-        primary_error_type = error_types.most_common(1)[0][0] if error_types else "Unknown"
+        top = error_types.most_common(1)
+        primary_error_type, primary_count = top[0] if top else ("Unknown", 0)
         
         # Generate summary message
         if len(error_types) == 1:
             summary_message = f"All errors are of type {primary_error_type}"
         else:
-            summary_message = f"Multiple error types detected, most common: {primary_error_type} ({error_types[primary_error_type]} occurrences)"
+            summary_message = f"Multiple error types detected, most common: {primary_error_type} ({primary_count} occurrences)"
         
         # Compile report
         return {
@@ -187,12 +258,12 @@ class ErrorAnalyzer:
             "has_patterns": has_patterns,
             "primary_error_type": primary_error_type,
             "error_types": dict(error_types),
-            "suggestions": suggestion_counts,
+            "suggestions": dict(suggestion_counts),
             "errors": analyzed_errors,
             "summary": {
                 "error_count": len(analyzed_errors),
                 "unique_error_types": len(error_types),
-                "primary_suggestion": max(suggestion_counts.items(), key=lambda x: x[1])[0] if suggestion_counts else "No suggestion"
+                "primary_suggestion": suggestion_counts.most_common(1)[0][0] if suggestion_counts else "No suggestion"
             }
         }
     
@@ -209,65 +280,25 @@ class ErrorAnalyzer:
         if not analysis.get("errors"):
             return []
         
-        suggestions = []
         error_types = analysis.get("error_types", {})
+        hit_types = error_types.keys() & _FIX_TYPES
         
-        # Rate limit errors
-        if "RateLimit" in error_types:
-            suggestions.append({
-                "issue": "Rate limiting",
-                "suggestion": "Reduce request frequency or implement exponential backoff",
-                "implementation": "Use --max-concurrent=3 and --batch-size=50 to reduce API load"
-            })
-        
-        # Authentication errors
-        if "Authentication" in error_types:
-            suggestions.append({
-                "issue": "Authentication failure",
-                "suggestion": "Verify API token",
-                "implementation": "Check that your API token is valid and not expired"
-            })
-        
-        # Validation errors
-        if "Validation" in error_types:
-            field_errors = self._extract_validation_fields(analysis.get("errors", []))
-            if field_errors:
-                field_list = ", ".join(field_errors)
-                suggestions.append({
-                    "issue": "Payload validation errors",
-                    "suggestion": f"Fix problems in these fields: {field_list}",
-                    "implementation": "Ensure all required fields are present and properly formatted"
-                })
-            else:
-                suggestions.append({
-                    "issue": "Payload validation errors",
-                    "suggestion": "Check payload structure against API requirements",
-                    "implementation": "Verify your data matches the expected format"
-                })
-        
-        # Connection errors
-        if "Connection" in error_types:
-            suggestions.append({
-                "issue": "Network connectivity issues",
-                "suggestion": "Check network connection and API endpoint",
-                "implementation": "Verify internet connection and DNS resolution"
-            })
-        
-        # Timeout errors
-        if "Timeout" in error_types:
-            suggestions.append({
-                "issue": "Request timeouts",
-                "suggestion": "Increase timeout or reduce payload size",
-                "implementation": "Use smaller batch sizes or increase timeout settings"
-            })
-        
-        # CSV conversion errors
-        if "CSVConversion" in error_types:
-            suggestions.append({
-                "issue": "CSV parsing problems",
-                "suggestion": "Check CSV format and required columns",
-                "implementation": "Verify CSV contains all required fields with proper data types"
-            })
+        suggestions = []
+        for fix_type, template in _FIX_TEMPLATES:
+            if fix_type not in hit_types:
+                continue
+            if fix_type == "Validation":
+                # Validation suggestions depend on the offending fields
+                field_errors = self._extract_validation_fields(analysis.get("errors", []))
+                if field_errors:
+                    field_list = ", ".join(field_errors)
+                    suggestions.append({
+                        "issue": "Payload validation errors",
+                        "suggestion": f"Fix problems in these fields: {field_list}",
+                        "implementation": "Ensure all required fields are present and properly formatted"
+                    })
+                    continue
+            suggestions.append(dict(template))
         
         # Add generic suggestion if none found
         if not suggestions:
@@ -321,6 +352,9 @@ class ErrorAnalyzer:
         error_types = analysis.get("error_types", {})
         suggestions = self.suggest_fixes(analysis)
         
+        # Precompute the percentage scale once instead of dividing per type
+        inv = 100.0 / error_count if error_count else 0.0
+        
         report = [
             "=== Error Analysis Report ===",
             f"Total errors: {error_count}",
@@ -328,17 +362,18 @@ class ErrorAnalyzer:
             "",
             "Error distribution:",
         ]
-        
-        for error_type, count in error_types.items():
-            report.append(f"  - {error_type}: {count} ({count/error_count*100:.1f}%)")
-        
+        report.extend(
+            f"  - {error_type}: {count} ({count * inv:.1f}%)"
+            for error_type, count in error_types.items()
+        )
         report.append("")
         report.append("Suggested fixes:")
-        
-        for i, suggestion in enumerate(suggestions, 1):
-            report.append(f"  {i}. {suggestion['issue']}")
-            report.append(f"     Suggestion: {suggestion['suggestion']}")
-            report.append(f"     Implementation: {suggestion['implementation']}")
+        report.extend(
+            f"  {i}. {suggestion['issue']}\n"
+            f"     Suggestion: {suggestion['suggestion']}\n"
+            f"     Implementation: {suggestion['implementation']}"
+            for i, suggestion in enumerate(suggestions, 1)
+        )
             
         return "\n".join(report)
 
@@ -348,11 +383,14 @@ class ErrorCollection:
     Collect and track errors during batch processing.
     """
     
+    __slots__ = ("errors", "error_count", "error_types", "_has_api_errors")
+    
     def __init__(self):
         """Initialize the error collection."""
         self.errors: List[Dict[str, Any]] = []
         self.error_count = 0
         self.error_types: Dict[str, int] = {}
+        self._has_api_errors = False
         
     def add_error(
         self, 
@@ -385,7 +423,7 @@ class ErrorCollection:
         # Build error entry
         entry = {
             "id": self.error_count + 1,
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": _now_iso(),
             "type": error_type,
             "message": error_message
         }
@@ -401,6 +439,10 @@ class ErrorCollection:
         # Add exception information
         if isinstance(error, Exception):
             entry["exception"] = error.__class__.__name__
+        
+        # Tracked as errors are added so get_summary needs no scan
+        if entry.get("status_code") is not None:
+            self._has_api_errors = True
             
         self.errors.append(entry)
         self.error_count += 1
@@ -430,7 +472,7 @@ class ErrorCollection:
             "total_errors": self.error_count,
             "error_types": self.error_types,
             "most_common_type": max(self.error_types.items(), key=lambda x: x[1])[0] if self.error_types else None,
-            "has_api_errors": any(e.get("status_code") is not None for e in self.errors),
+            "has_api_errors": self._has_api_errors,
             "has_validation_errors": "ValidationError" in self.error_types or "PayloadValidationError" in self.error_types
         }
         
@@ -464,4 +506,4 @@ class ErrorCollection:
             "errors": self.errors,
             "summary": self.get_summary()
         }
-        return json.dumps(data, indent=2)
\ No newline at end of file
+        return _json.dumps(data, indent=True).decode("utf-8")
\ No newline at end of file
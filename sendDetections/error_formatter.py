@@ -6,10 +6,10 @@ Error formatting utilities for improved UX when displaying errors.
 Provides context-rich, user-friendly error messages and suggestions.
 """
 
-import re
-import textwrap
+import sys
 import logging
-from typing import Any, Dict, List, Optional, Tuple, Union
+from io import StringIO
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterable, Iterator, Optional, Sequence, Tuple
 
 from sendDetections.errors import (
     SendDetectionsError, ApiError, ApiAuthenticationError,
@@ -18,14 +18,16 @@ from sendDetections.errors import (
     ConfigurationError, FileOperationError
 )
 
+if TYPE_CHECKING:
+    from textwrap import TextWrapper
+
 # Configure logger
 logger = logging.getLogger(__name__)
 
-class ErrorFormatter:
-    """Format errors into user-friendly messages with context and suggestions."""
-    
-    # ANSI color codes for terminal output
-    COLORS = {
+# ANSI color codes for terminal output, interned so every formatter
+# shares the same string objects
+COLORS = {
+    name: sys.intern(code) for name, code in {
         'reset': '\033[0m',
         'red': '\033[31m',
         'green': '\033[32m',
@@ -36,7 +38,87 @@ class ErrorFormatter:
         'white': '\033[37m',
         'bold': '\033[1m',
         'underline': '\033[4m',
-    }
+    }.items()
+}
+
+# Prebuilt (prefix, suffix) pairs for each color
+_COLOR_MAP: Dict[str, Tuple[str, str]] = {
+    name: (code, COLORS['reset']) for name, code in COLORS.items()
+}
+
+# Static fix suggestions per error type
+_AUTH_SUGGESTIONS = (
+    "Check that your API token is correct and not expired",
+    "Verify the token has the required permissions",
+    "Try regenerating the token in your Recorded Future account",
+)
+# Rate limit suggestions after the dynamic retry hint
+_RATE_LIMIT_TAIL = (
+    "Reduce the request frequency with --max-concurrent and --batch-size",
+    "Implement exponential backoff or use the batch processing mode",
+)
+_SERVER_SUGGESTIONS = (
+    "This is an issue with the Recorded Future API servers",
+    "Try again later or contact Recorded Future support",
+    "Use the batch processing mode with retries enabled",
+)
+_CONNECTION_SUGGESTIONS = (
+    "Check your network connection",
+    "Verify that the API endpoint is correct",
+    "Check if your firewall or proxy is blocking the connection",
+)
+_TIMEOUT_SUGGESTIONS = (
+    "The request took too long to complete",
+    "Try using smaller batch sizes",
+    "Check your network connection speed",
+)
+_API_SUGGESTIONS = (
+    "Check the error message for details",
+    "Verify your request payload format",
+    "Try with the --debug flag for additional information",
+)
+_VALIDATION_SUGGESTIONS = (
+    "Ensure all required fields are present and have the correct format",
+    "Check for typos in field names",
+    "Verify value types match the API requirements",
+)
+_CSV_SUGGESTIONS = (
+    "Check the CSV file format and structure",
+    "Ensure the CSV headers match the expected schema",
+    "Verify the file is properly formatted CSV with UTF-8 encoding",
+)
+_CONFIG_SUGGESTIONS = (
+    "Check your configuration file syntax",
+    "Verify environment variables are set correctly",
+    "Use --config to specify an alternate configuration file",
+)
+_FILE_SUGGESTIONS = (
+    "Check that the file exists and you have appropriate permissions",
+    "Verify the path is correctly specified",
+    "Ensure the directory is accessible",
+)
+_GENERAL_SUGGESTIONS = (
+    "Check the error message for details",
+    "Try running with the --debug flag for more information",
+    "Refer to the documentation for help with this error type",
+)
+_EXCEPTION_SUGGESTIONS = (
+    "This is an unexpected error in the application",
+    "Try running with --debug for more detailed information",
+    "Consider reporting this as a bug",
+)
+_UNKNOWN_SUGGESTIONS = (
+    "This is an unexpected error of unknown type",
+    "Try running with --debug for more detailed information",
+    "Consider reporting this as a bug",
+)
+
+
+class ErrorFormatter:
+    """Format errors into user-friendly messages with context and suggestions."""
+    
+    # ANSI color codes for terminal output (shared module-level table)
+    COLORS = COLORS
     
     def __init__(self, use_colors: bool = True, terminal_width: int = 80):
         """
@@ -48,6 +130,28 @@ class ErrorFormatter:
         """
         self.use_colors = use_colors
         self.terminal_width = terminal_width
+        
+        # Text wrappers keyed by (indentation or bullet number, terminal_width),
+        # reused across calls; the width is part of the key so a changed
+        # terminal_width never reuses a wrapper built for the old one
+        self._wrappers: Dict[Tuple[int, int], "TextWrapper"] = {}
+        self._bullet_wrappers: Dict[Tuple[int, int], "TextWrapper"] = {}
+        
+        # Formatted headers keyed by (error type, use_colors)
+        self._header_cache: Dict[Tuple[str, bool], str] = {}
+        
+        # Handlers keyed by exception class, resolved via the error's MRO
+        self._dispatch: Dict[type, Callable[[Any], str]] = {
+            ApiError: self._format_api_error,
+            PayloadValidationError: self._format_validation_error,
+            CSVConversionError: self._format_csv_error,
+            ConfigurationError: self._format_config_error,
+            FileOperationError: self._format_file_error,
+            SendDetectionsError: self._format_general_error,
+            Exception: self._format_exception,
+        }
+        # Handlers already resolved for concrete error classes
+        self._resolved: Dict[type, Callable[[Any], str]] = {}
     
     def format(self, error: Any) -> str:
         """
@@ -59,126 +163,178 @@ class ErrorFormatter:
         Returns:
             Formatted error message with context and suggestions
         """
-        if isinstance(error, ApiError):
-            return self._format_api_error(error)
-        elif isinstance(error, PayloadValidationError):
-            return self._format_validation_error(error)
-        elif isinstance(error, CSVConversionError):
-            return self._format_csv_error(error)
-        elif isinstance(error, ConfigurationError):
-            return self._format_config_error(error)
-        elif isinstance(error, FileOperationError):
-            return self._format_file_error(error)
-        elif isinstance(error, SendDetectionsError):
-            return self._format_general_error(error)
-        elif isinstance(error, Exception):
-            return self._format_exception(error)
-        else:
-            return self._format_unknown_error(error)
+        error_class = type(error)
+        handler = self._resolved.get(error_class)
+        if handler is None:
+            handler = self._resolve_handler(error_class)
+            self._resolved[error_class] = handler
+        return handler(error)
+    
+    def _resolve_handler(self, error_class: type) -> Callable[[Any], str]:
+        """Find the handler for an error class by walking its MRO."""
+        dispatch = self._dispatch
+        for cls in error_class.__mro__:
+            handler = dispatch.get(cls)
+            if handler is not None:
+                return handler
+        return self._format_unknown_error
     
     def _apply_color(self, text: str, color: str) -> str:
         """Apply ANSI color if colors are enabled."""
         if not self.use_colors:
             return text
-        color_code = self.COLORS.get(color, '')
-        if not color_code:
+        wrap = _COLOR_MAP.get(color)
+        if wrap is None:
             return text
-        return f"{color_code}{text}{self.COLORS['reset']}"
+        return ''.join((wrap[0], text, wrap[1]))
+    
+    def _fits_line(self, text: str, indent: int) -> bool:
+        """
+        Check whether text can be emitted as-is on one indented line.
+        
+        The wrapper width includes the indentation, so the same bound is
+        applied here; only plain text that textwrap would leave unchanged
+        qualifies.
+        """
+        return bool(
+            text
+            and len(text) + 2 * indent <= self.terminal_width
+            and text.isprintable()
+            and text[-1] != ' '
+        )
     
     def _wrap_text(self, text: str, indent: int = 0) -> str:
         """Wrap text to terminal width with optional indentation."""
-        wrapped = textwrap.fill(
-            text,
-            width=self.terminal_width - indent,
-            initial_indent=' ' * indent,
-            subsequent_indent=' ' * indent
-        )
-        return wrapped
+        # Short single-line text needs no wrapping
+        if self._fits_line(text, indent):
+            return ' ' * indent + text
+        
+        key = (indent, self.terminal_width)
+        wrapper = self._wrappers.get(key)
+        if wrapper is None:
+            # Imported lazily: most CLI runs never format an error
+            from textwrap import TextWrapper
+            wrapper = TextWrapper(
+                width=self.terminal_width - indent,
+                initial_indent=' ' * indent,
+                subsequent_indent=' ' * indent
+            )
+            self._wrappers[key] = wrapper
+        return wrapper.fill(text)
     
     def _format_header(self, error_type: str) -> str:
         """Format the error header."""
-        header = f"ERROR: {error_type}"
-        return self._apply_color(header, 'bold')
+        key = (error_type, self.use_colors)
+        header = self._header_cache.get(key)
+        if header is None:
+            header = self._apply_color(f"ERROR: {error_type}", 'bold')
+            self._header_cache[key] = header
+        return header
     
     def _format_message(self, message: str) -> str:
         """Format the main error message."""
         wrapped = self._wrap_text(message, indent=2)
         return self._apply_color(wrapped, 'red')
     
-    def _format_context(self, context_items: Dict[str, Any]) -> str:
-        """Format error context information."""
-        if not context_items:
-            return ""
-            
-        lines = [self._apply_color("Context:", 'bold')]
+    def _write_context(self, buf: StringIO, context_items: Dict[str, Any]) -> None:
+        """Write error context information as a new section."""
+        buf.write("\n\n")
+        buf.write(self._apply_color("Context:", 'bold'))
         for key, value in context_items.items():
             if value is not None:
-                key_str = self._apply_color(f"{key}:", 'cyan')
-                lines.append(f"  {key_str} {value}")
-        
-        return "\n".join(lines)
+                buf.write("\n  ")
+                buf.write(self._apply_color(f"{key}:", 'cyan'))
+                buf.write(f" {value}")
     
-    def _format_suggestions(self, suggestions: List[str]) -> str:
-        """Format error fix suggestions."""
-        if not suggestions:
-            return ""
-            
-        lines = [self._apply_color("Suggestions:", 'bold')]
+    def _write_suggestions(self, buf: StringIO, suggestions: Sequence[str]) -> None:
+        """Write error fix suggestions as a new section."""
+        buf.write("\n\n")
+        buf.write(self._apply_color("Suggestions:", 'bold'))
         for i, suggestion in enumerate(suggestions, 1):
-            bullet = self._apply_color(f"{i}.", 'green')
-            suggestion_text = self._wrap_text(suggestion, indent=5)
-            # Add indentation to the bullet point
-            suggestion_text = f"  {bullet} {suggestion_text[5:]}"
-            lines.append(suggestion_text)
+            buf.write("\n")
+            buf.write(self._format_bullet(i, suggestion))
+    
+    def _format_bullet(self, number: int, text: str) -> str:
+        """Format a numbered suggestion, wrapping continuation lines."""
+        bullet = self._apply_color(f"{number}.", 'green')
+        if self._fits_line(text, 5):
+            return f"  {bullet} {text}"
         
-        return "\n".join(lines)
+        # The wrapper emits the plain bullet as its initial indent so that
+        # ANSI codes don't count towards the line width
+        key = (number, self.terminal_width)
+        wrapper = self._bullet_wrappers.get(key)
+        if wrapper is None:
+            from textwrap import TextWrapper
+            wrapper = TextWrapper(
+                width=self.terminal_width - 5,
+                initial_indent=f"  {number}. ",
+                subsequent_indent=' ' * 5
+            )
+            self._bullet_wrappers[key] = wrapper
+        wrapped = wrapper.fill(text)
+        if not wrapped:
+            return f"  {bullet} "
+        if self.use_colors:
+            return f"  {bullet} {wrapped[len(wrapper.initial_indent):]}"
+        return wrapped
+    
+    def _render(
+        self,
+        error_type: str,
+        message: str,
+        context: Optional[Dict[str, Any]],
+        suggestions: Sequence[str]
+    ) -> str:
+        """
+        Render the header, message, context and suggestion sections.
+        
+        Sections are written into a single buffer and separated by blank
+        lines; empty sections are skipped.
+        
+        Args:
+            error_type: Human-readable error type for the header
+            message: Main error message
+            context: Optional context items
+            suggestions: Fix suggestions
+            
+        Returns:
+            Formatted error message
+        """
+        buf = StringIO()
+        buf.write(self._format_header(error_type))
+        message_text = self._format_message(message)
+        if message_text:
+            buf.write("\n\n")
+            buf.write(message_text)
+        if context:
+            self._write_context(buf, context)
+        if suggestions:
+            self._write_suggestions(buf, suggestions)
+        return buf.getvalue()
     
     def _format_api_error(self, error: ApiError) -> str:
         """Format API errors with specific context and suggestions."""
         # Determine the specific error type
         if isinstance(error, ApiAuthenticationError):
             error_type = "API Authentication Error"
-            suggestions = [
-                "Check that your API token is correct and not expired",
-                "Verify the token has the required permissions",
-                "Try regenerating the token in your Recorded Future account"
-            ]
+            suggestions = _AUTH_SUGGESTIONS
         elif isinstance(error, ApiRateLimitError):
             error_type = "API Rate Limit Exceeded"
             retry_msg = f" (retry after {error.retry_after}s)" if error.retry_after else ""
-            suggestions = [
-                f"Wait before retrying{retry_msg}",
-                "Reduce the request frequency with --max-concurrent and --batch-size",
-                "Implement exponential backoff or use the batch processing mode"
-            ]
+            suggestions = (f"Wait before retrying{retry_msg}",) + _RATE_LIMIT_TAIL
         elif isinstance(error, ApiServerError):
             error_type = "API Server Error"
-            suggestions = [
-                "This is an issue with the Recorded Future API servers",
-                "Try again later or contact Recorded Future support",
-                "Use the batch processing mode with retries enabled"
-            ]
+            suggestions = _SERVER_SUGGESTIONS
         elif isinstance(error, ApiConnectionError):
             error_type = "API Connection Error"
-            suggestions = [
-                "Check your network connection",
-                "Verify that the API endpoint is correct",
-                "Check if your firewall or proxy is blocking the connection"
-            ]
+            suggestions = _CONNECTION_SUGGESTIONS
         elif isinstance(error, ApiTimeoutError):
             error_type = "API Timeout Error"
-            suggestions = [
-                "The request took too long to complete",
-                "Try using smaller batch sizes",
-                "Check your network connection speed"
-            ]
+            suggestions = _TIMEOUT_SUGGESTIONS
         else:
             error_type = "API Error"
-            suggestions = [
-                "Check the error message for details",
-                "Verify your request payload format",
-                "Try with the --debug flag for additional information"
-            ]
+            suggestions = _API_SUGGESTIONS
         
         # Build context information
         context = {}
@@ -190,15 +346,7 @@ class ErrorFormatter:
             if 'documentation_url' in error.response_data:
                 context["Documentation"] = error.response_data['documentation_url']
         
-        # Construct the formatted message
-        parts = [
-            self._format_header(error_type),
-            self._format_message(error.message),
-            self._format_context(context),
-            self._format_suggestions(suggestions)
-        ]
-        
-        return "\n\n".join(filter(bool, parts))
+        return self._render(error_type, error.message, context, suggestions)
     
     def _format_validation_error(self, error: PayloadValidationError) -> str:
         """Format validation errors with field details and suggestions."""
@@ -219,21 +367,9 @@ class ErrorFormatter:
                 context["Note"] = f"{len(error.field_errors) - 3} more field errors"
         
         # Get suggestions from the error object
-        suggestions = error.get_suggestions() if hasattr(error, 'get_suggestions') else [
-            "Ensure all required fields are present and have the correct format",
-            "Check for typos in field names",
-            "Verify value types match the API requirements"
-        ]
-        
-        # Construct the formatted message
-        parts = [
-            self._format_header(error_type),
-            self._format_message(error.message),
-            self._format_context(context),
-            self._format_suggestions(suggestions)
-        ]
+        suggestions = error.suggestions if hasattr(error, 'suggestions') else _VALIDATION_SUGGESTIONS
         
-        return "\n\n".join(filter(bool, parts))
+        return self._render(error_type, error.message, context, suggestions)
     
     def _format_csv_error(self, error: CSVConversionError) -> str:
         """Format CSV conversion errors with file context and suggestions."""
@@ -247,41 +383,18 @@ class ErrorFormatter:
             context["Row"] = error.row_number
         
         # Get suggestions from the error object
-        suggestions = error.get_suggestions() if hasattr(error, 'get_suggestions') else [
-            "Check the CSV file format and structure",
-            "Ensure the CSV headers match the expected schema",
-            "Verify the file is properly formatted CSV with UTF-8 encoding"
-        ]
+        suggestions = error.suggestions if hasattr(error, 'suggestions') else _CSV_SUGGESTIONS
         
-        # Construct the formatted message
-        parts = [
-            self._format_header(error_type),
-            self._format_message(error.message),
-            self._format_context(context),
-            self._format_suggestions(suggestions)
-        ]
-        
-        return "\n\n".join(filter(bool, parts))
+        return self._render(error_type, error.message, context, suggestions)
     
     def _format_config_error(self, error: ConfigurationError) -> str:
         """Format configuration errors with suggestions."""
         error_type = "Configuration Error"
         
         # Get suggestions from the error object
-        suggestions = error.get_suggestions() if hasattr(error, 'get_suggestions') else [
-            "Check your configuration file syntax",
-            "Verify environment variables are set correctly",
-            "Use --config to specify an alternate configuration file"
-        ]
-        
-        # Construct the formatted message
-        parts = [
-            self._format_header(error_type),
-            self._format_message(error.message),
-            self._format_suggestions(suggestions)
-        ]
+        suggestions = error.suggestions if hasattr(error, 'suggestions') else _CONFIG_SUGGESTIONS
         
-        return "\n\n".join(filter(bool, parts))
+        return self._render(error_type, error.message, None, suggestions)
     
     def _format_file_error(self, error: FileOperationError) -> str:
         """Format file operation errors with path context and suggestions."""
@@ -293,78 +406,36 @@ class ErrorFormatter:
             context["File"] = error.file_path
         
         # Get suggestions from the error object
-        suggestions = error.get_suggestions() if hasattr(error, 'get_suggestions') else [
-            "Check that the file exists and you have appropriate permissions",
-            "Verify the path is correctly specified",
-            "Ensure the directory is accessible"
-        ]
-        
-        # Construct the formatted message
-        parts = [
-            self._format_header(error_type),
-            self._format_message(error.message),
-            self._format_context(context),
-            self._format_suggestions(suggestions)
-        ]
+        suggestions = error.suggestions if hasattr(error, 'suggestions') else _FILE_SUGGESTIONS
         
-        return "\n\n".join(filter(bool, parts))
+        return self._render(error_type, error.message, context, suggestions)
     
     def _format_general_error(self, error: SendDetectionsError) -> str:
         """Format general SendDetections errors."""
         error_type = error.__class__.__name__.replace("Error", " Error")
         
         # Try to get suggestions if the method exists
-        suggestions = error.get_suggestions() if hasattr(error, 'get_suggestions') else [
-            "Check the error message for details",
-            "Try running with the --debug flag for more information",
-            "Refer to the documentation for help with this error type"
-        ]
+        suggestions = error.suggestions if hasattr(error, 'suggestions') else _GENERAL_SUGGESTIONS
         
-        # Construct the formatted message
-        parts = [
-            self._format_header(error_type),
-            self._format_message(error.message),
-            self._format_suggestions(suggestions)
-        ]
-        
-        return "\n\n".join(filter(bool, parts))
+        return self._render(error_type, error.message, None, suggestions)
     
     def _format_exception(self, error: Exception) -> str:
         """Format standard Python exceptions."""
         error_type = f"Python {error.__class__.__name__}"
         
-        # Construct the formatted message
-        parts = [
-            self._format_header(error_type),
-            self._format_message(str(error)),
-            self._format_suggestions([
-                "This is an unexpected error in the application",
-                "Try running with --debug for more detailed information",
-                "Consider reporting this as a bug"
-            ])
-        ]
-        
-        return "\n\n".join(filter(bool, parts))
+        return self._render(error_type, str(error), None, _EXCEPTION_SUGGESTIONS)
     
     def _format_unknown_error(self, error: Any) -> str:
         """Format unknown error types."""
-        # Construct the formatted message
-        parts = [
-            self._format_header("Unknown Error"),
-            self._format_message(str(error)),
-            self._format_suggestions([
-                "This is an unexpected error of unknown type",
-                "Try running with --debug for more detailed information",
-                "Consider reporting this as a bug"
-            ])
-        ]
-        
-        return "\n\n".join(filter(bool, parts))
+        return self._render("Unknown Error", str(error), None, _UNKNOWN_SUGGESTIONS)
 
 
 # Global instance for easy access
 default_formatter = ErrorFormatter()
 
+# Shared formatters by color setting, so their caches persist across calls
+_FORMATTERS = {True: default_formatter, False: ErrorFormatter(use_colors=False)}
+
 def format_error(error: Any, use_colors: bool = True) -> str:
     """
     Format an error for user-friendly display.
@@ -376,8 +447,7 @@ def format_error(error: Any, use_colors: bool = True) -> str:
     Returns:
         Formatted error message
     """
-    formatter = ErrorFormatter(use_colors=use_colors)
-    return formatter.format(error)
+    return _FORMATTERS[bool(use_colors)].format(error)
 
 
 def print_error(error: Any, use_colors: bool = True) -> None:
@@ -392,6 +462,75 @@ def print_error(error: Any, use_colors: bool = True) -> None:
     print(formatted)
 
 
+def format_errors(errors: Iterable[Any], use_colors: bool = True) -> Iterator[str]:
+    """
+    Format many errors with a single shared formatter.
+    
+    Args:
+        errors: Error objects or exceptions
+        use_colors: Whether to use colors in the output
+        
+    Yields:
+        Formatted error messages
+    """
+    format_one = _FORMATTERS[bool(use_colors)].format
+    for error in errors:
+        yield format_one(error)
+
+
+def print_errors(errors: Iterable[Any], use_colors: bool = True) -> None:
+    """
+    Print formatted error messages with a single write call.
+    
+    Args:
+        errors: Error objects or exceptions
+        use_colors: Whether to use colors in the output
+    """
+    sys.stdout.writelines(
+        [f"{formatted}\n" for formatted in format_errors(errors, use_colors)]
+    )
+
+
+def _extract_api(error: ApiError, summary: Dict[str, Any]) -> None:
+    """Add API-specific information to an error summary."""
+    summary.update({
+        "status_code": error.status_code,
+        "api_data": error.response_data,
+    })
+    
+    # Add retry information for rate limit errors
+    if isinstance(error, ApiRateLimitError) and error.retry_after:
+        summary["retry_after"] = error.retry_after
+
+
+def _extract_validation(error: PayloadValidationError, summary: Dict[str, Any]) -> None:
+    """Add validation error details to an error summary."""
+    summary["field_errors"] = error.field_errors
+
+
+def _extract_csv(error: CSVConversionError, summary: Dict[str, Any]) -> None:
+    """Add CSV conversion details to an error summary."""
+    if error.file_path:
+        summary["file"] = error.file_path
+    if error.row_number is not None:
+        summary["row"] = error.row_number
+
+
+def _extract_file(error: FileOperationError, summary: Dict[str, Any]) -> None:
+    """Add file error details to an error summary."""
+    if error.file_path:
+        summary["file"] = error.file_path
+
+
+# Summary extractors keyed by exception class, resolved via the error's MRO
+_SUMMARY_EXTRACTORS: Dict[type, Callable[[Any, Dict[str, Any]], None]] = {
+    ApiError: _extract_api,
+    PayloadValidationError: _extract_validation,
+    CSVConversionError: _extract_csv,
+    FileOperationError: _extract_file,
+}
+
+
 def get_error_summary(error: Any) -> Dict[str, Any]:
     """
     Get a structured summary of an error for logging or display.
@@ -408,31 +547,11 @@ def get_error_summary(error: Any) -> Dict[str, Any]:
         "message": str(error),
     }
     
-    # Add API-specific information
-    if isinstance(error, ApiError):
-        summary.update({
-            "status_code": error.status_code,
-            "api_data": error.response_data,
-        })
-        
-        # Add retry information for rate limit errors
-        if isinstance(error, ApiRateLimitError) and error.retry_after:
-            summary["retry_after"] = error.retry_after
-    
-    # Add validation error details
-    elif isinstance(error, PayloadValidationError):
-        summary["field_errors"] = error.field_errors
-    
-    # Add CSV conversion details
-    elif isinstance(error, CSVConversionError):
-        if error.file_path:
-            summary["file"] = error.file_path
-        if error.row_number is not None:
-            summary["row"] = error.row_number
-    
-    # Add file error details
-    elif isinstance(error, FileOperationError):
-        if error.file_path:
-            summary["file"] = error.file_path
+    # Add type-specific details
+    for cls in type(error).__mro__:
+        extractor = _SUMMARY_EXTRACTORS.get(cls)
+        if extractor is not None:
+            extractor(error, summary)
+            break
     
-    return summary
\ No newline at end of file
+    return summary
@@ -7,8 +7,132 @@ Custom exception classes for better error handling and reporting.
 Uses Python 3.10+ type annotations.
 """
 
+from functools import cached_property
 from pathlib import Path
-from typing import Any, Optional, Dict, List
+from typing import Any, Optional, Dict, List, Sequence, Tuple
+
+
+# A suggestion rule: (substrings that must all appear, ignore case, suggestions);
+# needles of case-insensitive rules are written in lower case
+SuggestionRule = Tuple[Tuple[str, ...], bool, Tuple[str, ...]]
+
+
+def _match_rule(rules: Sequence[SuggestionRule], message: str) -> List[str]:
+    """
+    Get the suggestions of the first rule matching a message.
+    
+    Args:
+        rules: Suggestion rules in priority order
+        message: Error message to match
+        
+    Returns:
+        Suggestions of the matching rule, or an empty list
+    """
+    lowered = None
+    for needles, ignore_case, suggestions in rules:
+        if ignore_case:
+            if lowered is None:
+                lowered = message.lower()
+            text = lowered
+        else:
+            text = message
+        if all(needle in text for needle in needles):
+            return list(suggestions)
+    return []
+
+
+# Suggestion rules per error class, in priority order
+_VALIDATION_RULES: Tuple[SuggestionRule, ...] = (
+    (("IoC type must be one of",), False, (
+        "Valid IoC types are: ip, domain, hash, vulnerability, url",
+        "Example: {'type': 'ip', 'value': '192.168.1.1'}",
+    )),
+    (("IoC value cannot be empty",), False, (
+        "Provide a non-empty value for the IoC",
+        "Example: {'type': 'ip', 'value': '192.168.1.1'}",
+    )),
+    (("sub_type is required when type is 'detection_rule'",), False, (
+        "Add 'sub_type' field to the detection object",
+        "Valid sub_types are: sigma, yara, snort",
+        "Example: {'type': 'detection_rule', 'sub_type': 'sigma', 'id': 'doc:123'}",
+    )),
+    (("Timestamp must be in ISO 8601 format",), False, (
+        "Use ISO 8601 format: YYYY-MM-DDThh:mm:ssZ",
+        "Example: '2023-01-01T12:00:00Z'",
+    )),
+    (("data", "empty"), False, (
+        "The 'data' field must contain at least one detection entry",
+        "Example: {'data': [{'ioc': {...}, 'detection': {...}}]}",
+    )),
+)
+
+_CSV_RULES: Tuple[SuggestionRule, ...] = (
+    (("Entity ID", "missing"), False, (
+        "Ensure the CSV has an 'Entity ID' column",
+        "Format should be: type:value (e.g., ip:192.168.1.1)",
+    )),
+    (("Entity", "missing"), False, (
+        "Ensure the CSV has an 'Entity' column",
+        "This should contain the actual IoC value",
+    )),
+    (("Detectors", "missing"), False, (
+        "Ensure the CSV has a 'Detectors' column",
+        "This should contain the detection type/name",
+    )),
+    (("invalid format",), True, (
+        "Check the CSV format - ensure it's properly formatted",
+        "Verify delimiter is comma (,) and fields are properly quoted if needed",
+    )),
+)
+
+_CONFIG_RULES: Tuple[SuggestionRule, ...] = (
+    (("API token",), False, (
+        "Set the RF_API_TOKEN environment variable",
+        "Or use the --token/-t command line option",
+        "Or create a .env file with RF_API_TOKEN=your_token",
+    )),
+    (("config file",), True, (
+        "Check that the config file exists and has correct permissions",
+        "Use --config option to specify an alternate config file",
+        "Run 'sendDetections config init' to create a default config file",
+    )),
+)
+
+_FILE_NOT_FOUND_SUGGESTIONS = (
+    "Verify the file path is correct",
+    "Check that the file exists",
+)
+
+_FILE_RULES: Tuple[SuggestionRule, ...] = (
+    (("permission denied",), True, (
+        "Check file permissions",
+        "Ensure you have read/write access to the file",
+    )),
+    (("no such file",), True, _FILE_NOT_FOUND_SUGGESTIONS),
+    (("not found",), True, _FILE_NOT_FOUND_SUGGESTIONS),
+    (("is a directory",), True, (
+        "Expected a file but found a directory",
+        "Specify a file path, not a directory",
+    )),
+)
+
+# Generic suggestions used when no rule matches
+_GENERIC_VALIDATION_SUGGESTIONS = (
+    "Check the field format and required properties",
+    "Refer to the API documentation for field requirements",
+)
+_GENERIC_CSV_SUGGESTIONS = (
+    "Check the CSV format against the expected schema",
+    "See sample files in the sample/ directory for reference",
+)
+_GENERIC_CONFIG_SUGGESTIONS = (
+    "Check your configuration settings and environment variables",
+    "Run with --debug flag for more detailed information",
+)
+_GENERIC_FILE_SUGGESTIONS = (
+    "Check the file path and permissions",
+    "Ensure the directory exists and is accessible",
+)
 
 
 class SendDetectionsError(Exception):
@@ -22,7 +146,7 @@ class SendDetectionsError(Exception):
 class ApiError(SendDetectionsError):
     """Exception for API-related errors."""
     
-    def __init__(self, message: str, status_code: int = 0,
+    def __init__(self, message: str, status_code: Optional[int] = 0,
                  response_data: Optional[Dict[str, Any]] = None, *args, **kwargs):
         self.status_code = status_code
         self.response_data = response_data or {}
@@ -82,6 +206,11 @@ class PayloadValidationError(SendDetectionsError):
         self.original_data = original_data
         super().__init__(message, *args, **kwargs)
         
+    @cached_property
+    def suggestions(self) -> List[str]:
+        """Suggestions for fixing this error, computed once per instance."""
+        return self.get_suggestions()
+        
     def get_suggestions(self) -> List[str]:
         """
         Get suggestions for fixing the validation errors.
@@ -89,36 +218,12 @@ class PayloadValidationError(SendDetectionsError):
         Returns:
             List of suggestion strings
         """
-        suggestions = []
-        
-        # Common error patterns and their suggestions
-        if "IoC type must be one of" in self.message:
-            suggestions.append("Valid IoC types are: ip, domain, hash, vulnerability, url")
-            suggestions.append("Example: {'type': 'ip', 'value': '192.168.1.1'}")
-            
-        elif "IoC value cannot be empty" in self.message:
-            suggestions.append("Provide a non-empty value for the IoC")
-            suggestions.append("Example: {'type': 'ip', 'value': '192.168.1.1'}")
-            
-        elif "sub_type is required when type is 'detection_rule'" in self.message:
-            suggestions.append("Add 'sub_type' field to the detection object")
-            suggestions.append("Valid sub_types are: sigma, yara, snort")
-            suggestions.append("Example: {'type': 'detection_rule', 'sub_type': 'sigma', 'id': 'doc:123'}")
-            
-        elif "Timestamp must be in ISO 8601 format" in self.message:
-            suggestions.append("Use ISO 8601 format: YYYY-MM-DDThh:mm:ssZ")
-            suggestions.append("Example: '2023-01-01T12:00:00Z'")
-            
-        elif "data" in self.message and "empty" in self.message:
-            suggestions.append("The 'data' field must contain at least one detection entry")
-            suggestions.append("Example: {'data': [{'ioc': {...}, 'detection': {...}}]}")
-            
-        # Add more patterns as needed
+        # Common error patterns and their suggestions (see _VALIDATION_RULES)
+        suggestions = _match_rule(_VALIDATION_RULES, self.message)
             
         # Generic suggestions if none matched
         if not suggestions:
-            suggestions.append("Check the field format and required properties")
-            suggestions.append("Refer to the API documentation for field requirements")
+            suggestions.extend(_GENERIC_VALIDATION_SUGGESTIONS)
             
         return suggestions
         
@@ -132,6 +237,11 @@ class CSVConversionError(SendDetectionsError):
         self.row_number = row_number
         super().__init__(message, *args, **kwargs)
         
+    @cached_property
+    def suggestions(self) -> List[str]:
+        """Suggestions for fixing this error, computed once per instance."""
+        return self.get_suggestions()
+        
     def get_suggestions(self) -> List[str]:
         """
         Get suggestions for fixing CSV conversion errors.
@@ -139,24 +249,8 @@ class CSVConversionError(SendDetectionsError):
         Returns:
             List of suggestion strings
         """
-        suggestions = []
-        
         # Common CSV error patterns and their suggestions
-        if "Entity ID" in self.message and "missing" in self.message:
-            suggestions.append("Ensure the CSV has an 'Entity ID' column")
-            suggestions.append("Format should be: type:value (e.g., ip:192.168.1.1)")
-            
-        elif "Entity" in self.message and "missing" in self.message:
-            suggestions.append("Ensure the CSV has an 'Entity' column")
-            suggestions.append("This should contain the actual IoC value")
-            
-        elif "Detectors" in self.message and "missing" in self.message:
-            suggestions.append("Ensure the CSV has a 'Detectors' column")
-            suggestions.append("This should contain the detection type/name")
-            
-        elif "invalid format" in self.message.lower():
-            suggestions.append("Check the CSV format - ensure it's properly formatted")
-            suggestions.append("Verify delimiter is comma (,) and fields are properly quoted if needed")
+        suggestions = _match_rule(_CSV_RULES, self.message)
             
         # Add row information if available
         if self.row_number is not None:
@@ -164,8 +258,7 @@ class CSVConversionError(SendDetectionsError):
             
         # Generic suggestions if none matched
         if not suggestions:
-            suggestions.append("Check the CSV format against the expected schema")
-            suggestions.append("See sample files in the sample/ directory for reference")
+            suggestions.extend(_GENERIC_CSV_SUGGESTIONS)
             
         return suggestions
 
@@ -173,6 +266,11 @@ class CSVConversionError(SendDetectionsError):
 class ConfigurationError(SendDetectionsError):
     """Exception for configuration-related errors."""
     
+    @cached_property
+    def suggestions(self) -> List[str]:
+        """Suggestions for fixing this error, computed once per instance."""
+        return self.get_suggestions()
+        
     def get_suggestions(self) -> List[str]:
         """
         Get suggestions for fixing configuration errors.
@@ -180,23 +278,12 @@ class ConfigurationError(SendDetectionsError):
         Returns:
             List of suggestion strings
         """
-        suggestions = []
-        
         # Common configuration error patterns
-        if "API token" in self.message:
-            suggestions.append("Set the RF_API_TOKEN environment variable")
-            suggestions.append("Or use the --token/-t command line option")
-            suggestions.append("Or create a .env file with RF_API_TOKEN=your_token")
-            
-        elif "config file" in self.message.lower():
-            suggestions.append("Check that the config file exists and has correct permissions")
-            suggestions.append("Use --config option to specify an alternate config file")
-            suggestions.append("Run 'sendDetections config init' to create a default config file")
+        suggestions = _match_rule(_CONFIG_RULES, self.message)
             
         # Generic suggestions
         if not suggestions:
-            suggestions.append("Check your configuration settings and environment variables")
-            suggestions.append("Run with --debug flag for more detailed information")
+            suggestions.extend(_GENERIC_CONFIG_SUGGESTIONS)
             
         return suggestions
 
@@ -208,6 +295,11 @@ class FileOperationError(SendDetectionsError):
         self.file_path = file_path
         super().__init__(message, *args, **kwargs)
         
+    @cached_property
+    def suggestions(self) -> List[str]:
+        """Suggestions for fixing this error, computed once per instance."""
+        return self.get_suggestions()
+        
     def get_suggestions(self) -> List[str]:
         """
         Get suggestions for fixing file operation errors.
@@ -215,24 +307,11 @@ class FileOperationError(SendDetectionsError):
         Returns:
             List of suggestion strings
         """
-        suggestions = []
-        
         # File-related error patterns
-        if "permission denied" in self.message.lower():
-            suggestions.append("Check file permissions")
-            suggestions.append("Ensure you have read/write access to the file")
-            
-        elif "no such file" in self.message.lower() or "not found" in self.message.lower():
-            suggestions.append("Verify the file path is correct")
-            suggestions.append("Check that the file exists")
-            
-        elif "is a directory" in self.message.lower():
-            suggestions.append("Expected a file but found a directory")
-            suggestions.append("Specify a file path, not a directory")
+        suggestions = _match_rule(_FILE_RULES, self.message)
             
         # Generic suggestions
         if not suggestions:
-            suggestions.append("Check the file path and permissions")
-            suggestions.append("Ensure the directory exists and is accessible")
+            suggestions.extend(_GENERIC_FILE_SUGGESTIONS)
             
-        return suggestions
\ No newline at end of file
+        return suggestions
@@ -7,16 +7,289 @@ Supports various export formats including JSON, CSV, and detailed reports.
 """
 
 import csv
-import json
 import logging
 import os
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from datetime import datetime
+from functools import partial
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Sequence, Union
+from typing import IO, Any, Callable, Dict, Iterator, List, Optional, Sequence, Tuple, Union
+
+from sendDetections import _json
 
 # Configure logger
 logger = logging.getLogger(__name__)
 
+# Column order of the summary CSV export
+SUMMARY_FIELDS = (
+    "batch_id", "timestamp", "submitted", "processed", "dropped", "success_rate",
+    "total_time_seconds", "avg_call_time_seconds", "entities_processed",
+    "entities_per_second",
+)
+
+# Leading columns of the errors CSV export; extra error fields follow them
+ERROR_FIELDS = (
+    "error_id", "timestamp", "error_type", "message", "status_code", "file", "entity",
+)
+_ERROR_FIELD_SET = frozenset(ERROR_FIELDS)
+
+# Blank performance columns for results without performance data
+_EMPTY_PERF_VALUES = ("", "", "", "")
+
+# HTML report row templates, formatted once per row
+_RESULT_ROW_CELLS = (
+    "\n        <tr>"
+    "\n            <td>{i}</td>"
+    "\n            <td>{sub}</td>"
+    "\n            <td>{proc}</td>"
+    "\n            <td>{drop}</td>"
+    "\n            <td>{rate:.2f}%</td>"
+)
+_RESULT_ROW = _RESULT_ROW_CELLS + "\n        </tr>"
+_RESULT_ROW_PERF = (
+    _RESULT_ROW_CELLS
+    + "\n            <td>{avg:.4f}</td>"
+    "\n            <td>{eps:.2f}</td>"
+    "\n        </tr>"
+)
+_ERROR_ROW = (
+    "\n        <tr>"
+    "\n            <td>{i}</td>"
+    "\n            <td>{type}</td>"
+    "\n            <td>{msg}</td>"
+    "\n            <td>{status}</td>"
+    "\n            <td>{src}</td>"
+    "\n        </tr>"
+)
+_PERF_ROW = (
+    "\n        <tr>"
+    "\n            <td>{}</td>"
+    "\n            <td>{:.2f}</td>"
+    "\n            <td>{:.4f}</td>"
+    "\n            <td>{:.4f}</td>"
+    "\n            <td>{:.4f}</td>"
+    "\n            <td>{}</td>"
+    "\n            <td>{:.2f}</td>"
+    "\n            <td>{}</td>"
+    "\n            <td>{:.2f}%</td>"
+    "\n        </tr>"
+)
+
+# Buffer size for export files, large enough to write most reports in one call
+_WRITE_BUFFER_SIZE = 1 << 20
+
+
+@contextmanager
+def _atomic_open(file_path: Path, mode: str, **kwargs: Any) -> Iterator[IO[Any]]:
+    """
+    Open a temporary sibling of file_path and move it into place on success.
+    
+    Readers never observe a partially written export, and a failed write
+    leaves any previous file at file_path untouched.
+    
+    Args:
+        file_path: Final path of the exported file
+        mode: File mode passed to open()
+        **kwargs: Additional keyword arguments passed to open()
+        
+    Yields:
+        The open temporary file
+    """
+    tmp_path = file_path.with_name(file_path.name + ".tmp")
+    try:
+        with open(tmp_path, mode, buffering=_WRITE_BUFFER_SIZE, **kwargs) as f:
+            yield f
+        os.replace(tmp_path, file_path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+
+# Static HTML report fragments
+_HTML_HEAD = """<!DOCTYPE html>
+<html>
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>Batch Processing Report</title>
+    <style>
+        body { font-family: Arial, sans-serif; margin: 20px; }
+        h1, h2, h3 { color: #333; }
+        table { border-collapse: collapse; width: 100%; margin-bottom: 20px; }
+        th, td { padding: 8px; text-align: left; border: 1px solid #ddd; }
+        th { background-color: #f2f2f2; }
+        .summary { background-color: #f8f8f8; padding: 15px; border-radius: 5px; margin-bottom: 20px; }
+        .error { color: #b71c1c; }
+        .success { color: #2e7d32; }
+    </style>
+</head>
+<body>
+    <h1>Batch Processing Report</h1>"""
+
+_SUMMARY_TEMPLATE = """
+    <p>Generated on {generated}</p>
+
+    <div class="summary">
+        <h2>Summary</h2>
+        <p>Total submitted: <strong>{submitted}</strong></p>
+        <p>Total processed: <strong class="success">{processed}</strong></p>
+        <p>Total dropped: <strong class="error">{dropped}</strong></p>
+        <p>Total errors: <strong class="error">{errors}</strong></p>
+        <p>Success rate: <strong>{rate:.2f}%</strong></p>
+    </div>"""
+
+_RESULTS_TABLE_COLUMNS = """
+    <h2>Processing Results</h2>
+    <table>
+        <tr>
+            <th>Batch</th>
+            <th>Submitted</th>
+            <th>Processed</th>
+            <th>Dropped</th>
+            <th>Success Rate</th>"""
+_RESULTS_TABLE_HEAD = _RESULTS_TABLE_COLUMNS + """
+        </tr>"""
+_RESULTS_TABLE_HEAD_PERF = _RESULTS_TABLE_COLUMNS + """
+            <th>Avg Time (s)</th>
+            <th>Entities/s</th>
+        </tr>"""
+
+_ERRORS_TABLE_HEAD = """
+    <h2>Errors</h2>
+    <table>
+        <tr>
+            <th>ID</th>
+            <th>Type</th>
+            <th>Message</th>
+            <th>Status Code</th>
+            <th>File/Entity</th>
+        </tr>"""
+
+_PERF_TABLE_HEAD = """
+    <h2>Performance Metrics</h2>
+    <table>
+        <tr>
+            <th>Batch</th>
+            <th>Total Time (s)</th>
+            <th>Avg Call Time (s)</th>
+            <th>Min Time (s)</th>
+            <th>Max Time (s)</th>
+            <th>Entities Processed</th>
+            <th>Entities/s</th>
+            <th>API Calls</th>
+            <th>Success Rate</th>
+        </tr>"""
+
+_TABLE_TAIL = """
+    </table>"""
+
+_HTML_TAIL = """
+</body>
+</html>
+"""
+
+
+def _encode_json(data: Any, indent: int) -> bytes:
+    """
+    Serialize data to UTF-8 encoded JSON bytes.
+    
+    Args:
+        data: Data to serialize
+        indent: Indentation level; 0 produces compact output. orjson only
+            supports two-space indentation, so any non-zero value uses that.
+        
+    Returns:
+        Encoded JSON document
+    """
+    return _json.dumps(data, indent=bool(indent))
+
+
+def _build_summary_rows(
+    results: List[Dict[str, Any]],
+    row_timestamp: str
+) -> List[Tuple[Any, ...]]:
+    """
+    Build summary CSV rows in SUMMARY_FIELDS order.
+    
+    Args:
+        results: List of result dictionaries
+        row_timestamp: Timestamp shared by every row of the export
+        
+    Returns:
+        List of row tuples
+    """
+    rows = []
+    for i, result in enumerate(results):
+        summary = result.get("summary", {})
+        performance = result.get("performance", {})
+        submitted = summary.get("submitted", 0)
+        processed = summary.get("processed", 0)
+        success_rate = processed / submitted * 100 if submitted > 0 else 0
+        
+        # Add performance metrics if available
+        if performance:
+            time_data = performance.get("time", {})
+            throughput = performance.get("throughput", {})
+            perf_values = (
+                time_data.get("total_seconds", 0),
+                time_data.get("avg_call_time", 0),
+                throughput.get("entities_processed", 0),
+                throughput.get("entities_per_second", 0),
+            )
+        else:
+            perf_values = _EMPTY_PERF_VALUES
+            
+        rows.append((
+            i + 1, row_timestamp, submitted, processed,
+            summary.get("dropped", 0), success_rate
+        ) + perf_values)
+    return rows
+
+
+def _build_error_rows(
+    errors: List[Dict[str, Any]],
+    row_timestamp: str
+) -> Tuple[Tuple[str, ...], List[Tuple[Any, ...]]]:
+    """
+    Build error CSV rows in ERROR_FIELDS order followed by any extra fields.
+    
+    Args:
+        errors: List of error dictionaries
+        row_timestamp: Timestamp shared by every row of the export
+        
+    Returns:
+        Tuple of (header, rows)
+    """
+    rows = []
+    extra_rows = []
+    extra_fields: Dict[str, None] = {}
+    for i, error in enumerate(errors):
+        rows.append((
+            i + 1,
+            row_timestamp,
+            error.get("type", "Unknown"),
+            error.get("message", "No message"),
+            error.get("status_code", ""),
+            error.get("file", ""),
+            error.get("entity", ""),
+        ))
+        
+        # Collect any additional scalar fields as extra columns
+        extras = {
+            key: value for key, value in error.items()
+            if key not in _ERROR_FIELD_SET and not isinstance(value, (dict, list))
+        }
+        extra_rows.append(extras)
+        extra_fields.update(dict.fromkeys(extras))
+        
+    if extra_fields:
+        rows = [
+            row + tuple(extras.get(key, "") for key in extra_fields)
+            for row, extras in zip(rows, extra_rows)
+        ]
+    return ERROR_FIELDS + tuple(extra_fields), rows
+
 
 class ResultExporter:
     """
@@ -49,7 +322,7 @@ class ResultExporter:
         Args:
             data: Dictionary data to export
             filename: Custom filename (default: auto-generated timestamp)
-            indent: JSON indentation level
+            indent: JSON indentation level (0 for compact output)
             
         Returns:
             Path to the saved file
@@ -61,8 +334,9 @@ class ResultExporter:
         file_path = self.export_dir / filename
         
         try:
-            with open(file_path, "w", encoding="utf-8") as f:
-                json.dump(data, f, indent=indent, ensure_ascii=False)
+            payload = _encode_json(data, indent)
+            with _atomic_open(file_path, "wb") as f:
+                f.write(payload)
             
             logger.info("Exported results to %s", file_path)
             return file_path
@@ -86,57 +360,16 @@ class ResultExporter:
         Returns:
             Path to the saved file
         """
+        now = datetime.now()
         if filename is None:
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            timestamp = now.strftime("%Y%m%d_%H%M%S")
             filename = f"summary_{timestamp}.csv"
             
         file_path = self.export_dir / filename
         
         try:
-            # Extract summary data from results
-            summary_data = []
-            for i, result in enumerate(results):
-                summary = result.get("summary", {})
-                performance = result.get("performance", {})
-                
-                entry = {
-                    "batch_id": i + 1,
-                    "timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-                    "submitted": summary.get("submitted", 0),
-                    "processed": summary.get("processed", 0),
-                    "dropped": summary.get("dropped", 0),
-                    "success_rate": summary.get("processed", 0) / summary.get("submitted", 1) * 100 
-                        if summary.get("submitted", 0) > 0 else 0,
-                }
-                
-                # Add performance metrics if available
-                if performance:
-                    time_data = performance.get("time", {})
-                    throughput = performance.get("throughput", {})
-                    
-                    entry.update({
-                        "total_time_seconds": time_data.get("total_seconds", 0),
-                        "avg_call_time_seconds": time_data.get("avg_call_time", 0),
-                        "entities_processed": throughput.get("entities_processed", 0),
-                        "entities_per_second": throughput.get("entities_per_second", 0),
-                    })
-                    
-                summary_data.append(entry)
-            
-            # Write to CSV
-            if summary_data:
-                fieldnames = summary_data[0].keys()
-                
-                with open(file_path, "w", newline="", encoding="utf-8") as f:
-                    writer = csv.DictWriter(f, fieldnames=fieldnames)
-                    writer.writeheader()
-                    writer.writerows(summary_data)
-                
-                logger.info("Exported summary to %s", file_path)
-                return file_path
-            else:
-                logger.warning("No summary data to export")
-                return file_path
+            rows = _build_summary_rows(results, now.strftime("%Y-%m-%d %H:%M:%S"))
+            return self._save_summary_rows(file_path, rows)
                 
         except Exception as e:
             logger.error("Failed to export CSV summary: %s", str(e))
@@ -157,52 +390,75 @@ class ResultExporter:
         Returns:
             Path to the saved file
         """
+        now = datetime.now()
         if filename is None:
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            timestamp = now.strftime("%Y%m%d_%H%M%S")
             filename = f"errors_{timestamp}.csv"
             
         file_path = self.export_dir / filename
         
         try:
-            # Standardize error format
-            error_data = []
-            for i, error in enumerate(errors):
-                entry = {
-                    "error_id": i + 1,
-                    "timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-                    "error_type": error.get("type", "Unknown"),
-                    "message": error.get("message", "No message"),
-                    "status_code": error.get("status_code", ""),
-                    "file": error.get("file", ""),
-                    "entity": error.get("entity", ""),
-                }
-                
-                # Add any additional fields
-                for key, value in error.items():
-                    if key not in entry and not isinstance(value, (dict, list)):
-                        entry[key] = value
-                
-                error_data.append(entry)
-            
-            # Write to CSV
-            if error_data:
-                fieldnames = error_data[0].keys()
-                
-                with open(file_path, "w", newline="", encoding="utf-8") as f:
-                    writer = csv.DictWriter(f, fieldnames=fieldnames)
-                    writer.writeheader()
-                    writer.writerows(error_data)
-                
-                logger.info("Exported error details to %s", file_path)
-                return file_path
-            else:
-                logger.warning("No error data to export")
-                return file_path
+            header, rows = _build_error_rows(errors, now.strftime("%Y-%m-%d %H:%M:%S"))
+            return self._save_error_rows(file_path, header, rows)
                 
         except Exception as e:
             logger.error("Failed to export error details: %s", str(e))
             raise
             
+    def _save_summary_rows(self, file_path: Path, rows: List[Tuple[Any, ...]]) -> Path:
+        """
+        Write pre-built summary rows to a CSV file.
+        
+        Args:
+            file_path: Destination path
+            rows: Rows from _build_summary_rows
+            
+        Returns:
+            Path to the saved file
+        """
+        if not rows:
+            logger.warning("No summary data to export")
+            return file_path
+            
+        # csv.writer quotes and joins in C; checking every field in Python
+        # first, to join unquoted rows by hand, cost more than it saved
+        with _atomic_open(file_path, "w", newline="", encoding="utf-8") as f:
+            writer = csv.writer(f)
+            writer.writerow(SUMMARY_FIELDS)
+            writer.writerows(rows)
+        
+        logger.info("Exported summary to %s", file_path)
+        return file_path
+        
+    def _save_error_rows(
+        self,
+        file_path: Path,
+        header: Tuple[str, ...],
+        rows: List[Tuple[Any, ...]]
+    ) -> Path:
+        """
+        Write pre-built error rows to a CSV file.
+        
+        Args:
+            file_path: Destination path
+            header: Column names from _build_error_rows
+            rows: Rows from _build_error_rows
+            
+        Returns:
+            Path to the saved file
+        """
+        if not rows:
+            logger.warning("No error data to export")
+            return file_path
+            
+        with _atomic_open(file_path, "w", newline="", encoding="utf-8") as f:
+            writer = csv.writer(f)
+            writer.writerow(header)
+            writer.writerows(rows)
+        
+        logger.info("Exported error details to %s", file_path)
+        return file_path
+        
     def generate_report(
         self,
         results: List[Dict[str, Any]],
@@ -222,164 +478,86 @@ class ResultExporter:
         Returns:
             Path to the saved file
         """
+        now = datetime.now()
         if filename is None:
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            timestamp = now.strftime("%Y%m%d_%H%M%S")
             filename = f"report_{timestamp}.html"
             
         file_path = self.export_dir / filename
         
         try:
-            # Aggregate results
-            total_submitted = sum(r.get("summary", {}).get("submitted", 0) for r in results)
-            total_processed = sum(r.get("summary", {}).get("processed", 0) for r in results)
-            total_dropped = sum(r.get("summary", {}).get("dropped", 0) for r in results)
+            # Aggregate results in a single pass
+            total_submitted = total_processed = total_dropped = 0
+            perf_data = []
+            for r in results:
+                summary = r.get("summary", {})
+                total_submitted += summary.get("submitted", 0)
+                total_processed += summary.get("processed", 0)
+                total_dropped += summary.get("dropped", 0)
+                if "performance" in r:
+                    perf_data.append(r["performance"])
             total_errors = len(errors)
             
-            # Generate HTML
-            html_content = f"""
-<!DOCTYPE html>
-<html>
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>Batch Processing Report</title>
-    <style>
-        body {{ font-family: Arial, sans-serif; margin: 20px; }}
-        h1, h2, h3 {{ color: #333; }}
-        table {{ border-collapse: collapse; width: 100%; margin-bottom: 20px; }}
-        th, td {{ padding: 8px; text-align: left; border: 1px solid #ddd; }}
-        th {{ background-color: #f2f2f2; }}
-        .summary {{ background-color: #f8f8f8; padding: 15px; border-radius: 5px; margin-bottom: 20px; }}
-        .error {{ color: #b71c1c; }}
-        .success {{ color: #2e7d32; }}
-    </style>
-</head>
-<body>
-    <h1>Batch Processing Report</h1>
-    <p>Generated on {datetime.now().strftime("%Y-%m-%d %H:%M:%S")}</p>
-    
-    <div class="summary">
-        <h2>Summary</h2>
-        <p>Total submitted: <strong>{total_submitted}</strong></p>
-        <p>Total processed: <strong class="success">{total_processed}</strong></p>
-        <p>Total dropped: <strong class="error">{total_dropped}</strong></p>
-        <p>Total errors: <strong class="error">{total_errors}</strong></p>
-        <p>Success rate: <strong>{(total_processed / total_submitted * 100) if total_submitted else 0:.2f}%</strong></p>
-    </div>
-            """
+            # Generate HTML into a list buffer and join once at the end
+            parts: List[str] = [
+                _HTML_HEAD,
+                _SUMMARY_TEMPLATE.format(
+                    generated=now.strftime("%Y-%m-%d %H:%M:%S"),
+                    submitted=total_submitted,
+                    processed=total_processed,
+                    dropped=total_dropped,
+                    errors=total_errors,
+                    rate=(total_processed / total_submitted * 100) if total_submitted else 0,
+                ),
+            ]
             
             # Add results table
             if results:
-                html_content += """
-    <h2>Processing Results</h2>
-    <table>
-        <tr>
-            <th>Batch</th>
-            <th>Submitted</th>
-            <th>Processed</th>
-            <th>Dropped</th>
-            <th>Success Rate</th>
-                """
-                
-                if include_performance:
-                    html_content += """
-            <th>Avg Time (s)</th>
-            <th>Entities/s</th>
-                    """
-                    
-                html_content += """
-        </tr>
-                """
+                parts.append(
+                    _RESULTS_TABLE_HEAD_PERF if include_performance else _RESULTS_TABLE_HEAD
+                )
                 
                 for i, result in enumerate(results):
                     summary = result.get("summary", {})
                     submitted = summary.get("submitted", 0)
                     processed = summary.get("processed", 0)
-                    dropped = summary.get("dropped", 0)
                     success_rate = (processed / submitted * 100) if submitted else 0
                     
-                    html_content += f"""
-        <tr>
-            <td>{i + 1}</td>
-            <td>{submitted}</td>
-            <td>{processed}</td>
-            <td>{dropped}</td>
-            <td>{success_rate:.2f}%</td>
-                    """
-                    
                     if include_performance and "performance" in result:
                         performance = result["performance"]
-                        time_data = performance.get("time", {})
-                        throughput = performance.get("throughput", {})
-                        
-                        avg_time = time_data.get("avg_call_time", 0)
-                        entities_per_sec = throughput.get("entities_per_second", 0)
-                        
-                        html_content += f"""
-            <td>{avg_time:.4f}</td>
-            <td>{entities_per_sec:.2f}</td>
-                        """
-                        
-                    html_content += """
-        </tr>
-                    """
+                        parts.append(_RESULT_ROW_PERF.format(
+                            i=i + 1, sub=submitted, proc=processed,
+                            drop=summary.get("dropped", 0), rate=success_rate,
+                            avg=performance.get("time", {}).get("avg_call_time", 0),
+                            eps=performance.get("throughput", {}).get("entities_per_second", 0),
+                        ))
+                    else:
+                        parts.append(_RESULT_ROW.format(
+                            i=i + 1, sub=submitted, proc=processed,
+                            drop=summary.get("dropped", 0), rate=success_rate,
+                        ))
                     
-                html_content += """
-    </table>
-                """
+                parts.append(_TABLE_TAIL)
             
             # Add errors table
             if errors:
-                html_content += """
-    <h2>Errors</h2>
-    <table>
-        <tr>
-            <th>ID</th>
-            <th>Type</th>
-            <th>Message</th>
-            <th>Status Code</th>
-            <th>File/Entity</th>
-        </tr>
-                """
-                
-                for i, error in enumerate(errors):
-                    html_content += f"""
-        <tr>
-            <td>{i + 1}</td>
-            <td>{error.get("type", "Unknown")}</td>
-            <td>{error.get("message", "No message")}</td>
-            <td>{error.get("status_code", "")}</td>
-            <td>{error.get("file", error.get("entity", ""))}</td>
-        </tr>
-                    """
-                    
-                html_content += """
-    </table>
-                """
+                parts.append(_ERRORS_TABLE_HEAD)
+                parts.extend(
+                    _ERROR_ROW.format(
+                        i=i + 1,
+                        type=error.get("type", "Unknown"),
+                        msg=error.get("message", "No message"),
+                        status=error.get("status_code", ""),
+                        src=error.get("file", error.get("entity", "")),
+                    )
+                    for i, error in enumerate(errors)
+                )
+                parts.append(_TABLE_TAIL)
             
             # Add performance section if applicable
             if include_performance:
-                perf_data = []
-                for result in results:
-                    if "performance" in result:
-                        perf_data.append(result["performance"])
-                
                 if perf_data:
-                    html_content += """
-    <h2>Performance Metrics</h2>
-    <table>
-        <tr>
-            <th>Batch</th>
-            <th>Total Time (s)</th>
-            <th>Avg Call Time (s)</th>
-            <th>Min Time (s)</th>
-            <th>Max Time (s)</th>
-            <th>Entities Processed</th>
-            <th>Entities/s</th>
-            <th>API Calls</th>
-            <th>Success Rate</th>
-        </tr>
-                    """
+                    parts.append(_PERF_TABLE_HEAD)
                     
                     for i, perf in enumerate(perf_data):
                         time_data = perf.get("time", {})
@@ -398,33 +576,19 @@ class ResultExporter:
                         success_calls = api_calls.get("success", 0)
                         success_rate = (success_calls / total_calls * 100) if total_calls else 0
                         
-                        html_content += f"""
-        <tr>
-            <td>{i + 1}</td>
-            <td>{total_time:.2f}</td>
-            <td>{avg_time:.4f}</td>
-            <td>{min_time:.4f}</td>
-            <td>{max_time:.4f}</td>
-            <td>{entities}</td>
-            <td>{entities_per_sec:.2f}</td>
-            <td>{total_calls}</td>
-            <td>{success_rate:.2f}%</td>
-        </tr>
-                        """
+                        parts.append(_PERF_ROW.format(
+                            i + 1, total_time, avg_time, min_time, max_time,
+                            entities, entities_per_sec, total_calls, success_rate
+                        ))
                         
-                    html_content += """
-    </table>
-                    """
+                    parts.append(_TABLE_TAIL)
             
             # Close HTML
-            html_content += """
-</body>
-</html>
-            """
+            parts.append(_HTML_TAIL)
             
             # Write to file
-            with open(file_path, "w", encoding="utf-8") as f:
-                f.write(html_content)
+            with _atomic_open(file_path, "w", encoding="utf-8") as f:
+                f.write("".join(parts))
             
             logger.info("Generated HTML report at %s", file_path)
             return file_path
@@ -452,42 +616,46 @@ class ResultExporter:
         Returns:
             Dictionary mapping export type to file path
         """
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        base_name = base_filename or f"export_{timestamp}"
-        
-        export_files = {}
+        # Child exports always receive explicit filenames derived from base_name
+        now = datetime.now()
+        base_name = base_filename or f"export_{now.strftime('%Y%m%d_%H%M%S')}"
+        row_timestamp = now.strftime("%Y-%m-%d %H:%M:%S")
         
-        try:
-            # Export JSON results
-            json_path = self.export_json(
+        # Each export writes its own file, so they can run concurrently
+        jobs: List[Tuple[str, Callable[[], Path]]] = [
+            ("json", partial(
+                self.export_json,
                 {"results": results, "errors": errors},
                 filename=f"{base_name}.json"
-            )
-            export_files["json"] = json_path
-            
-            # Export CSV summary
-            csv_path = self.export_summary_csv(
+            )),
+            # Build the summary rows directly with the shared timestamp
+            ("csv_summary", lambda: self._save_summary_rows(
+                self.export_dir / f"{base_name}_summary.csv",
+                _build_summary_rows(results, row_timestamp)
+            )),
+        ]
+        
+        # Export errors if any
+        if errors:
+            jobs.append(("csv_errors", lambda: self._save_error_rows(
+                self.export_dir / f"{base_name}_errors.csv",
+                *_build_error_rows(errors, row_timestamp)
+            )))
+        
+        # Generate HTML report
+        if include_report:
+            jobs.append(("html_report", partial(
+                self.generate_report,
                 results,
-                filename=f"{base_name}_summary.csv"
-            )
-            export_files["csv_summary"] = csv_path
-            
-            # Export errors if any
-            if errors:
-                errors_path = self.export_errors_csv(
-                    errors,
-                    filename=f"{base_name}_errors.csv"
-                )
-                export_files["csv_errors"] = errors_path
-            
-            # Generate HTML report
-            if include_report:
-                report_path = self.generate_report(
-                    results,
-                    errors,
-                    filename=f"{base_name}_report.html"
-                )
-                export_files["html_report"] = report_path
+                errors,
+                filename=f"{base_name}_report.html"
+            )))
+        
+        try:
+            with ThreadPoolExecutor(max_workers=len(jobs)) as executor:
+                futures = [(key, executor.submit(job)) for key, job in jobs]
+                # Collect in submission order; result() re-raises a job's exception
+                export_files = {key: future.result() for key, future in futures}
             
             logger.info("Exported all formats to %s", self.export_dir)
             return export_files
@@ -8,24 +8,43 @@ and console formatting for human readability.
 Uses Python 3.10+ type annotations.
 """
 
-import json
 import logging
 import os
 import sys
 import traceback
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
 # Use standard library typing (Python 3.10+)
 from typing import Any, Optional, cast
 # Collections
 from collections.abc import Mapping, Sequence
 
+from sendDetections import _json
+
 # Determine if we're in a production environment
 IS_PRODUCTION = os.environ.get("ENVIRONMENT", "").lower() == "production"
 
 # Default logging level
 DEFAULT_LOG_LEVEL = logging.INFO
 
+# Standard LogRecord attributes that are not copied into JSON log output
+_RESERVED_LOGRECORD_ATTRS = frozenset({
+    "args", "asctime", "created", "exc_info", "exc_text", "filename",
+    "funcName", "id", "levelname", "levelno", "lineno", "module",
+    "msecs", "message", "msg", "name", "pathname", "process",
+    "processName", "relativeCreated", "stack_info", "thread", "threadName"
+})
+
+# Attributes every LogRecord carries, plus those formatters add ("message", "asctime")
+_STANDARD_LOGRECORD_ATTRS = frozenset(logging.makeLogRecord({}).__dict__) | _RESERVED_LOGRECORD_ATTRS
+
+# Standard attributes that are still copied into JSON output (e.g. "taskName" on 3.12+)
+_STANDARD_EXTRA_ATTRS = tuple(
+    key for key in logging.makeLogRecord({}).__dict__
+    if key not in _RESERVED_LOGRECORD_ATTRS
+)
+
 # Console colors for better readability in interactive mode
 class Colors:
     RESET = "\033[0m"
@@ -51,6 +70,36 @@ class JSONFormatter(logging.Formatter):
         """
         super().__init__()
         self.include_timestamp = include_timestamp
+        # Last formatted whole second as (second, ISO string), shared by records in that second
+        self._last_second: tuple[int, str] = (-1, "")
+        
+    def _format_timestamp(self, created: float) -> str:
+        """
+        Format a record creation time like datetime.fromtimestamp(created).isoformat().
+        
+        The date and time part is only rebuilt when the whole second changes;
+        records within the same second just append their microseconds.
+        
+        Args:
+            created: Record creation time in seconds since the epoch
+            
+        Returns:
+            ISO 8601 local timestamp string
+        """
+        second = int(created)
+        microsecond = round((created - second) * 1e6)
+        if microsecond >= 1_000_000 or created < 0:
+            # Rounds up into the next second; let datetime handle the carry
+            return datetime.fromtimestamp(created).isoformat()
+            
+        last_second, prefix = self._last_second
+        if second != last_second:
+            prefix = datetime.fromtimestamp(second).isoformat()
+            self._last_second = (second, prefix)
+            
+        if microsecond:
+            return f"{prefix}.{microsecond:06d}"
+        return prefix
         
     def format(self, record: logging.LogRecord) -> str:
         """
@@ -73,7 +122,7 @@ class JSONFormatter(logging.Formatter):
         
         # Add timestamp if configured
         if self.include_timestamp:
-            log_data["timestamp"] = datetime.fromtimestamp(record.created).isoformat()
+            log_data["timestamp"] = self._format_timestamp(record.created)
             
         # Include exception info if available
         if record.exc_info:
@@ -84,16 +133,19 @@ class JSONFormatter(logging.Formatter):
             }
             
         # Add any extra attributes from the LogRecord
-        for key, value in record.__dict__.items():
-            if key not in [
-                "args", "asctime", "created", "exc_info", "exc_text", "filename",
-                "funcName", "id", "levelname", "levelno", "lineno", "module",
-                "msecs", "message", "msg", "name", "pathname", "process",
-                "processName", "relativeCreated", "stack_info", "thread", "threadName"
-            ]:
-                log_data[key] = value
+        record_dict = record.__dict__
+        if record_dict.keys() <= _STANDARD_LOGRECORD_ATTRS:
+            # No extra= fields, so skip scanning every attribute
+            for key in _STANDARD_EXTRA_ATTRS:
+                if key in record_dict:
+                    log_data[key] = record_dict[key]
+        else:
+            for key, value in record_dict.items():
+                if key not in _RESERVED_LOGRECORD_ATTRS:
+                    log_data[key] = value
                 
-        return json.dumps(log_data)
+        # Handlers expect str, so decode the UTF-8 bytes
+        return _json.dumps(log_data).decode("utf-8")
 
 
 class ConsoleFormatter(logging.Formatter):
@@ -130,26 +182,57 @@ class ConsoleFormatter(logging.Formatter):
         Returns:
             Formatted log string
         """
+        # Without colors the record is formatted as-is, no clone needed
+        if not self.use_colors:
+            return super().format(record) + self._exception_tail(record)
+            
         # Clone the record to avoid modifying the original
         record_copy = logging.makeLogRecord(record.__dict__)
         
-        # Add color codes if enabled
-        if self.use_colors:
-            color = self.LEVEL_COLORS.get(record_copy.levelname, "")
-            if color:
-                record_copy.levelname = f"{color}{record_copy.levelname}{Colors.RESET}"
+        # Add color codes
+        color = self.LEVEL_COLORS.get(record_copy.levelname, "")
+        if color:
+            record_copy.levelname = f"{color}{record_copy.levelname}{Colors.RESET}"
                 
         # Format the record
-        result = super().format(record_copy)
+        return super().format(record_copy) + self._exception_tail(record)
         
-        # Format exception differently for console
-        if record.exc_info:
-            exception_text = self.formatException(record.exc_info)
-            # Indent the traceback for readability
-            indented_traceback = "\n    ".join(exception_text.split("\n"))
-            result += f"\n    {indented_traceback}"
+    def _exception_tail(self, record: logging.LogRecord) -> str:
+        """
+        Format the record's exception as an indented block for the console.
+        
+        Args:
+            record: The log record being formatted
             
-        return result
+        Returns:
+            Indented traceback text, or an empty string without exception info
+        """
+        if not record.exc_info:
+            return ""
+        exception_text = self.formatException(record.exc_info)
+        # Indent the traceback for readability
+        indented_traceback = "\n    ".join(exception_text.split("\n"))
+        return f"\n    {indented_traceback}"
+
+
+# Shared JSON formatter for console and file handlers; it holds no per-handler state
+_JSON_FORMATTER = JSONFormatter()
+
+
+@lru_cache(maxsize=32)
+def _resolve_level(level: int | str) -> int:
+    """
+    Resolve a logging level name or number to its numeric value.
+    
+    Args:
+        level: Logging level (name or number)
+        
+    Returns:
+        Numeric logging level, DEFAULT_LOG_LEVEL for unknown names
+    """
+    if isinstance(level, str):
+        return getattr(logging, level.upper(), DEFAULT_LOG_LEVEL)
+    return level
 
 
 def configure_logging(
@@ -166,8 +249,7 @@ def configure_logging(
         log_file: Optional file to write logs to
     """
     # Convert string level to int if needed
-    if isinstance(level, str):
-        level = getattr(logging, level.upper(), DEFAULT_LOG_LEVEL)
+    level = _resolve_level(level)
         
     # Create root logger
     root_logger = logging.getLogger()
@@ -183,7 +265,7 @@ def configure_logging(
     
     # Choose the appropriate formatter
     if json_output:
-        console_handler.setFormatter(JSONFormatter())
+        console_handler.setFormatter(_JSON_FORMATTER)
     else:
         console_handler.setFormatter(ConsoleFormatter(use_colors=not IS_PRODUCTION))
         
@@ -203,7 +285,7 @@ def configure_logging(
             file_handler = logging.FileHandler(str(log_path))
             file_handler.setLevel(level)
             # Always use JSON for file logging for better analysis
-            file_handler.setFormatter(JSONFormatter())
+            file_handler.setFormatter(_JSON_FORMATTER)
             root_logger.addHandler(file_handler)
             
             print(f"Logging to file: {log_path}", file=sys.stderr)
@@ -6,17 +6,19 @@ Performance monitoring and progress tracking utilities.
 Provides tools for measuring API call performance and displaying progress.
 """
 
+import array
 import asyncio
 import contextlib
 import functools
 import logging
 import time
+from collections import Counter
 from datetime import datetime, timedelta
-from typing import Any, Callable, Coroutine, Dict, List, Optional, Tuple, TypeVar, Union, cast
-from collections.abc import Awaitable, Iterable, Mapping, Sequence
+from typing import TYPE_CHECKING, Any, Callable, Coroutine, Dict, List, Optional, Tuple, TypeVar, Union, cast
+from collections.abc import Awaitable, Iterable, Mapping, Sequence, Sized
 
-from tqdm import tqdm
-from tqdm.asyncio import tqdm_asyncio
+if TYPE_CHECKING:
+    import aiohttp
 
 # Configure logger
 logger = logging.getLogger(__name__)
@@ -31,17 +33,27 @@ class PerformanceMetrics:
     Track and report performance metrics for API calls.
     """
     
+    __slots__ = (
+        "api_calls", "success_calls", "failed_calls", "total_time",
+        "avg_time", "start_time", "end_time",
+        "_start_monotonic", "_end_monotonic", "retries",
+        "entities_processed", "entities_per_second",
+        "batch_sizes", "call_durations", "batch_stats", "optimal_batch_size",
+        "errors_by_type",
+    )
+    
     def __init__(self):
         """Initialize performance metrics tracking."""
         self.api_calls = 0
         self.success_calls = 0
         self.failed_calls = 0
         self.total_time = 0.0
-        self.min_time = float('inf')
-        self.max_time = 0.0
         self.avg_time = 0.0
-        self.start_time = None
-        self.end_time = None
+        # Wall-clock times for reporting; durations use the monotonic clock
+        self.start_time: Optional[datetime] = None
+        self.end_time: Optional[datetime] = None
+        self._start_monotonic = 0.0
+        self._end_monotonic = 0.0
         
         # Track retries
         self.retries = 0
@@ -50,22 +62,37 @@ class PerformanceMetrics:
         self.entities_processed = 0  # IOCs processed
         self.entities_per_second = 0.0
         
-        # Track batch performance
-        self.batch_sizes: list[int] = []
+        # Track batch performance; per-call values are stored as packed C arrays
+        self.batch_sizes = array.array("q")
+        self.call_durations = array.array("d")  # Successful call durations
+        # Batch size -> [successful call count, total duration] for throughput per size
+        self.batch_stats: dict[int, list[float]] = {}
         self.optimal_batch_size = 0
         
         # Track errors by type
-        self.errors_by_type: dict[str, int] = {}
+        self.errors_by_type: Counter[str] = Counter()
+    
+    @property
+    def min_time(self) -> float:
+        """Shortest successful call duration, or infinity if there were none."""
+        return min(self.call_durations, default=float('inf'))
+    
+    @property
+    def max_time(self) -> float:
+        """Longest successful call duration, or 0.0 if there were none."""
+        return max(self.call_durations, default=0.0)
     
     def start(self) -> None:
         """Mark the start of performance measurement."""
         self.start_time = datetime.now()
+        self._start_monotonic = time.monotonic()
     
     def end(self) -> None:
         """Mark the end of performance measurement."""
+        self._end_monotonic = time.monotonic()
         self.end_time = datetime.now()
-        if self.start_time and self.end_time:
-            self.total_time = (self.end_time - self.start_time).total_seconds()
+        if self.start_time:
+            self.total_time = self._end_monotonic - self._start_monotonic
             if self.entities_processed > 0 and self.total_time > 0:
                 self.entities_per_second = self.entities_processed / self.total_time
             
@@ -74,10 +101,27 @@ class PerformanceMetrics:
                 self.avg_time = self.total_time / self.success_calls
             
             # Determine optimal batch size if we have batch data
-            if self.batch_sizes:
-                # For now, simple average
+            curve = self.throughput_curve()
+            if curve:
+                # Batch size with the highest measured entities per second
+                self.optimal_batch_size = max(curve, key=lambda point: point[1])[0]
+            elif self.batch_sizes:
+                # No timed successful batches; fall back to the average size
                 self.optimal_batch_size = int(sum(self.batch_sizes) / len(self.batch_sizes))
     
+    def throughput_curve(self) -> list[tuple[int, float]]:
+        """
+        Get the measured throughput for each batch size used.
+        
+        Returns:
+            List of (batch_size, entities_per_second) pairs sorted by batch size
+        """
+        return [
+            (size, size * count / duration)
+            for size, (count, duration) in sorted(self.batch_stats.items())
+            if duration > 0
+        ]
+    
     def record_api_call(self, duration: float, success: bool, batch_size: Optional[int] = None) -> None:
         """
         Record metrics for a single API call.
@@ -91,13 +135,19 @@ class PerformanceMetrics:
         
         if success:
             self.success_calls += 1
-            self.min_time = min(self.min_time, duration)
-            self.max_time = max(self.max_time, duration)
+            self.call_durations.append(duration)
         else:
             self.failed_calls += 1
         
         if batch_size is not None and batch_size > 0:
             self.batch_sizes.append(batch_size)
+            if success:
+                stats = self.batch_stats.get(batch_size)
+                if stats is None:
+                    self.batch_stats[batch_size] = [1, duration]
+                else:
+                    stats[0] += 1
+                    stats[1] += duration
     
     def record_retry(self) -> None:
         """Record a retry attempt."""
@@ -119,8 +169,6 @@ class PerformanceMetrics:
         Args:
             error_type: Type of error that occurred
         """
-        if error_type not in self.errors_by_type:
-            self.errors_by_type[error_type] = 0
         self.errors_by_type[error_type] += 1
     
     def get_summary(self) -> dict[str, Any]:
@@ -130,19 +178,25 @@ class PerformanceMetrics:
         Returns:
             Dictionary with performance metrics
         """
+        api_calls = self.api_calls
+        success_calls = self.success_calls
+        min_time = self.min_time
+        start_time = self.start_time
+        end_time = self.end_time
+        batch_sizes = self.batch_sizes
         return {
             "api_calls": {
-                "total": self.api_calls,
-                "success": self.success_calls,
+                "total": api_calls,
+                "success": success_calls,
                 "failed": self.failed_calls,
-                "success_rate": (self.success_calls / self.api_calls * 100) if self.api_calls > 0 else 0
+                "success_rate": (success_calls / api_calls * 100) if api_calls > 0 else 0
             },
             "time": {
                 "total_seconds": self.total_time,
-                "start": self.start_time.isoformat() if self.start_time else None,
-                "end": self.end_time.isoformat() if self.end_time else None,
+                "start": start_time.isoformat() if start_time else None,
+                "end": end_time.isoformat() if end_time else None,
                 "avg_call_time": self.avg_time,
-                "min_call_time": self.min_time if self.min_time != float('inf') else 0,
+                "min_call_time": min_time if min_time != float('inf') else 0,
                 "max_call_time": self.max_time
             },
             "retries": self.retries,
@@ -151,10 +205,11 @@ class PerformanceMetrics:
                 "entities_per_second": self.entities_per_second
             },
             "batching": {
-                "batch_count": len(self.batch_sizes),
-                "optimal_batch_size": self.optimal_batch_size
+                "batch_count": len(batch_sizes),
+                "optimal_batch_size": self.optimal_batch_size,
+                "throughput_curve": self.throughput_curve()
             },
-            "errors": self.errors_by_type
+            "errors": dict(self.errors_by_type)
         }
     
     def log_summary(self, level: int = logging.INFO) -> None:
@@ -168,31 +223,37 @@ class PerformanceMetrics:
             logger.warning("Performance metrics not started or ended properly")
             return
         
-        duration = self.end_time - self.start_time
+        api_calls = self.api_calls
+        success_calls = self.success_calls
+        retries = self.retries
+        entities_processed = self.entities_processed
+        batch_sizes = self.batch_sizes
+        duration = timedelta(seconds=self._end_monotonic - self._start_monotonic)
         
         logger.log(level, "Performance Summary:")
         logger.log(level, "-------------------")
         logger.log(level, "Total time: %s", str(duration))
         logger.log(level, "API calls: %d total, %d success, %d failed (%.1f%% success rate)",
-                 self.api_calls, self.success_calls, self.failed_calls,
-                 (self.success_calls / self.api_calls * 100) if self.api_calls > 0 else 0)
+                 api_calls, success_calls, self.failed_calls,
+                 (success_calls / api_calls * 100) if api_calls > 0 else 0)
         
-        if self.success_calls > 0:
+        if success_calls > 0:
+            min_time = self.min_time
             logger.log(level, "Call times: avg=%.2fs, min=%.2fs, max=%.2fs",
                      self.avg_time,
-                     self.min_time if self.min_time != float('inf') else 0,
+                     min_time if min_time != float('inf') else 0,
                      self.max_time)
         
-        if self.retries > 0:
-            logger.log(level, "Retries: %d", self.retries)
+        if retries > 0:
+            logger.log(level, "Retries: %d", retries)
         
-        if self.entities_processed > 0:
+        if entities_processed > 0:
             logger.log(level, "Throughput: %d entities in %.2fs (%.2f entities/sec)",
-                     self.entities_processed, self.total_time, self.entities_per_second)
+                     entities_processed, self.total_time, self.entities_per_second)
         
-        if self.batch_sizes:
+        if batch_sizes:
             logger.log(level, "Batching: %d batches, optimal size=%d",
-                     len(self.batch_sizes), self.optimal_batch_size)
+                     len(batch_sizes), self.optimal_batch_size)
         
         if self.errors_by_type:
             logger.log(level, "Errors by type:")
@@ -206,14 +267,18 @@ def measure_time() -> Iterable[dict]:
     Context manager for measuring execution time.
     
     Yields:
-        Dictionary that will be updated with timing results
+        Dictionary that will be updated with timing results; duration is
+        measured with the monotonic clock and also given as duration_ns
     """
-    result = {"start_time": time.time(), "end_time": None, "duration": None}
+    result = {"start_time": time.time(), "end_time": None, "duration": None, "duration_ns": None}
+    start_ns = time.perf_counter_ns()
     try:
         yield result
     finally:
+        duration_ns = time.perf_counter_ns() - start_ns
         result["end_time"] = time.time()
-        result["duration"] = result["end_time"] - result["start_time"]
+        result["duration_ns"] = duration_ns
+        result["duration"] = duration_ns / 1e9
 
 
 async def async_measure_time(coro: Awaitable[T]) -> Tuple[T, float]:
@@ -224,18 +289,31 @@ async def async_measure_time(coro: Awaitable[T]) -> Tuple[T, float]:
         coro: The coroutine to measure
         
     Returns:
-        Tuple of (result, duration_in_seconds)
+        Tuple of (result, duration_in_seconds), timed with the monotonic clock
     """
-    start_time = time.time()
+    start_ns = time.perf_counter_ns()
     result = await coro
-    end_time = time.time()
-    return result, end_time - start_time
+    return result, (time.perf_counter_ns() - start_ns) / 1e9
+
+
+def _log_duration(func: Callable[..., Any], start_time: float) -> None:
+    """
+    Log the execution time of func since start_time.
+    
+    Args:
+        func: The timed function
+        start_time: time.perf_counter() value taken before the call
+    """
+    duration = time.perf_counter() - start_time
+    logger.debug("%s execution time: %.4f seconds", func.__name__, duration)
 
 
 def timed_function(func: Callable[..., T]) -> Callable[..., T]:
     """
     Decorator to measure and log function execution time.
     
+    Timing is skipped entirely when debug logging is disabled.
+    
     Args:
         func: The function to time
         
@@ -244,13 +322,13 @@ def timed_function(func: Callable[..., T]) -> Callable[..., T]:
     """
     @functools.wraps(func)
     def wrapper(*args: Any, **kwargs: Any) -> T:
-        start_time = time.time()
+        if not logger.isEnabledFor(logging.DEBUG):
+            return func(*args, **kwargs)
+        start_time = time.perf_counter()
         try:
-            result = func(*args, **kwargs)
-            return result
+            return func(*args, **kwargs)
         finally:
-            duration = time.time() - start_time
-            logger.debug("%s execution time: %.4f seconds", func.__name__, duration)
+            _log_duration(func, start_time)
     return wrapper
 
 
@@ -258,6 +336,8 @@ def async_timed_function(func: Callable[..., Awaitable[T]]) -> Callable[..., Awa
     """
     Decorator to measure and log async function execution time.
     
+    Timing is skipped entirely when debug logging is disabled.
+    
     Args:
         func: The async function to time
         
@@ -266,28 +346,58 @@ def async_timed_function(func: Callable[..., Awaitable[T]]) -> Callable[..., Awa
     """
     @functools.wraps(func)
     async def wrapper(*args: Any, **kwargs: Any) -> T:
-        start_time = time.time()
+        if not logger.isEnabledFor(logging.DEBUG):
+            return await func(*args, **kwargs)
+        start_time = time.perf_counter()
         try:
-            result = await func(*args, **kwargs)
-            return result
+            return await func(*args, **kwargs)
         finally:
-            duration = time.time() - start_time
-            logger.debug("%s execution time: %.4f seconds", func.__name__, duration)
+            _log_duration(func, start_time)
     return wrapper
 
 
+def _progress_options(total: int, refresh_rate: float) -> dict[str, Any]:
+    """
+    Get tqdm options that limit how often a progress bar is redrawn.
+    
+    Args:
+        total: Total number of progress steps
+        refresh_rate: Minimum seconds between refreshes
+        
+    Returns:
+        Keyword arguments for tqdm
+    """
+    return {
+        "mininterval": refresh_rate,
+        # Redraw at most about 100 times over the whole run
+        "miniters": max(1, total // 100),
+        "smoothing": 0.1,
+        # None lets tqdm disable itself when not attached to a terminal
+        "disable": None,
+    }
+
+
 async def process_with_progress(
     items: Sequence[T],
-    process_func: Callable[[T], Awaitable[R]],
+    process_func: Callable[..., Awaitable[R]],
     description: str = "Processing",
     unit: str = "item",
     ascii: bool = False,
     leave: bool = True,
-    max_concurrency: int = 5
+    max_concurrency: int = 5,
+    session: Optional["aiohttp.ClientSession"] = None,
+    share_session: bool = False,
+    refresh_rate: float = 0.5,
+    count_entities: bool = False
 ) -> list[R]:
     """
     Process items with a progress bar and concurrency limit.
     
+    When a session is given, or share_session is set, process_func is called
+    as process_func(item, session) so all items reuse one connection pool.
+    Callers processing several rounds of items should pass their own session
+    to keep connections alive between calls.
+    
     Args:
         items: Items to process
         process_func: Async function to process each item
@@ -296,6 +406,12 @@ async def process_with_progress(
         ascii: Whether to use ASCII characters for the progress bar
         leave: Whether to leave the progress bar after completion
         max_concurrency: Maximum number of concurrent tasks
+        session: Existing aiohttp session to pass to process_func
+        share_session: Create a session sized for max_concurrency when none
+            is given, closing it once all items are processed
+        refresh_rate: Minimum seconds between progress bar refreshes
+        count_entities: Items are batches; advance the progress bar by
+            len(item) so it reports entities rather than batches
         
     Returns:
         List of results in the same order as the input items
@@ -303,32 +419,67 @@ async def process_with_progress(
     if not items:
         return []
     
-    semaphore = asyncio.Semaphore(max_concurrency)
+    # Imported lazily to keep module import (and CLI startup) cheap
+    from tqdm import tqdm
     
-    async def process_with_semaphore(item: T) -> R:
-        async with semaphore:
-            return await process_func(item)
+    if count_entities:
+        weights = [len(cast(Sized, item)) for item in items]
+        total = sum(weights)
+    else:
+        weights = None
+        total = len(items)
     
-    tasks = [process_with_semaphore(item) for item in items]
+    owned_session: Optional["aiohttp.ClientSession"] = None
+    if session is None and share_session:
+        # Imported lazily: only needed when a session is created here
+        import aiohttp
+        owned_session = session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(
+                limit=max_concurrency,
+                ttl_dns_cache=300,
+                keepalive_timeout=30
+            )
+        )
     
-    # Process with progress bar
-    results = []
-    for task in tqdm_asyncio.as_completed(
-        tasks,
-        total=len(items),
+    semaphore = asyncio.Semaphore(max_concurrency)
+    # Results are stored by input index so completion order doesn't matter
+    results: list[Optional[R]] = [None] * len(items)
+    # A single bar owned here, advanced as each item finishes
+    progress = tqdm(
+        total=total,
         desc=description,
         unit=unit,
+        unit_scale=count_entities,
         ascii=ascii,
-        leave=leave
-    ):
-        result = await task
-        results.append(result)
+        leave=leave,
+        **_progress_options(total, refresh_rate)
+    )
+    
+    async def process_with_semaphore(index: int, item: T) -> None:
+        async with semaphore:
+            if session is None:
+                results[index] = await process_func(item)
+            else:
+                results[index] = await process_func(item, session)
+        progress.update(weights[index] if weights is not None else 1)
     
-    # Note: Using as_completed means results might not be in the same order as input
-    # This is acceptable for most use cases where order doesn't matter
-    # If order is important, the caller should handle reordering
+    # Schedule every item exactly once
+    tasks = [
+        asyncio.create_task(process_with_semaphore(i, item))
+        for i, item in enumerate(items)
+    ]
     
-    return results
+    try:
+        await asyncio.gather(*tasks)
+    finally:
+        # Don't leave other tasks running if one of them failed
+        for task in tasks:
+            task.cancel()
+        progress.close()
+        if owned_session is not None:
+            await owned_session.close()
+    
+    return cast(list[R], results)
 
 
 async def process_in_batches(
@@ -338,10 +489,12 @@ async def process_in_batches(
     description: str = "Processing batches",
     unit: str = "batch",
     ascii: bool = False,
-    leave: bool = True
+    leave: bool = True,
+    max_concurrency: int = 5,
+    refresh_rate: float = 0.5
 ) -> list[R]:
     """
-    Process items in batches with a progress bar.
+    Process items in concurrent batches with a progress bar.
     
     Args:
         items: Items to process
@@ -351,22 +504,60 @@ async def process_in_batches(
         unit: Unit name for the progress bar
         ascii: Whether to use ASCII characters for the progress bar
         leave: Whether to leave the progress bar after completion
+        max_concurrency: Maximum number of batches processed at once
+        refresh_rate: Minimum seconds between progress bar refreshes
         
     Returns:
-        Flattened list of results
+        Flattened list of results, in the same order as the input items
     """
     if not items:
         return []
     
-    # Create batches
-    batches = []
-    for i in range(0, len(items), batch_size):
-        batches.append(items[i:i+batch_size])
+    # Imported lazily to keep module import (and CLI startup) cheap
+    from tqdm.asyncio import tqdm_asyncio
+    
+    # Batch start offsets; each slice is only copied once its batch may run,
+    # so at most max_concurrency batch copies exist at a time
+    batch_starts = range(0, len(items), batch_size)
+    
+    semaphore = asyncio.Semaphore(max_concurrency)
+    # Batch results are stored by batch index so completion order doesn't matter
+    batch_results: list[Optional[list[R]]] = [None] * len(batch_starts)
+    
+    async def process_with_semaphore(index: int, start: int) -> None:
+        async with semaphore:
+            batch = items[start:start + batch_size]
+            batch_results[index] = await process_batch_func(batch)
+    
+    tasks = [
+        asyncio.create_task(process_with_semaphore(i, start))
+        for i, start in enumerate(batch_starts)
+    ]
     
     # Process batches with progress bar
-    results: list[R] = []
-    for batch in tqdm(batches, desc=description, unit=unit, ascii=ascii, leave=leave):
-        batch_results = await process_batch_func(batch)
-        results.extend(batch_results)
+    try:
+        for task in tqdm_asyncio.as_completed(
+            tasks,
+            total=len(batch_starts),
+            desc=description,
+            unit=unit,
+            ascii=ascii,
+            leave=leave,
+            **_progress_options(len(batch_starts), refresh_rate)
+        ):
+            await task
+    finally:
+        # Don't leave other batches running if one of them failed
+        for task in tasks:
+            task.cancel()
     
-    return results
\ No newline at end of file
+    # Flatten into a list preallocated for one result per item
+    results: list[Optional[R]] = [None] * len(items)
+    write_index = 0
+    for batch in cast(list[list[R]], batch_results):
+        count = len(batch)
+        results[write_index:write_index + count] = batch
+        write_index += count
+    if write_index < len(results):
+        del results[write_index:]
+    return cast(list[R], results)
\ No newline at end of file
@@ -3,13 +3,45 @@ Data validation for Recorded Future API payloads.
 Uses Python 3.10 type annotations and Pydantic v2 for schema validation.
 """
 
+import re
+from datetime import datetime
 # Use standard library typing (Python 3.10+)
 from typing import Any, Optional
 # Collections
 from collections.abc import Sequence, Mapping
 
 # Pydantic imports
-from pydantic import BaseModel, Field, ValidationError, model_validator
+from pydantic import BaseModel, Field, TypeAdapter, ValidationError, model_validator
+
+# Allowed type values, as ordered tuples for error messages and frozensets for lookups
+_IOC_TYPES = ("ip", "domain", "hash", "vulnerability", "url")
+_IOC_TYPE_SET = frozenset(_IOC_TYPES)
+_IOC_TYPE_ERROR = f"IoC type must be one of: {', '.join(_IOC_TYPES)}"
+
+_DETECTION_TYPES = ("correlation", "playbook", "detection_rule", "sandbox")
+_DETECTION_TYPE_SET = frozenset(_DETECTION_TYPES)
+_DETECTION_TYPE_ERROR = (
+    f"Detection type must be one of: {', '.join(_DETECTION_TYPES)} "
+    f"or start with 'detector_'"
+)
+
+_TIMESTAMP_ERROR = "Timestamp must be in ISO 8601 format (YYYY-MM-DDThh:mm:ssZ)"
+
+# RFC 3339 UTC timestamps: extended format, optional 1-9 fraction digits, 'Z'.
+# Matched explicitly because datetime.fromisoformat accepts more on 3.11+ than on 3.10
+_UTC_TIMESTAMP_RE = re.compile(r"[0-9]{4}-[0-9]{2}-[0-9]{2}T[0-9]{2}:[0-9]{2}:[0-9]{2}(?:\.[0-9]{1,9})?Z")
+
+
+def _is_utc_timestamp(timestamp: str) -> bool:
+    """Check for an RFC 3339 UTC timestamp whose date and time are in range."""
+    if not _UTC_TIMESTAMP_RE.fullmatch(timestamp):
+        return False
+    try:
+        # The seconds-precision prefix parses the same on every supported Python
+        datetime.fromisoformat(timestamp[:19])
+    except ValueError:
+        return False
+    return True
 
 
 class IoC(BaseModel):
@@ -22,9 +54,8 @@ class IoC(BaseModel):
     @model_validator(mode='after')
     def validate_ioc_type(self) -> 'IoC':
         """Validate IoC type is one of the allowed values."""
-        allowed_types = ["ip", "domain", "hash", "vulnerability", "url"]
-        if self.type not in allowed_types:
-            raise ValueError(f"IoC type must be one of: {', '.join(allowed_types)}")
+        if self.type not in _IOC_TYPE_SET:
+            raise ValueError(_IOC_TYPE_ERROR)
         if not self.value:
             raise ValueError("IoC value cannot be empty")
         return self
@@ -47,10 +78,8 @@ class Detection(BaseModel):
     @model_validator(mode='after')
     def validate_detection_rule(self) -> 'Detection':
         """Validate that detection_rule type has a sub_type."""
-        allowed_types = ["correlation", "playbook", "detection_rule", "sandbox"]
-        if self.type not in allowed_types and not self.type.startswith("detector_"):
-            raise ValueError(f"Detection type must be one of: {', '.join(allowed_types)} " 
-                             f"or start with 'detector_'")
+        if self.type not in _DETECTION_TYPE_SET and not self.type.startswith("detector_"):
+            raise ValueError(_DETECTION_TYPE_ERROR)
                              
         if self.type == "detection_rule" and not self.sub_type:
             raise ValueError("'sub_type' is required when type is 'detection_rule'")
@@ -69,11 +98,8 @@ class DataEntry(BaseModel):
     @model_validator(mode='after')
     def validate_timestamp(self) -> 'DataEntry':
         """Validate timestamp is in ISO 8601 format."""
-        if self.timestamp:
-            # Very basic ISO8601 validation
-            if not (self.timestamp.endswith('Z') and 'T' in self.timestamp and 
-                    self.timestamp.replace('T', ':').replace('Z', ':').replace('-', ':').count(':') >= 5):
-                raise ValueError("Timestamp must be in ISO 8601 format (YYYY-MM-DDThh:mm:ssZ)")
+        if self.timestamp and not _is_utc_timestamp(self.timestamp):
+            raise ValueError(_TIMESTAMP_ERROR)
         return self
 
 
@@ -90,6 +116,40 @@ class ApiPayload(BaseModel):
     organization_ids: Optional[list[str]] = None
 
 
+# Shared validators, built once at import
+_PAYLOAD_ADAPTER = TypeAdapter(ApiPayload)
+_ENTRIES_ADAPTER = TypeAdapter(list[DataEntry])
+
+
+def _format_validation_error(e: ValidationError, offset: Optional[int] = None) -> str:
+    """
+    Format the first error of a ValidationError as a user-facing message.
+
+    Args:
+        e: The validation error
+        offset: Index of the first entry when e comes from a chunk of 'data'
+
+    Returns:
+        Error message string
+    """
+    if not e.error_count():
+        # This case is extremely rare and mainly for defensive programming
+        # Occurs if ValidationError is raised but no errors were collected
+        return "Unknown validation error"
+
+    # Get the first error for simplicity; skip URL, context and input
+    # serialization since only the location and message are reported
+    error = e.errors(include_url=False, include_context=False, include_input=False)[0]
+    loc = error["loc"]
+    if offset is not None:
+        # Chunk-relative entry index -> location within the full payload
+        loc = ("data", offset + loc[0], *loc[1:])
+    location = ".".join(str(part) for part in loc)
+    message = error["msg"]
+
+    return f"Validation error at '{location}': {message}"
+
+
 def validate_payload(payload: Mapping[str, Any]) -> Optional[str]:
     """
     Validate a payload dictionary for the Detection API using Pydantic models.
@@ -101,19 +161,28 @@ def validate_payload(payload: Mapping[str, Any]) -> Optional[str]:
         An error message string if invalid, or None if valid
     """
     try:
-        ApiPayload(**payload)
+        _PAYLOAD_ADAPTER.validate_python(payload)
         return None
     except ValidationError as e:
-        # Format validation errors nicely
-        errors = e.errors()
-        if not errors:
-            # This case is extremely rare and mainly for defensive programming
-            # Occurs if ValidationError is raised but no errors were collected
-            return "Unknown validation error"
-            
-        # Get the first error for simplicity
-        error = errors[0]
-        location = ".".join(str(loc) for loc in error["loc"])
-        message = error["msg"]
-        
-        return f"Validation error at '{location}': {message}"
\ No newline at end of file
+        return _format_validation_error(e)
+
+
+def validate_entries(entries: Sequence[Any], offset: int = 0) -> Optional[str]:
+    """
+    Validate a chunk of a payload's data entries.
+
+    Error locations are reported relative to the full payload, e.g.
+    'data.1200.ioc' for the first entry of a chunk starting at 1200.
+
+    Args:
+        entries: Chunk of the payload's data list
+        offset: Index of the chunk's first entry within the data list
+
+    Returns:
+        An error message string if invalid, or None if valid
+    """
+    try:
+        _ENTRIES_ADAPTER.validate_python(entries)
+        return None
+    except ValidationError as e:
+        return _format_validation_error(e, offset)
@@ -0,0 +1,129 @@
+"""
+Fast-path validation for raw Recorded Future API payloads.
+
+Decodes and validates raw JSON in a single pass with msgspec when it is
+installed, or validates an already decoded payload with msgspec.convert.
+Pydantic (see validators.py) stays the authority: msgspec is
+stricter than Pydantic's lax mode, so a payload it rejects is re-validated
+with the Pydantic models, which decide the result and the message.
+"""
+
+import json
+from typing import Annotated, Any, Literal, Optional, Union
+
+from sendDetections.validators import (
+    _DETECTION_TYPE_SET,
+    _is_utc_timestamp,
+    validate_payload,
+)
+
+# Optional msgspec support for single-pass decode and validation
+try:
+    import msgspec
+    from msgspec import Meta, Struct
+    MSGSPEC_AVAILABLE = True
+except ImportError:
+    MSGSPEC_AVAILABLE = False
+
+
+if MSGSPEC_AVAILABLE:
+    _NonEmptyStr = Annotated[str, Meta(min_length=1)]
+
+    class _IoC(Struct):
+        type: Literal["ip", "domain", "hash", "vulnerability", "url"]
+        value: _NonEmptyStr
+        source_type: Optional[str] = None
+        field: Optional[str] = None
+
+    class _Incident(Struct):
+        id: Optional[str] = None
+        name: Optional[str] = None
+        type: Optional[str] = None
+
+    class _Detection(Struct):
+        type: str
+        id: Optional[str] = None
+        name: Optional[str] = None
+        sub_type: Optional[str] = None
+
+        def __post_init__(self) -> None:
+            if self.type not in _DETECTION_TYPE_SET and not self.type.startswith("detector_"):
+                raise ValueError("invalid detection type")
+            if self.type == "detection_rule" and not self.sub_type:
+                raise ValueError("missing sub_type")
+
+    class _DataEntry(Struct):
+        ioc: _IoC
+        detection: _Detection
+        timestamp: Optional[str] = None
+        incident: Optional[_Incident] = None
+        mitre_codes: Optional[list[str]] = None
+        malwares: Optional[list[str]] = None
+
+        def __post_init__(self) -> None:
+            if self.timestamp and not _is_utc_timestamp(self.timestamp):
+                raise ValueError("invalid timestamp")
+
+    class _ApiOptions(Struct):
+        debug: bool = False
+        summary: bool = True
+
+    class _ApiPayload(Struct):
+        data: Annotated[list[_DataEntry], Meta(min_length=1)]
+        options: Optional[_ApiOptions] = None
+        organization_ids: Optional[list[str]] = None
+
+    _DECODER = msgspec.json.Decoder(_ApiPayload)
+
+
+def _validate_slow(raw: Union[bytes, str]) -> Optional[str]:
+    """Decode with the json module and validate with the Pydantic models."""
+    try:
+        payload = json.loads(raw)
+    except json.JSONDecodeError as e:
+        return f"Invalid JSON: {e}"
+    return validate_payload(payload)
+
+
+def validate_payload_fast(raw: Union[bytes, str]) -> Optional[str]:
+    """
+    Validate a raw JSON payload without building intermediate dictionaries.
+
+    Args:
+        raw: JSON-encoded payload as read from disk or the wire
+
+    Returns:
+        The result validate_payload returns for the decoded payload, or an
+        "Invalid JSON" message if raw cannot be decoded
+    """
+    if not MSGSPEC_AVAILABLE:
+        return _validate_slow(raw)
+
+    try:
+        _DECODER.decode(raw)
+    except msgspec.MsgspecError:
+        # Rejected: defer to Pydantic, which may still accept the payload
+        # through lax coercion (e.g. "true" for a bool option)
+        return _validate_slow(raw)
+    return None
+
+
+def validate_parsed_fast(payload: Any) -> Optional[str]:
+    """
+    Validate an already decoded payload without decoding its JSON again.
+
+    Args:
+        payload: Decoded payload, as returned by json.loads
+
+    Returns:
+        The result validate_payload returns for payload
+    """
+    if not MSGSPEC_AVAILABLE:
+        return validate_payload(payload)
+
+    try:
+        msgspec.convert(payload, _ApiPayload)
+    except msgspec.MsgspecError:
+        # Rejected: defer to Pydantic, as validate_payload_fast does
+        return validate_payload(payload)
+    return None
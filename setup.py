@@ -41,6 +41,8 @@ setup(
             "pytest>=7.0.0",
             "pytest-cov>=4.1.0",
             "hypothesis>=6.80.0",
+            "ijson>=3.1.0",
+            "msgspec>=0.18.0",
             "pylint>=2.15.0",
             "mypy>=1.0.0",
             "black>=23.0.0"
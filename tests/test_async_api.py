@@ -8,6 +8,8 @@ Tests for the asynchronous API client and batch processor.
 import asyncio
 import json
 import os
+import threading
+import time
 import pytest
 from pathlib import Path
 from unittest.mock import patch, MagicMock, AsyncMock
@@ -17,7 +19,7 @@ from aiohttp.client_reqrep import ClientResponse
 from aiohttp.helpers import TimerNoop
 from aiohttp import ClientSession, ClientResponseError
 
-from sendDetections.async_api_client import AsyncApiClient
+from sendDetections.async_api_client import AsyncApiClient, _AdmissionController, _merge_summaries
 from sendDetections.batch_processor import BatchProcessor
 from sendDetections.errors import (
     ApiAuthenticationError, ApiRateLimitError, ApiServerError,
@@ -34,7 +36,8 @@ def test_async_api_client_init():
     assert client.max_concurrent == 5
     assert client.timeout == 30.0
     assert client.retry_status_codes == [429, 500, 502, 503, 504]
-    assert client._semaphore is None  # Semaphore is created on first use
+    assert client._admission is None  # Admission controller is created on first use
+    assert client._session is None  # Session is created on first use
 
 
 def test_async_api_client_custom_init():
@@ -57,24 +60,94 @@ def test_async_api_client_custom_init():
     assert client.max_concurrent == 10
 
 
-# Simplified test with direct access
-def test_semaphore_management():
-    """Test direct semaphore property access and management."""
-    # Create client with specific max_concurrent value
-    client = AsyncApiClient(api_token="test_token", max_concurrent=7)
+@pytest.mark.asyncio
+async def test_admission_controller():
+    """Test the admission controller counts active requests and can be resized."""
+    client = AsyncApiClient(api_token="test_token", max_concurrent=1)
+    
+    # Initially, no controller exists
+    assert client._admission is None
+    
+    controller = _AdmissionController(1)
+    client._admission = controller
+    
+    await controller.acquire()
+    assert controller.active == 1
+    
+    # A second request waits while the limit is reached
+    waiter = asyncio.create_task(controller.acquire())
+    await asyncio.sleep(0)
+    assert not waiter.done()
+    
+    # Raising the limit admits it without any release
+    await client.set_max_concurrent(2)
+    await asyncio.wait_for(waiter, 1)
+    assert client.max_concurrent == controller.limit == 2
+    assert controller.active == 2
+    
+    # Lowering the limit holds new requests until enough finish
+    await controller.set_limit(1)
+    waiter = asyncio.create_task(controller.acquire())
+    await controller.release()
+    await asyncio.sleep(0)
+    assert not waiter.done()
+    await controller.release()
+    await asyncio.wait_for(waiter, 1)
+    assert controller.active == 1
+    
+    # A cancelled waiter leaves the count untouched
+    waiter = asyncio.create_task(controller.acquire())
+    await asyncio.sleep(0)
+    waiter.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await waiter
+    assert controller.active == 1
+
+
+# Test the shared session is reused until the client is closed
+@pytest.mark.asyncio
+async def test_session_reuse_and_close():
+    async with AsyncApiClient(api_token="test_token", max_concurrent=3) as client:
+        assert client._session is None
+        
+        session = await client._get_session()
+        assert await client._get_session() is session
+        assert session.connector.limit_per_host == 3
     
-    # Initially, semaphore is None
-    assert client._semaphore is None
+    assert session.closed
+    assert client._session is None
+
+
+@pytest.mark.asyncio
+async def test_send_data_reuses_connection():
+    """Test sequential send_data calls share one pooled keep-alive connection."""
+    from aiohttp import web
+    from aiohttp.test_utils import TestServer
     
-    # Manually set the semaphore and check it can be accessed
-    test_semaphore = asyncio.Semaphore(7)
-    client._semaphore = test_semaphore
-    assert client._semaphore is test_semaphore
+    peers = []
     
-    # Create a new client and verify defaults
-    default_client = AsyncApiClient(api_token="token")
-    assert default_client._semaphore is None
-    assert default_client.max_concurrent == 5  # Default value
+    async def handler(request):
+        peers.append(request.transport.get_extra_info("peername"))
+        return web.json_response({"summary": {"submitted": 1, "processed": 1, "dropped": 0}})
+    
+    app = web.Application()
+    app.router.add_post("/", handler)
+    payload = {
+        "data": [{
+            "ioc": {"type": "ip", "value": "1.2.3.4"},
+            "detection": {"type": "correlation"}
+        }]
+    }
+    
+    async with TestServer(app) as server:
+        async with AsyncApiClient(api_token="test_token", api_url=str(server.make_url("/"))) as client:
+            await client.send_data(payload)
+            connector = client._session.connector
+            await client.send_data(payload)
+            assert client._session.connector is connector
+    
+    assert len(peers) == 2
+    assert peers[0] == peers[1]  # Same client socket for both requests
 
 
 # Test validating payload with invalid data
@@ -131,6 +204,13 @@ def test_add_default_options():
     # Test with debug flag
     result = client.add_default_options(payload_without_options, debug=True)
     assert result["options"]["debug"] is True
+    
+    # The input payload is left untouched and its data list is shared
+    payload_with_options["options"]["debug"] = False
+    result = client.add_default_options(payload_with_options, debug=True)
+    assert result["options"]["debug"] is True
+    assert payload_with_options["options"]["debug"] is False
+    assert result["data"] is payload_with_options["data"]
 
 
 # Test the HTTP error handler directly
@@ -309,8 +389,21 @@ def test_configuration_and_file_errors():
     assert file_err.file_path == "/path/to/file.txt"
 
 
+def _scripted_send(outcomes):
+    """Build a send_data stand-in that returns, or raises, each outcome in turn."""
+    outcomes = iter(outcomes)
+    
+    async def fake_send(payload, debug=False, retry=True, validate=True):
+        outcome = next(outcomes)
+        if isinstance(outcome, Exception):
+            raise outcome
+        return outcome
+    
+    return fake_send
+
+
 @pytest.mark.asyncio
-async def test_async_batch_send():
+async def test_async_batch_send(monkeypatch):
     """Test batch_send method in AsyncApiClient."""
     # Create test payloads
     payloads = [
@@ -365,17 +458,156 @@ async def test_async_batch_send():
     # Create client
     client = AsyncApiClient(api_token="test_token")
     
-    # Mock send_data to return expected responses
-    with patch.object(client, 'send_data', side_effect=responses):
-        result = await client.batch_send(payloads)
+    # Stub send_data to return expected responses
+    monkeypatch.setattr(client, "send_data", _scripted_send(responses))
+    result = await client.batch_send(payloads)
+    
+    # Verify result
+    assert len(result) == 2
+    assert result == responses
+
+
+@pytest.mark.asyncio
+async def test_async_batch_send_bounds_concurrency():
+    """Test batch_send keeps at most max_concurrent requests in flight."""
+    in_flight = 0
+    peak = 0
+    
+    class FakeResponse:
+        status = 200
+        
+        async def __aenter__(self):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            return self
+        
+        async def __aexit__(self, *exc_info):
+            nonlocal in_flight
+            in_flight -= 1
+        
+        async def read(self):
+            return b'{"summary": {"submitted": 1, "processed": 1, "dropped": 0}}'
+    
+    session = MagicMock()
+    session.post.side_effect = lambda *args, **kwargs: FakeResponse()
+    
+    client = AsyncApiClient(api_token="test_token", max_concurrent=3)
+    payload = {
+        "data": [{"ioc": {"type": "ip", "value": "1.2.3.4"},
+                  "detection": {"type": "playbook"}}]
+    }
+    
+    with patch.object(client, "_get_session", AsyncMock(return_value=session)):
+        results = await client.batch_send([payload] * 12)
+    
+    assert len(results) == 12
+    assert session.post.call_count == 12
+    assert peak == 3
+
+
+def _scripted_session(statuses):
+    """Build a fake session whose posts answer with the given status codes."""
+    responses = iter(statuses)
+    
+    class FakeResponse:
+        def __init__(self, status):
+            self.status = status
+            self.headers = {}
+        
+        async def __aenter__(self):
+            return self
+        
+        async def __aexit__(self, *exc_info):
+            pass
+        
+        async def text(self):
+            return '{"message": "scripted"}'
         
-        # Verify result
-        assert len(result) == 2
-        assert result == responses
+        async def read(self):
+            return b'{"summary": {"submitted": 1, "processed": 1, "dropped": 0}}'
+    
+    session = MagicMock()
+    session.post.side_effect = lambda *args, **kwargs: FakeResponse(next(responses))
+    return session
+
+
+@pytest.mark.asyncio
+async def test_send_data_retries_server_errors_with_backoff():
+    """Test 5xx responses are retried after a jittered, capped backoff."""
+    client = AsyncApiClient(api_token="test_token", retry_delay=1.0, max_retries=3)
+    session = _scripted_session([503, 502, 200])
+    payload = {
+        "data": [{"ioc": {"type": "ip", "value": "1.2.3.4"},
+                  "detection": {"type": "playbook"}}]
+    }
+    
+    with patch.object(client, "_get_session", AsyncMock(return_value=session)), \
+         patch("sendDetections.async_api_client.asyncio.sleep", AsyncMock()) as mock_sleep:
+        result = await client.send_data(payload)
+    
+    assert result["summary"]["processed"] == 1
+    assert session.post.call_count == 3
+    # Every attempt carries the same idempotency key
+    keys = {call.kwargs["headers"]["Idempotency-Key"] for call in session.post.call_args_list}
+    assert len(keys) == 1
+    
+    # A separate submission of the same payload gets a new key
+    session = _scripted_session([200])
+    with patch.object(client, "_get_session", AsyncMock(return_value=session)):
+        await client.send_data(payload)
+    assert session.post.call_args.kwargs["headers"]["Idempotency-Key"] not in keys
+    delays = [call.args[0] for call in mock_sleep.await_args_list]
+    assert 0.5 <= delays[0] <= 1.5
+    assert 1.0 <= delays[1] <= 3.0
+    
+    # The cap applies before jitter
+    client = AsyncApiClient(api_token="test_token", retry_delay=1.0, max_backoff=4.0, jitter=0.25)
+    assert all(3.0 <= client._backoff_delay(attempt) <= 5.0 for attempt in range(2, 8))
 
 
 @pytest.mark.asyncio
-async def test_async_batch_send_with_exceptions():
+async def test_send_data_waits_at_least_retry_after():
+    """Test rate-limited retries never wait less than the server's Retry-After."""
+    client = AsyncApiClient(api_token="test_token", retry_delay=0.1, max_retries=3)
+    payload = {
+        "data": [{"ioc": {"type": "ip", "value": "1.2.3.4"},
+                  "detection": {"type": "playbook"}}]
+    }
+    rate_limited = ApiRateLimitError("Rate limit exceeded", 429, retry_after=2)
+    success = {"summary": {"submitted": 1, "processed": 1, "dropped": 0}}
+    
+    with patch.object(client, "_handle_http_error", AsyncMock(side_effect=rate_limited)), \
+         patch.object(client, "_get_session", AsyncMock(return_value=_scripted_session([429, 429, 200]))), \
+         patch("sendDetections.async_api_client.asyncio.sleep", AsyncMock()) as mock_sleep:
+        result = await client.send_data(payload)
+    
+    assert result == success
+    delays = [call.args[0] for call in mock_sleep.await_args_list]
+    assert len(delays) == 2
+    assert all(delay >= 2 for delay in delays)
+
+
+@pytest.mark.asyncio
+async def test_send_data_does_not_retry_auth_errors():
+    """Test unrecoverable errors are raised on the first attempt."""
+    client = AsyncApiClient(api_token="test_token", max_retries=3)
+    session = _scripted_session([401])
+    payload = {
+        "data": [{"ioc": {"type": "ip", "value": "1.2.3.4"},
+                  "detection": {"type": "playbook"}}]
+    }
+    
+    with patch.object(client, "_get_session", AsyncMock(return_value=session)):
+        with pytest.raises(ApiAuthenticationError):
+            await client.send_data(payload)
+    
+    assert session.post.call_count == 1
+
+
+@pytest.mark.asyncio
+async def test_async_batch_send_with_exceptions(monkeypatch):
     """Test batch_send method with return_exceptions=True."""
     # Create test payloads
     payloads = [
@@ -423,16 +655,17 @@ async def test_async_batch_send_with_exceptions():
     
     error = ApiConnectionError("Connection failed")
     
-    # Mock side_effect with mix of response and error
-    with patch.object(client, 'send_data', side_effect=[success_response, error]):
-        # Test with return_exceptions=True
-        result = await client.batch_send(payloads, return_exceptions=True)
-        
-        # Verify result contains the response and the exception
-        assert len(result) == 2
-        assert result[0] == success_response
-        assert isinstance(result[1], ApiConnectionError)
-        assert str(result[1]) == "Connection failed"
+    # Stub send_data with a mix of response and error
+    monkeypatch.setattr(client, "send_data", _scripted_send([success_response, error]))
+    
+    # Test with return_exceptions=True
+    result = await client.batch_send(payloads, return_exceptions=True)
+    
+    # Verify result contains the response and the exception
+    assert len(result) == 2
+    assert result[0] == success_response
+    assert isinstance(result[1], ApiConnectionError)
+    assert str(result[1]) == "Connection failed"
 
 
 @pytest.mark.asyncio
@@ -503,7 +736,7 @@ async def test_batch_send_with_debug_and_retry_options():
 
         
 @pytest.mark.asyncio
-async def test_async_batch_send_raises_exception():
+async def test_async_batch_send_raises_exception(monkeypatch):
     """Test batch_send method with return_exceptions=False (default)."""
     # Create test payloads
     payloads = [
@@ -543,14 +776,15 @@ async def test_async_batch_send_raises_exception():
     # Mock send_data to raise an exception for the first payload
     error = ApiServerError("Server error", 500)
     
-    with patch.object(client, 'send_data', side_effect=[error]):
-        # Test with return_exceptions=False (default)
-        with pytest.raises(ApiServerError) as excinfo:
-            await client.batch_send(payloads)
-        
-        # Verify the exception is propagated
-        assert "Server error" in str(excinfo.value)
-        assert excinfo.value.status_code == 500
+    monkeypatch.setattr(client, "send_data", _scripted_send([error]))
+    
+    # Test with return_exceptions=False (default)
+    with pytest.raises(ApiServerError) as excinfo:
+        await client.batch_send(payloads)
+    
+    # Verify the exception is propagated
+    assert "Server error" in str(excinfo.value)
+    assert excinfo.value.status_code == 500
 
 
 @pytest.mark.asyncio
@@ -728,6 +962,34 @@ async def test_split_and_send_custom_batch_size():
         assert result["summary"]["processed"] == 25
         assert result["summary"]["dropped"] == 0
 
+
+
+@pytest.mark.asyncio
+async def test_split_and_send_validates_once():
+    """Test split_and_send validates the payload once, not again per batch."""
+    client = AsyncApiClient(api_token="test_token")
+    session = _scripted_session([200] * 3)
+    entry = {
+        "ioc": {"type": "ip", "value": "1.2.3.4"},
+        "detection": {"type": "correlation"}
+    }
+    payload = {"data": [entry] * 5, "organization_ids": ["uhash:abc"]}
+    
+    with patch.object(client, "_get_session", AsyncMock(return_value=session)), \
+         patch("sendDetections.async_api_client.validate_payload",
+               wraps=client.validate_payload) as mock_validate:
+        result = await client.split_and_send(payload, batch_size=2, debug=True)
+    
+    mock_validate.assert_called_once()
+    assert session.post.call_count == 3
+    assert result["summary"] == {"submitted": 3, "processed": 3, "dropped": 0}
+    
+    bodies = [json.loads(call.kwargs["data"]) for call in session.post.call_args_list]
+    assert [len(body["data"]) for body in bodies] == [2, 2, 1]
+    assert all(body["options"]["debug"] is True for body in bodies)
+    assert all(body["organization_ids"] == ["uhash:abc"] for body in bodies)
+    assert "options" not in payload
+
         
 @pytest.mark.asyncio
 async def test_split_and_send_validation_error():
@@ -749,60 +1011,162 @@ async def test_split_and_send_validation_error():
         await client.split_and_send(invalid_payload)
 
 
-# The empty_payload test needs to be fixed in the implementation
-# Let's remove it for now and focus on fixing the existing tests
+def test_merge_summaries():
+    """Test batch summaries are summed, including counts beyond the standard three."""
+    results = [
+        {"summary": {"submitted": 2, "processed": 1, "dropped": 1, "duplicates": 1}},
+        {},
+        {"summary": {"submitted": 3, "processed": 3, "dropped": 0, "partial": True}},
+        {"summary": {"submitted": 2, "processed": 2, "duplicates": 1}}
+    ]
+    assert _merge_summaries(results) == {
+        "summary": {"submitted": 7, "processed": 6, "dropped": 1, "duplicates": 2}
+    }
+
 
-# The test would verify that with an empty data array (after extraction),
-# the method should return a response with zero counts in the summary.
-# This is tested indirectly in other test cases.
+@pytest.mark.asyncio
+async def test_split_and_send_empty_payload():
+    """Test an empty data array is rejected, as send_data rejects it."""
+    client = AsyncApiClient(api_token="test_token")
+    
+    with patch.object(client, 'batch_send') as mock_batch_send:
+        with pytest.raises(PayloadValidationError):
+            await client.split_and_send({"data": []})
+        with pytest.raises(PayloadValidationError):
+            await client.send_data({"data": []})
+    
+    mock_batch_send.assert_not_called()
+    
+    # A missing data field is a validation error too
+    with pytest.raises(PayloadValidationError):
+        await client.split_and_send({})
 
 
-# Test BatchProcessor methods
 @pytest.mark.asyncio
-async def test_batch_processor_process_files(tmp_path):
-    """Test BatchProcessor process_files method."""
-    # Create test JSON files
-    file1 = tmp_path / "file1.json"
-    file2 = tmp_path / "file2.json"
+async def test_send_data_auto_batch():
+    """Test auto-batching merges concurrent sends and shares the merged response."""
+    client = AsyncApiClient(api_token="test_token", auto_batch=True, max_wait_ms=5)
+    entry = {
+        "ioc": {"type": "ip", "value": "1.2.3.4"},
+        "detection": {"type": "correlation"}
+    }
+    
+    async def fake_post(payload, retry=True):
+        count = len(payload["data"])
+        return {"summary": {"submitted": count, "processed": count - 1, "dropped": 1}}
+    
+    with patch.object(client, "_post", AsyncMock(side_effect=fake_post)) as mock_post:
+        results = await asyncio.gather(
+            client.send_data({"data": [entry]}),
+            client.send_data({"data": [entry] * 2}),
+            client.send_data({"data": [entry] * 3}),
+            client.send_data({"data": [entry]}, debug=True)
+        )
+    
+    # Payloads with the same options share one request
+    assert mock_post.call_count == 2
+    merged = mock_post.call_args_list[0].args[0]
+    assert len(merged["data"]) == 6
+    
+    # Callers of a merged request get the merged summary, marked with its id
+    for result in results[:3]:
+        assert result["summary"] == {"submitted": 6, "processed": 5, "dropped": 1}
+        assert result["shared"] == results[0]["shared"]
+    assert isinstance(results[0]["shared"], str)
+    assert results[0]["summary"] is not results[1]["summary"]
+    
+    # A request carrying a single payload is not shared
+    assert results[3] == {"summary": {"submitted": 1, "processed": 0, "dropped": 1}}
+    
+    # A failed merged request fails every caller in it
+    with patch.object(client, "_post", AsyncMock(side_effect=ApiServerError("boom", 500))):
+        results = await asyncio.gather(
+            client.send_data({"data": [entry]}),
+            client.send_data({"data": [entry]}),
+            return_exceptions=True
+        )
+    assert all(isinstance(r, ApiServerError) for r in results)
+
+
+@pytest.mark.asyncio
+async def test_split_and_send_auto_batch_counts_once():
+    """Test batches merged by auto-batching are counted once in the merged summary."""
+    client = AsyncApiClient(api_token="test_token", auto_batch=True, max_wait_ms=5)
+    entry = {
+        "ioc": {"type": "ip", "value": "1.2.3.4"},
+        "detection": {"type": "correlation"}
+    }
+    
+    async def fake_post(payload, retry=True):
+        count = len(payload["data"])
+        return {"summary": {"submitted": count, "processed": count, "dropped": 0}}
+    
+    with patch.object(client, "_post", AsyncMock(side_effect=fake_post)) as mock_post:
+        result = await client.split_and_send({"data": [entry] * 50}, batch_size=10)
     
-    # Write test data
-    file1_data = {
+    # All five batches went out as one merged request
+    assert mock_post.call_count == 1
+    assert result["summary"] == {"submitted": 50, "processed": 50, "dropped": 0}
+
+
+# Sample payload files are read-only, so they are written once per session
+@pytest.fixture(scope="session")
+def sample_json_files(tmp_path_factory):
+    data_dir = tmp_path_factory.mktemp("data")
+    file1 = data_dir / "file1.json"
+    file2 = data_dir / "file2.json"
+    large = data_dir / "large.json"
+    
+    file1.write_text(json.dumps({
         "data": [
             {
                 "ioc": {"type": "ip", "value": "1.2.3.4"},
                 "detection": {"type": "playbook", "id": "test-id-1"}
             }
         ]
-    }
-    file2_data = {
+    }))
+    file2.write_text(json.dumps({
         "data": [
             {
                 "ioc": {"type": "domain", "value": "example.com"},
                 "detection": {"type": "playbook", "id": "test-id-2"}
             }
         ]
-    }
+    }))
+    large.write_text(json.dumps({
+        "data": [
+            {
+                "ioc": {"type": "ip", "value": f"192.168.0.{i}"},
+                "detection": {"type": "playbook", "id": f"test-id-{i}"}
+            }
+            for i in range(1, 6)  # Create 5 entries
+        ]
+    }))
     
-    with open(file1, "w") as f:
-        json.dump(file1_data, f)
-    with open(file2, "w") as f:
-        json.dump(file2_data, f)
+    return file1, file2, large
+
+
+# Test BatchProcessor methods
+@pytest.mark.asyncio
+async def test_batch_processor_process_files(sample_json_files, monkeypatch):
+    """Test BatchProcessor process_files method."""
+    file1, file2, _ = sample_json_files
     
     # Create processor
     processor = BatchProcessor(api_token="test_token", show_progress=False)
     
-    # Mock send_data method in AsyncApiClient
-    with patch.object(processor.client, 'send_data', side_effect=[
+    # Stub send_data on the processor's AsyncApiClient
+    monkeypatch.setattr(processor.client, "send_data", _scripted_send([
         {"summary": {"submitted": 1, "processed": 1, "dropped": 0}},
         {"summary": {"submitted": 1, "processed": 1, "dropped": 0}}
-    ]):
-        result = await processor.process_files([file1, file2])
-        
-        # Verify aggregated results
-        assert result["summary"]["submitted"] == 2
-        assert result["summary"]["processed"] == 2
-        assert result["summary"]["dropped"] == 0
-        assert "performance" in result
+    ]))
+    result = await processor.process_files([file1, file2])
+    
+    # Verify aggregated results
+    assert result["summary"]["submitted"] == 2
+    assert result["summary"]["processed"] == 2
+    assert result["summary"]["dropped"] == 0
+    assert "performance" in result
 
 
 @pytest.mark.asyncio
@@ -822,24 +1186,9 @@ async def test_batch_processor_process_files_error(tmp_path):
 
 
 @pytest.mark.asyncio
-async def test_batch_processor_process_large_file(tmp_path):
+async def test_batch_processor_process_large_file(sample_json_files):
     """Test BatchProcessor process_large_file method."""
-    # Create test JSON file with multiple entries
-    file_path = tmp_path / "large.json"
-    
-    # Create large payload
-    large_payload = {
-        "data": [
-            {
-                "ioc": {"type": "ip", "value": f"192.168.0.{i}"},
-                "detection": {"type": "playbook", "id": f"test-id-{i}"}
-            }
-            for i in range(1, 6)  # Create 5 entries
-        ]
-    }
-    
-    with open(file_path, "w") as f:
-        json.dump(large_payload, f)
+    _, _, file_path = sample_json_files
     
     # Create processor with batch_size=2
     processor = BatchProcessor(api_token="test_token", batch_size=2, show_progress=False)
@@ -860,6 +1209,97 @@ async def test_batch_processor_process_large_file(tmp_path):
         assert result == expected_result
 
 
+@pytest.mark.asyncio
+async def test_batch_processor_process_large_file_streaming(sample_json_files, monkeypatch):
+    """Test streamed large files are sent in batches with the same aggregated summary."""
+    pytest.importorskip("ijson")
+    _, _, file_path = sample_json_files
+    
+    # Stream every file, however small
+    monkeypatch.setattr("sendDetections.batch_processor._STREAM_THRESHOLD_BYTES", 0)
+    processor = BatchProcessor(api_token="test_token", batch_size=2, show_progress=False)
+    
+    async def fake_batch_send(batches, debug=False, validate=True):
+        return [
+            {"summary": {"submitted": len(b["data"]), "processed": len(b["data"]), "dropped": 0}}
+            for b in batches
+        ]
+    
+    with patch.object(processor.client, "batch_send", side_effect=fake_batch_send) as mock_batch_send:
+        result = await processor.process_large_file(file_path)
+    
+    assert result == {"summary": {"submitted": 5, "processed": 5, "dropped": 0}}
+    batches = [batch for call in mock_batch_send.call_args_list for batch in call.args[0]]
+    assert [len(batch["data"]) for batch in batches] == [2, 2, 1]
+
+
+@pytest.mark.asyncio
+async def test_batch_processor_stream_large_file_fields_and_validation(tmp_path, monkeypatch):
+    """Test streaming keeps top-level fields and sends nothing if a late entry is invalid."""
+    pytest.importorskip("ijson")
+    monkeypatch.setattr("sendDetections.batch_processor._STREAM_THRESHOLD_BYTES", 0)
+    entry = {"ioc": {"type": "ip", "value": "1.2.3.4"}, "detection": {"type": "playbook"}}
+    processor = BatchProcessor(api_token="test_token", batch_size=2,
+                               organization_id="uhash:org2", show_progress=False)
+    
+    # Top-level fields may follow the data array
+    file_path = tmp_path / "large.json"
+    file_path.write_text(json.dumps({
+        "data": [entry] * 3,
+        "options": {"debug": True, "summary": True},
+        "organization_ids": ["uhash:org1"]
+    }))
+    
+    async def fake_batch_send(batches, debug=False, validate=True):
+        return [{"summary": {"submitted": len(b["data"])}} for b in batches]
+    
+    with patch.object(processor.client, "batch_send", side_effect=fake_batch_send) as mock_batch_send:
+        result = await processor.process_large_file(file_path)
+    
+    assert result["summary"]["submitted"] == 3
+    batch = mock_batch_send.call_args_list[0].args[0][0]
+    assert batch["options"] == {"debug": True, "summary": True}
+    assert batch["organization_ids"] == ["uhash:org1", "uhash:org2"]
+    
+    # An invalid last entry fails the file before any batch is sent
+    file_path.write_text(json.dumps({"data": [entry] * 4 + [{"ioc": {"type": "bogus"}}]}))
+    with patch.object(processor.client, "batch_send", side_effect=fake_batch_send) as mock_batch_send:
+        with pytest.raises(PayloadValidationError):
+            await processor.process_large_file(file_path)
+    mock_batch_send.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_batch_processor_stream_large_file_cancelled(tmp_path, monkeypatch):
+    """Test cancelling a streamed send while a chunk is being parsed raises CancelledError."""
+    ijson = pytest.importorskip("ijson")
+    monkeypatch.setattr("sendDetections.batch_processor._STREAM_THRESHOLD_BYTES", 0)
+    entry = {"ioc": {"type": "ip", "value": "1.2.3.4"}, "detection": {"type": "playbook"}}
+    file_path = tmp_path / "large.json"
+    file_path.write_text(json.dumps({"data": [entry] * 3}))
+    processor = BatchProcessor(api_token="test_token", batch_size=2, show_progress=False)
+    
+    parsing = threading.Event()
+    finished = threading.Event()
+    
+    def slow_items(f, prefix, **kwargs):
+        # Only the send pass uses ijson.items; block it in the worker thread
+        parsing.set()
+        time.sleep(0.2)
+        finished.set()
+        yield entry
+    
+    monkeypatch.setattr(ijson, "items", slow_items)
+    task = asyncio.create_task(processor.process_large_file(file_path))
+    assert await asyncio.to_thread(parsing.wait, 5)
+    task.cancel()
+    
+    with pytest.raises(asyncio.CancelledError):
+        await task
+    # The generator was only closed after the worker's next() returned
+    assert finished.is_set()
+
+
 # Integration test with the CLI
 @pytest.mark.asyncio
 async def test_batch_command_help():
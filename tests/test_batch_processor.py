@@ -500,6 +500,206 @@ async def test_process_large_file_invalid_json():
             await processor.process_large_file(invalid_file)
 
 
+@pytest.mark.asyncio
+async def test_process_files_reports_first_failing_file():
+    """Test concurrent loading still raises the error of the first bad file in order."""
+    with tempfile.TemporaryDirectory() as tmpdirname:
+        tmpdir = Path(tmpdirname)
+        
+        valid_file = tmpdir / "valid.json"
+        valid_file.write_text(json.dumps({"data": []}))
+        invalid_file = tmpdir / "invalid.json"
+        invalid_file.write_text("{not valid json")
+        
+        processor = BatchProcessor(api_token="test_token", show_progress=False)
+        
+        with pytest.raises(FileNotFoundError):
+            await processor.process_files([valid_file, tmpdir / "missing.json", invalid_file])
+        
+        assert processor.metrics.errors_by_type == {"FileNotFoundError": 1}
+
+
+@pytest.mark.asyncio
+async def test_process_files_validates_while_loading():
+    """Test payloads are validated once on load and invalid files are reported, not sent."""
+    with tempfile.TemporaryDirectory() as tmpdirname:
+        tmpdir = Path(tmpdirname)
+        entry = {"ioc": {"type": "ip", "value": "1.2.3.4"}, "detection": {"type": "playbook"}}
+        
+        # Lax values Pydantic coerces are accepted on either validation path
+        valid_file = tmpdir / "valid.json"
+        valid_file.write_text(json.dumps({"data": [entry], "options": {"debug": "true", "summary": 1}}))
+        invalid_file = tmpdir / "invalid.json"
+        invalid_file.write_text(json.dumps({"data": [{"ioc": {"type": "bogus", "value": "x"},
+                                                      "detection": {"type": "playbook"}}]}))
+        
+        processor = BatchProcessor(api_token="test_token", show_progress=False)
+        
+        with patch.object(processor.client, "send_data", AsyncMock(return_value={
+            "summary": {"submitted": 1, "processed": 1, "dropped": 0}
+        })) as mock_send:
+            result = await processor.process_files([valid_file, invalid_file])
+        
+        mock_send.assert_awaited_once()
+        assert mock_send.call_args.kwargs["validate"] is False
+        assert result["summary"]["submitted"] == 1
+        assert processor.metrics.errors_by_type == {"PayloadValidationError": 1}
+
+
+@pytest.mark.asyncio
+async def test_process_files_sends_concurrently():
+    """Test payloads from different files are sent concurrently."""
+    with tempfile.TemporaryDirectory() as tmpdirname:
+        tmpdir = Path(tmpdirname)
+        entry = {"ioc": {"type": "ip", "value": "1.2.3.4"}, "detection": {"type": "playbook"}}
+        files = []
+        for i in range(4):
+            path = tmpdir / f"file{i}.json"
+            path.write_text(json.dumps({"data": [entry]}))
+            files.append(path)
+        
+        processor = BatchProcessor(api_token="test_token", show_progress=False)
+        in_flight = 0
+        peak = 0
+        
+        async def fake_send(payload, debug=False, validate=True):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return {"summary": {"submitted": 1, "processed": 1, "dropped": 0}}
+        
+        with patch.object(processor.client, "send_data", side_effect=fake_send):
+            result = await processor.process_files(files)
+        
+        assert result["summary"]["submitted"] == 4
+        assert peak > 1
+
+
+@pytest.mark.asyncio
+async def test_process_files_times_calls_after_admission():
+    """Test recorded call durations exclude time spent waiting for a free slot."""
+    with tempfile.TemporaryDirectory() as tmpdirname:
+        tmpdir = Path(tmpdirname)
+        entry = {"ioc": {"type": "ip", "value": "1.2.3.4"}, "detection": {"type": "playbook"}}
+        files = []
+        for i in range(4):
+            path = tmpdir / f"file{i}.json"
+            path.write_text(json.dumps({"data": [entry], "organization_ids": ["uhash:org1"]}))
+            files.append(path)
+        
+        processor = BatchProcessor(api_token="test_token", max_concurrent=1,
+                                   organization_id="uhash:org2", show_progress=False)
+        sent = []
+        
+        async def fake_send(payload, debug=False, validate=True):
+            sent.append(payload)
+            await asyncio.sleep(0.02)
+            return {"summary": {"submitted": 1, "processed": 1, "dropped": 0}}
+        
+        with patch.object(processor.client, "send_data", side_effect=fake_send):
+            await processor.process_files(files)
+        
+        # Queued files would otherwise record up to four calls' worth of time
+        assert max(processor.metrics.call_durations) < 0.06
+        assert all(p["organization_ids"] == ["uhash:org1", "uhash:org2"] for p in sent)
+
+
+@pytest.mark.asyncio
+async def test_auto_batched_summaries_counted_once():
+    """Test files and adaptive batches merged by the client are counted once."""
+    entry = {"ioc": {"type": "ip", "value": "1.2.3.4"}, "detection": {"type": "playbook"}}
+    processor = BatchProcessor(api_token="test_token", batch_size=2, adaptive=True, show_progress=False)
+    processor.client.auto_batch = True
+    
+    async def fake_post(payload, retry=True):
+        count = len(payload["data"])
+        return {"summary": {"submitted": count, "processed": count, "dropped": 0}}
+    
+    with patch.object(processor.client, "_post", AsyncMock(side_effect=fake_post)):
+        result = await processor.process_large_payload({"data": [entry] * 6})
+        assert result["summary"] == {"submitted": 6, "processed": 6, "dropped": 0}
+        
+        with tempfile.TemporaryDirectory() as tmpdirname:
+            files = []
+            for i in range(3):
+                path = Path(tmpdirname) / f"file{i}.json"
+                path.write_text(json.dumps({"data": [entry]}))
+                files.append(path)
+            result = await processor.process_files(files)
+        assert result["summary"] == {"submitted": 3, "processed": 3, "dropped": 0}
+
+
+def test_with_organization_id_copies_list():
+    """Test the caller's organization_ids list is not modified."""
+    processor = BatchProcessor(api_token="test_token", organization_id="uhash:org2")
+    ids = ["uhash:org1"]
+    
+    result = processor._with_organization_id({"data": [], "organization_ids": ids})
+    
+    assert result["organization_ids"] == ["uhash:org1", "uhash:org2"]
+    assert ids == ["uhash:org1"]
+
+
+@pytest.mark.asyncio
+async def test_session_kept_open_inside_context():
+    """Test the client session is only closed when the processor context exits."""
+    processor = BatchProcessor(api_token="test_token", show_progress=False)
+    payload = {"data": [{"ioc": {"type": "ip", "value": "1.2.3.4"},
+                         "detection": {"type": "playbook"}}]}
+    
+    with patch.object(processor.client, "close", AsyncMock()) as mock_close, \
+         patch.object(processor.client, "split_and_send", AsyncMock(return_value={})):
+        async with processor:
+            await processor.process_large_payload(payload)
+            await processor.process_large_payload(payload)
+            mock_close.assert_not_awaited()
+        mock_close.assert_awaited_once()
+        
+        # Outside a context, each call releases the session when done
+        await processor.process_large_payload(payload)
+        assert mock_close.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_adaptive_batch_size():
+    """Test adaptive batching shrinks slow batches and grows fast ones."""
+    processor = BatchProcessor(
+        api_token="test_token",
+        max_concurrent=2,
+        batch_size=40,
+        show_progress=False,
+        adaptive=True,
+        target_latency_ms=10,
+        min_batch_size=10,
+        max_batch_size=80
+    )
+    entry = {"ioc": {"type": "ip", "value": "1.2.3.4"}, "detection": {"type": "playbook"}}
+    payload = {"data": [entry] * 200}
+    sizes = []
+    
+    async def slow_batch_send(batches, debug=False, validate=True):
+        sizes.append([len(batch["data"]) for batch in batches])
+        await asyncio.sleep(0.03)
+        return [{"summary": {"submitted": len(b["data"]), "processed": len(b["data"]), "dropped": 0}}
+                for b in batches]
+    
+    with patch.object(processor.client, "batch_send", side_effect=slow_batch_send):
+        result = await processor.process_large_payload(payload)
+    
+    # Every entry is sent once, in batches halved after each slow round
+    assert result["summary"]["submitted"] == 200
+    assert sizes[:3] == [[40, 40], [20, 20], [10, 10]]
+    assert processor.batch_size == 10
+    
+    # Consistently fast batches grow the size back up to the maximum
+    processor.target_latency_ms = 1000
+    for _ in range(5):
+        processor._record_batch_latency(0.001)
+    assert processor.batch_size == 80
+
+
 @pytest.mark.asyncio
 async def test_organization_id_in_payload():
     """Test that organization_id is properly added to payloads."""
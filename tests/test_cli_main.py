@@ -15,7 +15,7 @@ from unittest.mock import patch, MagicMock, AsyncMock
 import pytest
 
 from sendDetections.__main__ import (
-    main, setup_argparse, handle_submit_command
+    main, setup_argparse, handle_submit_command, _run
 )
 
 
@@ -136,4 +136,26 @@ def test_unexpected_exception_handling(mock_configure_logging):
             # Simulate unexpected exception
             with patch('asyncio.run', side_effect=Exception("Unexpected error")):
                 exit_code = main()
-                assert exit_code == 1  # Error code
\ No newline at end of file
+                assert exit_code == 1  # Error code
+
+
+def test_run_uses_uvloop_when_installed():
+    """Test _run hands the coroutine to uvloop.run when uvloop is importable."""
+    async def command():
+        return 0
+    
+    fake_uvloop = MagicMock()
+    fake_uvloop.run.side_effect = lambda coro: coro.close() or 7
+    
+    with patch.dict(sys.modules, {"uvloop": fake_uvloop}), patch.object(sys, "platform", "linux"):
+        assert _run(command()) == 7
+    fake_uvloop.run.assert_called_once()
+
+
+def test_run_without_uvloop():
+    """Test _run falls back to asyncio.run when uvloop is missing."""
+    async def command():
+        return 3
+    
+    with patch.dict(sys.modules, {"uvloop": None}):
+        assert _run(command()) == 3
@@ -56,6 +56,18 @@ class TestErrorAnalyzer:
         assert "request" in result["suggestion"].lower() or "rate" in result["suggestion"].lower()
         assert "message" in result
     
+    def test_analyze_error_classification_cached(self):
+        """Test that repeated errors reuse the cached classification."""
+        analyzer = ErrorAnalyzer()
+        ErrorAnalyzer._classify.cache_clear()
+        
+        first = analyzer.analyze_error(ApiRateLimitError("Too many requests", 429))
+        second = analyzer.analyze_error(ApiRateLimitError("Too many requests", 429))
+        
+        assert first["type"] == second["type"] == "RateLimit"
+        assert first["suggestion"] == second["suggestion"]
+        assert ErrorAnalyzer._classify.cache_info().hits == 1
+    
     def test_analyze_batch(self):
         """Test analyzing a batch of errors."""
         analyzer = ErrorAnalyzer()
@@ -185,6 +197,15 @@ class TestErrorCollection:
         assert collection.errors[0]["file"] == "test.json"
         assert collection.errors[0]["line"] == 42
     
+    def test_errors_are_stored_entries(self):
+        """Test errors returns the stored entries, so changes to them persist."""
+        collection = ErrorCollection()
+        collection.add_error("Test error")
+        
+        assert collection.errors is collection.errors
+        collection.errors[0]["note"] = "checked"
+        assert collection.get_errors()[0]["note"] == "checked"
+    
     def test_get_errors_filtered(self):
         """Test getting errors filtered by type."""
         collection = ErrorCollection()
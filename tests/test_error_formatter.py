@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Tests for the error formatter module.
+"""
+
+from sendDetections.error_formatter import (
+    COLORS, ErrorFormatter, format_error, format_errors, print_errors
+)
+from sendDetections.errors import (
+    ApiAuthenticationError, ApiConnectionError, PayloadValidationError
+)
+
+
+class TestErrorFormatter:
+    """Tests for the ErrorFormatter class."""
+    
+    def test_plain_output(self):
+        """Test plain output has every section and no ANSI codes."""
+        formatter = ErrorFormatter(use_colors=False)
+        error = ApiAuthenticationError("Invalid token", 401, {"message": "Token expired"})
+        
+        text = formatter.format(error)
+        
+        assert "\033[" not in text
+        assert text.startswith("ERROR: API Authentication Error\n\n  Invalid token")
+        assert "Context:\n  Status code: 401\n  API message: Token expired" in text
+        assert "Suggestions:\n  1. Check that your API token is correct and not expired" in text
+    
+    def test_colored_output(self):
+        """Test colored output wraps the header, message and labels in ANSI codes."""
+        formatter = ErrorFormatter(use_colors=True)
+        
+        text = formatter.format(ApiAuthenticationError("Invalid token", 401))
+        
+        assert text.startswith(f"{COLORS['bold']}ERROR: API Authentication Error{COLORS['reset']}")
+        assert f"{COLORS['red']}  Invalid token{COLORS['reset']}" in text
+        assert f"{COLORS['cyan']}Status code:{COLORS['reset']} 401" in text
+        assert f"{COLORS['green']}1.{COLORS['reset']} Check" in text
+    
+    def test_colors_resolved_at_call_time(self):
+        """Test changing use_colors after construction takes effect."""
+        formatter = ErrorFormatter(use_colors=True)
+        error = ApiConnectionError("Connection refused")
+        colored = formatter.format(error)
+        
+        formatter.use_colors = False
+        plain = formatter.format(error)
+        
+        assert "\033[" in colored
+        assert "\033[" not in plain
+        assert plain.startswith("ERROR: API Connection Error")
+    
+    def test_long_message_wrapped(self):
+        """Test long text is wrapped to the terminal width."""
+        formatter = ErrorFormatter(use_colors=False, terminal_width=40)
+        error = PayloadValidationError("word " * 20)
+        
+        text = formatter.format(error)
+        
+        assert all(len(line) <= 40 for line in text.splitlines())
+    
+    def test_terminal_width_change(self):
+        """Test wrapping follows terminal_width after it changes."""
+        formatter = ErrorFormatter(use_colors=False, terminal_width=100)
+        error = PayloadValidationError("word " * 30, field_errors=[])
+        error.suggestions = ["suggestion " * 12]
+        wide = formatter.format(error)
+        
+        formatter.terminal_width = 40
+        narrow = formatter.format(error)
+        
+        assert max(len(line) for line in wide.splitlines()) > 40
+        assert all(len(line) <= 40 for line in narrow.splitlines())
+    
+    def test_exception_tail(self):
+        """Test standard exceptions end with the unexpected-error suggestions."""
+        formatter = ErrorFormatter(use_colors=False)
+        
+        text = formatter.format(ValueError("bad value"))
+        
+        assert text.startswith("ERROR: Python ValueError\n\n  bad value")
+        assert text.endswith("  3. Consider reporting this as a bug")
+    
+    def test_unknown_error(self):
+        """Test non-exception objects are formatted as unknown errors."""
+        formatter = ErrorFormatter(use_colors=False)
+        
+        text = formatter.format("something odd")
+        
+        assert text.startswith("ERROR: Unknown Error\n\n  something odd")
+        assert "This is an unexpected error of unknown type" in text
+
+
+def test_format_errors():
+    """Test format_errors yields the same text as format_error for each error."""
+    errors = [ValueError("first"), ApiConnectionError("second")]
+    
+    formatted = list(format_errors(errors, use_colors=False))
+    
+    assert formatted == [format_error(error, use_colors=False) for error in errors]
+
+
+def test_print_errors(capsys):
+    """Test print_errors writes each formatted error on its own lines."""
+    errors = [ValueError("first"), ValueError("second")]
+    
+    print_errors(errors, use_colors=False)
+    
+    out = capsys.readouterr().out
+    assert out == "".join(f"{format_error(e, use_colors=False)}\n" for e in errors)
+    assert out.count("ERROR: Python ValueError") == 2
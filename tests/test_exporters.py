@@ -13,7 +13,7 @@ from pathlib import Path
 
 import pytest
 
-from sendDetections.exporters import ResultExporter
+from sendDetections.exporters import ResultExporter, SUMMARY_FIELDS
 
 
 class TestResultExporter:
@@ -112,6 +112,21 @@ class TestResultExporter:
             # Verify correct filename was used
             assert json_path.name == custom_file
     
+    def test_export_json_failure_keeps_previous_file(self):
+        """Test a failed export leaves neither a partial nor a temporary file."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            tmp_path = Path(tmpdir)
+            exporter = ResultExporter(export_dir=tmp_path)
+            json_path = exporter.export_json({"ok": True}, filename="out.json")
+            
+            with pytest.raises(TypeError):
+                exporter.export_json({"bad": object()}, filename="out.json")
+            
+            # Previous content is intact and no temporary file is left behind
+            with open(json_path) as f:
+                assert json.load(f) == {"ok": True}
+            assert [p.name for p in tmp_path.iterdir()] == ["out.json"]
+    
     def test_export_summary_csv(self, sample_results):
         """Test exporting summary to CSV."""
         with tempfile.TemporaryDirectory() as tmpdir:
@@ -137,6 +152,24 @@ class TestResultExporter:
                 for field in expected_fields:
                     assert field in rows[0]
     
+    def test_export_summary_csv_fixed_columns(self, sample_results):
+        """Test summary CSV columns do not depend on the first result."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            exporter = ResultExporter(export_dir=Path(tmpdir))
+            
+            # First result has no performance data, the second does
+            results = [{"summary": {"submitted": 4, "processed": 4}}] + sample_results
+            csv_path = exporter.export_summary_csv(results)
+            
+            with open(csv_path, newline='') as csvfile:
+                reader = csv.DictReader(csvfile)
+                rows = list(reader)
+                
+                assert tuple(reader.fieldnames) == SUMMARY_FIELDS
+                assert len(rows) == len(results)
+                assert rows[0]['total_time_seconds'] == ''
+                assert rows[1]['total_time_seconds'] == '1.5'
+    
     def test_export_errors_csv(self, sample_errors):
         """Test exporting errors to CSV."""
         with tempfile.TemporaryDirectory() as tmpdir:
@@ -0,0 +1,43 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Tests for the internal JSON helpers.
+"""
+
+import json
+
+import pytest
+
+from sendDetections import _json
+
+
+@pytest.fixture(params=[True, False], ids=["orjson", "json"])
+def backend(request, monkeypatch):
+    """Run a test with orjson, when installed, and with the json fallback."""
+    if request.param and not _json.ORJSON_AVAILABLE:
+        pytest.skip("orjson not installed")
+    monkeypatch.setattr(_json, "ORJSON_AVAILABLE", request.param)
+
+
+def test_dumps_round_trip(backend):
+    """Test dumps output is UTF-8 bytes that loads reads back."""
+    data = {"name": "café", "values": [1, 2.5, None, True]}
+    
+    encoded = _json.dumps(data)
+    
+    assert isinstance(encoded, bytes)
+    assert "café" in encoded.decode("utf-8")
+    assert _json.loads(encoded) == data
+    assert _json.loads(encoded.decode("utf-8")) == data
+
+
+def test_dumps_indent(backend):
+    """Test indented output uses two spaces."""
+    assert _json.dumps({"a": 1}, indent=True) == b'{\n  "a": 1\n}'
+
+
+def test_loads_invalid(backend):
+    """Test invalid input raises json.JSONDecodeError on either backend."""
+    with pytest.raises(json.JSONDecodeError):
+        _json.loads(b"{not json")
@@ -81,7 +81,8 @@ class ConnectionMock:
     # JSON parsing error
     (
         {"status_code": 200, "error_on_json": True},
-        {"result": "error", "error_type": ApiError, "message_contains": "Unexpected error"}
+        {"result": "error", "error_type": ApiError, "message_contains": "Unexpected error",
+         "status_code": None}
     ),
     # 401 Unauthorized
     (
@@ -126,6 +127,8 @@ def test_api_client_response_handling(monkeypatch, mock_config, expected_outcome
         with pytest.raises(expected_outcome["error_type"]) as excinfo:
             api_client.send_data(payload)
         assert expected_outcome["message_contains"] in str(excinfo.value)
+        if "status_code" in expected_outcome:
+            assert excinfo.value.status_code == expected_outcome["status_code"]
 
 # Test various combination of command-line options
 @pytest.mark.parametrize("options,expected_output", [
@@ -23,7 +23,8 @@ from sendDetections.performance import (
     timed_function,
     async_timed_function,
     process_with_progress,
-    process_in_batches
+    process_in_batches,
+    _progress_options
 )
 
 
@@ -103,8 +104,27 @@ class TestPerformanceMetrics:
         metrics.end()
         
         assert len(metrics.batch_sizes) == 3
-        assert metrics.batch_sizes == [100, 150, 200]
-        assert metrics.optimal_batch_size == 150  # Average of batch sizes
+        assert metrics.batch_sizes.tolist() == [100, 150, 200]
+        # 200 entities in 0.7s is the highest throughput of the three
+        assert metrics.optimal_batch_size == 200
+        assert [size for size, _ in metrics.throughput_curve()] == [100, 150, 200]
+    
+    def test_optimal_batch_size_prefers_throughput(self):
+        """Test the optimal batch size is the fastest size, not the largest or average."""
+        metrics = PerformanceMetrics()
+        
+        metrics.record_api_call(0.5, True, batch_size=100)   # 200 entities/s
+        metrics.record_api_call(0.4, True, batch_size=150)   # 375 entities/s
+        metrics.record_api_call(2.0, True, batch_size=200)   # 100 entities/s
+        metrics.record_api_call(0.1, False, batch_size=200)  # Failed, not timed
+        
+        metrics.start()
+        metrics.end()
+        
+        assert metrics.optimal_batch_size == 150
+        assert metrics.get_summary()["batching"]["throughput_curve"] == [
+            (100, 200.0), (150, 375.0), (200, 100.0)
+        ]
     
     def test_record_entities(self):
         """Test recording processed entities count."""
@@ -177,6 +197,8 @@ class TestTimingUtilities:
         assert "end_time" in result
         assert "duration" in result
         assert result["duration"] >= 0.01
+        assert isinstance(result["duration_ns"], int)
+        assert result["duration_ns"] >= 10_000_000
     
     @pytest.mark.asyncio
     async def test_async_measure_time(self):
@@ -239,7 +261,45 @@ async def test_process_with_progress():
     )
     
     assert len(results) == 5
-    assert sorted(results) == [2, 4, 6, 8, 10]
+    # Results keep the input order regardless of completion order
+    assert results == [2, 4, 6, 8, 10]
+
+
+@pytest.mark.asyncio
+async def test_process_with_progress_shared_session():
+    """Test a shared session is passed to every call and closed afterwards."""
+    sessions = []
+    
+    async def process_item(item, session):
+        sessions.append(session)
+        return item
+    
+    results = await process_with_progress(
+        [1, 2, 3], process_item, leave=False, share_session=True
+    )
+    
+    assert results == [1, 2, 3]
+    assert len(set(map(id, sessions))) == 1
+    assert sessions[0].closed
+
+
+@pytest.mark.asyncio
+async def test_process_with_progress_counts_entities():
+    """Test the progress bar advances by batch length when counting entities."""
+    batches = [[1, 2, 3], [4, 5], [6]]
+    updates = []
+    
+    async def process_batch(batch):
+        return sum(batch)
+    
+    with patch("tqdm.tqdm.update", autospec=True,
+               side_effect=lambda bar, n=1: updates.append(n)):
+        results = await process_with_progress(
+            batches, process_batch, leave=False, count_entities=True
+        )
+    
+    assert results == [6, 9, 6]
+    assert sorted(updates) == [1, 2, 3]
 
 
 @pytest.mark.asyncio
@@ -261,4 +321,13 @@ async def test_process_in_batches():
     )
     
     assert len(results) == 10
-    assert results == [2, 4, 6, 8, 10, 12, 14, 16, 18, 20]
\ No newline at end of file
+    assert results == [2, 4, 6, 8, 10, 12, 14, 16, 18, 20]
+
+
+def test_progress_options_small_total():
+    """Test short runs still get a progress bar; tqdm only hides it off a terminal."""
+    options = _progress_options(3, refresh_rate=0.5)
+    
+    assert options["disable"] is None
+    assert options["miniters"] == 1
+    assert options["mininterval"] == 0.5
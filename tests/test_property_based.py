@@ -20,8 +20,9 @@ detection_types = st.sampled_from(["correlation", "playbook", "detection_rule",
 detection_subtypes = st.sampled_from(["sigma", "yara", "snort"])
 
 # Strategy for RFC 3339 timestamps
+# (isoformat zero-pads years below 1000, which strftime("%Y") does not on glibc)
 rfc3339_timestamps = st.datetimes().map(
-    lambda dt: dt.strftime("%Y-%m-%dT%H:%M:%SZ")
+    lambda dt: dt.isoformat(timespec="seconds") + "Z"
 )
 
 # Strategy for IP addresses (simplified)
@@ -6,10 +6,12 @@ Tests schema validation for Recorded Future API payloads.
 import json
 from typing import Any, Dict, Optional
 import pytest
+from unittest.mock import patch
 from pydantic import ValidationError
 
 from sendDetections.validators import (
     validate_payload,
+    validate_entries,
     ApiPayload,
     DataEntry,
     IoC,
@@ -17,6 +19,7 @@ from sendDetections.validators import (
     Incident,
     ApiOptions
 )
+from sendDetections.validators_fast import validate_parsed_fast, validate_payload_fast
 
 
 class TestIoCModel:
@@ -137,6 +140,50 @@ class TestDataEntryModel:
         
         error_msg = str(excinfo.value)
         assert "Timestamp must be in ISO 8601 format" in error_msg
+    
+    def test_out_of_range_timestamp(self):
+        """Test DataEntry with a well-shaped but impossible timestamp."""
+        entry_data = {
+            "ioc": {"type": "ip", "value": "1.2.3.4"},
+            "detection": {"type": "correlation"},
+            "timestamp": "2023-13-45T25:61:00Z"  # Month, day and time out of range
+        }
+        
+        with pytest.raises(ValidationError) as excinfo:
+            DataEntry(**entry_data)
+        
+        assert "Timestamp must be in ISO 8601 format" in str(excinfo.value)
+    
+    @pytest.mark.parametrize("timestamp", [
+        "2023-01-01T00:00:00Z",
+        "2023-01-01T00:00:00.1Z",
+        "2023-01-01T00:00:00.123456Z",
+        "2023-01-01T00:00:00.123456789Z",
+    ])
+    def test_fractional_seconds_timestamp(self, timestamp):
+        """Test UTC timestamps with 0 to 9 fraction digits are accepted on every Python."""
+        entry = DataEntry(
+            ioc={"type": "ip", "value": "1.2.3.4"},
+            detection={"type": "correlation"},
+            timestamp=timestamp
+        )
+        assert entry.timestamp == timestamp
+    
+    @pytest.mark.parametrize("timestamp", [
+        "20230101T000000Z",  # Basic format
+        "2023-01-01T00:00:00.Z",
+        "2023-01-01T00:00:00.1234567890Z",
+        "2023-01-01T00:00:00+00:00",
+        "2023-01-01T00:00Z",
+    ])
+    def test_rejected_timestamp_formats(self, timestamp):
+        """Test formats outside the pinned grammar are rejected on every Python."""
+        with pytest.raises(ValidationError, match="Timestamp must be in ISO 8601 format"):
+            DataEntry(
+                ioc={"type": "ip", "value": "1.2.3.4"},
+                detection={"type": "correlation"},
+                timestamp=timestamp
+            )
 
 
 class TestApiPayloadModel:
@@ -278,4 +325,120 @@ class TestValidatePayloadFunction:
     
     # Note: We're skipping the test for the "unknown validation error" case
     # where a ValidationError is raised but error.errors() returns an empty list,
-    # as this is extremely rare and difficult to mock properly.
\ No newline at end of file
+    # as this is extremely rare and difficult to mock properly.
+
+
+class TestValidatePayloadFast:
+    """Tests for the raw-JSON fast validation path."""
+
+    def test_agrees_with_validate_payload(self):
+        """Fast and Pydantic validation return the same result."""
+        payloads = [
+            {"data": [{"ioc": {"type": "ip", "value": "1.2.3.4"},
+                       "detection": {"type": "correlation"},
+                       "timestamp": "2023-01-01T00:00:00Z"}]},
+            {"data": [{"ioc": {"type": "bogus", "value": "x"},
+                       "detection": {"type": "correlation"}}]},
+            {"data": [{"ioc": {"type": "ip", "value": "1.2.3.4"},
+                       "detection": {"type": "detection_rule"}}]},
+            {"data": []},
+        ]
+        for payload in payloads:
+            raw = json.dumps(payload).encode("utf-8")
+            assert validate_payload_fast(raw) == validate_payload(payload)
+
+    def test_invalid_json(self):
+        """Malformed JSON is reported rather than raised."""
+        error = validate_payload_fast(b'{"data": [')
+        assert error is not None
+        assert error.startswith("Invalid JSON")
+
+    def test_lax_coercion_matches_pydantic(self):
+        """Payloads only Pydantic's lax mode accepts are still accepted."""
+        payload = {"data": [{"ioc": {"type": "ip", "value": "1.2.3.4"},
+                             "detection": {"type": "correlation"}}],
+                   "options": {"debug": "true", "summary": 1}}
+        assert validate_payload(payload) is None
+        assert validate_payload_fast(json.dumps(payload)) is None
+
+
+class TestValidatePayloadFastMsgspec:
+    """Tests that exercise the msgspec decoder itself."""
+
+    @pytest.fixture(autouse=True)
+    def _require_msgspec(self):
+        pytest.importorskip("msgspec")
+
+    @staticmethod
+    def _raw(payload):
+        return json.dumps(payload).encode("utf-8")
+
+    def test_valid_payload_skips_pydantic(self):
+        """A payload msgspec accepts is not re-validated with Pydantic."""
+        raw = self._raw({"data": [{"ioc": {"type": "domain", "value": "example.com"},
+                                   "detection": {"type": "detector_custom"},
+                                   "timestamp": "2023-01-01T00:00:00Z"}]})
+        with patch("sendDetections.validators_fast.validate_payload") as mock_validate:
+            assert validate_payload_fast(raw) is None
+        mock_validate.assert_not_called()
+
+    def test_rejected_payload_uses_pydantic_result(self):
+        """Payloads msgspec rejects get Pydantic's verdict and message."""
+        payloads = [
+            {"data": [{"ioc": {"type": "ip", "value": ""},
+                       "detection": {"type": "correlation"}}]},
+            {"data": [{"ioc": {"type": "ip", "value": "1.2.3.4"},
+                       "detection": {"type": "sandbox"},
+                       "timestamp": "2023-01-01 00:00:00"}]},
+            {"data": [{"ioc": {"type": "ip", "value": "1.2.3.4"},
+                       "detection": {"type": "correlation"}}],
+             "options": {"debug": "true"}},
+        ]
+        for payload in payloads:
+            with patch("sendDetections.validators_fast.validate_payload",
+                       wraps=validate_payload) as mock_validate:
+                assert validate_payload_fast(self._raw(payload)) == validate_payload(payload)
+            mock_validate.assert_called_once()
+
+    def test_parsed_payload_skips_pydantic(self):
+        """An already decoded payload msgspec accepts is not re-validated."""
+        payload = {"data": [{"ioc": {"type": "domain", "value": "example.com"},
+                             "detection": {"type": "detector_custom"},
+                             "timestamp": "2023-01-01T00:00:00Z"}]}
+        with patch("sendDetections.validators_fast.validate_payload") as mock_validate:
+            assert validate_parsed_fast(payload) is None
+        mock_validate.assert_not_called()
+
+    def test_parsed_payload_rejected_uses_pydantic_result(self):
+        """Decoded payloads msgspec rejects get Pydantic's verdict, without decoding again."""
+        payloads = [
+            {"data": [{"ioc": {"type": "ip", "value": "1.2.3.4"},
+                       "detection": {"type": "detection_rule"}}]},
+            {"data": [{"ioc": {"type": "ip", "value": "1.2.3.4"},
+                       "detection": {"type": "correlation"}}],
+             "options": {"debug": "true", "summary": 1}},
+            {"data": []},
+        ]
+        for payload in payloads:
+            with patch("sendDetections.validators_fast.validate_payload",
+                       wraps=validate_payload) as mock_validate:
+                assert validate_parsed_fast(payload) == validate_payload(payload)
+            mock_validate.assert_called_once_with(payload)
+
+
+class TestValidateEntries:
+    """Tests for validating a chunk of a payload's data entries."""
+
+    def test_reports_error_at_payload_index(self):
+        """Errors are located relative to the full payload."""
+        data = [
+            {"ioc": {"type": "ip", "value": f"10.0.0.{i}"},
+             "detection": {"type": "correlation"}}
+            for i in range(3)
+        ]
+        data[2]["ioc"]["type"] = "bogus"
+
+        assert validate_entries(data[:2], 0) is None
+        error = validate_entries(data[1:], 1)
+        assert error == validate_payload({"data": data})
+        assert "'data.2.ioc'" in error